@@ -1,48 +1,530 @@
-import json
 import os
+import sys
 import copy
+import functools
+import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ac7ca import cli
+from ac7ca.conversion import (
+    DEFAULT_CONVERSION_TIMEOUT_S, OperationCancelled, asset_digest, config_digest, config_stamp,
+    convert_to_uasset, load_document, open_conversion_cache
+)
+from ac7ca.curves import (
+    CAPABILITY_ROWS, CURVE_LINE_LABELS, CURVE_PREFIXES, CurveModel, DEFAULT_CORNER_BAND,
+    INTERPOLATION_MODES, curve_model_capabilities
+)
+from ac7ca.documents import (
+    CONFIG_FILE, DEFAULT_ENGINE_VERSION, JsonSource, NameIndex, PLANE_CONFIG_PREFIX, VECTOR_AXES,
+    ensure_name_in_namemap, enum_label, extract_parameters, get_table_values, json_dumps,
+    parse_entry, read_config, reid_document, reid_target_path, remove_config_files, replace_json,
+    set_entry_value, write_config, write_json, write_json_text
+)
+from ac7ca.journal import EditJournal
+from ac7ca.native import NativeAssetError, write_file_pair
+from ac7ca.profiling import PROFILER, profiled
+from ac7ca.validation import (
+    SEVERITY_COLORS, VALIDATION_DELAY_MS, VALIDATION_SEVERITIES, Validator, count_severities,
+    read_validation_rules
+)
+
+DEFAULT_UPDATE_LATENCY_MS = 16   # one frame at 60 fps
+DEFAULT_UNDO_MAX_MB = 32
+
+
+# =====================================================
+# Background Tasks
+# =====================================================
+
+class TaskRunner:
+    # Runs one blocking job at a time on a worker thread. Completion is
+    # picked up on the Tk thread by polling with root.after, so callbacks
+    # may touch widgets. A job is called as job(cancel_event).
+
+    def __init__(self, root, on_state=None, poll_ms=50):
+        self.root = root
+        self.on_state = on_state    # on_state(state, label, elapsed)
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.current = None
+
+    @property
+    def busy(self):
+        return self.current is not None
+
+    def start(self, label, job, on_done=None, on_error=None, timeout=None):
+        if self.busy:
+            return False
+        cancel_event = threading.Event()
+        self.current = {
+            "label": label,
+            "future": self.executor.submit(job, cancel_event),
+            "cancel": cancel_event,
+            "on_done": on_done,
+            "on_error": on_error,
+            "started": time.monotonic(),
+            "timeout": timeout,
+            "timed_out": False
+        }
+        self.notify("running")
+        self.root.after(self.poll_ms, self.poll)
+        return True
+
+    def cancel(self):
+        if self.current is not None:
+            self.current["cancel"].set()
+            self.notify("cancelling")
+
+    def elapsed(self):
+        return time.monotonic() - self.current["started"]
+
+    def poll(self):
+        task = self.current
+        if task is None:
+            return
+        if not task["future"].done():
+            timeout = task["timeout"]
+            if timeout and self.elapsed() > timeout and not task["timed_out"]:
+                task["timed_out"] = True
+                task["cancel"].set()
+            if timeout and self.elapsed() > timeout + 5:
+                # The job ignores cancellation: abandon it on its own thread
+                self.executor.shutdown(wait=False)
+                self.executor = ThreadPoolExecutor(max_workers=1)
+                self.finish(task, None, TimeoutError(f"{task['label']} timed out"))
+                return
+            self.notify("cancelling" if task["cancel"].is_set() else "running")
+            self.root.after(self.poll_ms, self.poll)
+            return
+        try:
+            result = task["future"].result()
+        except Exception as e:
+            if task["timed_out"]:
+                e = TimeoutError(f"{task['label']} timed out after {task['timeout']} s")
+            self.finish(task, None, e)
+            return
+        self.finish(task, result, None)
+
+    def finish(self, task, result, error):
+        self.notify("cancelled" if isinstance(error, OperationCancelled) else
+                    "failed" if error else "done")
+        self.current = None
+        if error is None:
+            if task["on_done"]:
+                task["on_done"](result)
+        elif task["on_error"]:
+            task["on_error"](error)
+
+    def notify(self, state):
+        if self.on_state and self.current is not None:
+            self.on_state(state, self.current["label"], self.elapsed())
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
+
+
+# =====================================================
+# Update Scheduler
+# =====================================================
+
+class UpdateScheduler:
+    # Coalesces bursts of request() calls into a single callback run,
+    # at most latency_ms after the first request of the burst.
+
+    def __init__(self, root, callback, latency_ms=DEFAULT_UPDATE_LATENCY_MS):
+        self.root = root
+        self.callback = callback
+        self.latency_ms = latency_ms
+        self.after_id = None
+        self.requested = 0
+        self.merged = 0
+        self.executed = 0
+
+    def request(self):
+        self.requested += 1
+        if self.after_id is not None:
+            self.merged += 1
+            return
+        self.after_id = self.root.after(self.latency_ms, self.run)
+
+    def run(self):
+        self.after_id = None
+        self.executed += 1
+        self.callback()
+
+    def flush(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.run()
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "merged": self.merged,
+            "executed": self.executed
+        }
+
+
+# =====================================================
+# File Watcher
+# =====================================================
+# Opt-in polling of the open config for edits made by other tools. The
+# thread only stats and hashes files; the editor picks changes up on the
+# Tk thread and merges them itself.
+
+DEFAULT_WATCH_INTERVAL_MS = 1000
+
+
+class FileWatcher:
+    # Compares (mtime, size) every interval and hashes the file only when
+    # they move, so a touch without new content is not a change.
+
+    def __init__(self, interval_s=1.0, engine_version=DEFAULT_ENGINE_VERSION):
+        self.interval_s = interval_s
+        self.engine_version = engine_version
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.path = None
+        self.stamp = None
+        self.digest = None    # None until the first poll takes the baseline
+        self.pending = False
+        self.thread = threading.Thread(target=self.run, name="file watcher", daemon=True)
+        self.thread.start()
+
+    def watch(self, path):
+        # Starts over on path (None pauses); its current contents are the baseline
+        with self.lock:
+            self.path = path
+            self.stamp = None
+            self.digest = None
+            self.pending = False
+
+    def rebase(self):
+        # Called after the editor wrote the file itself
+        with self.lock:
+            path = self.path
+        if path is None:
+            return
+        try:
+            stamp, digest = config_stamp(path), config_digest(path, self.engine_version)
+        except OSError:
+            stamp, digest = None, None
+        with self.lock:
+            if self.path == path:
+                self.stamp, self.digest, self.pending = stamp, digest, False
+
+    def take_change(self):
+        with self.lock:
+            pending, self.pending = self.pending, False
+        return pending
+
+    def run(self):
+        while not self.stopped.wait(self.interval_s):
+            with self.lock:
+                path, stamp = self.path, self.stamp
+            if path is None:
+                continue
+            try:
+                new_stamp = config_stamp(path)
+                if new_stamp == stamp:
+                    continue
+                digest = config_digest(path, self.engine_version)
+            except OSError:
+                continue   # being replaced or removed; look again next time
+            with self.lock:
+                if self.path != path:
+                    continue
+                self.stamp = new_stamp
+                if self.digest is not None and digest != self.digest:
+                    self.pending = True
+                self.digest = digest
+
+    def stop(self):
+        self.stopped.set()
+
+
+def table_layout(data):
+    # data without its NameMap and with every Table Data entry reduced to
+    # (type, name): documents with equal layouts differ only in values
+    export = dict(data["Exports"][0])
+    table = dict(export["Table"])
+    rows = list(table["Data"])
+    row = dict(rows[0])
+    row["Value"] = [(entry.get("$type"), entry["Name"]) for entry in row["Value"]]
+    rows[0] = row
+    table["Data"] = rows
+    export["Table"] = table
+    layout = {key: value for key, value in data.items() if key != "NameMap"}
+    layout["Exports"] = [export] + data["Exports"][1:]
+    return layout
+
+
+# =====================================================
+# Matplotlib
+# =====================================================
+# matplotlib is only imported once a figure is needed, so the window (and
+# the headless commands) start without paying for it. run_gui warms it up
+# on a background thread right after the window appears.
+
+@functools.lru_cache(maxsize=None)
+def import_matplotlib():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return Figure, FigureCanvasTkAgg
+
+
+def warm_up_matplotlib():
+    def warm_up():
+        Figure, _ = import_matplotlib()
+        # One offscreen Agg render loads the fonts the first real draw needs
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        figure = Figure(figsize=(2, 2))
+        figure.subplots().set_title("warm-up")
+        FigureCanvasAgg(figure).draw()
+
+    threading.Thread(target=warm_up, name="matplotlib warm-up", daemon=True).start()
+
+
+# =====================================================
+# Inspector Rows
+# =====================================================
+# Rows are pooled per category and rebound to other parameters on reload
+# or filtering instead of being destroyed and recreated.
+
+class InspectorRow:
+
+    def __init__(self, parent, row, on_edit):
+        self.name = None
+        self.kind = None
+        self.on_edit = on_edit
+        self.label = tk.Label(parent, anchor="w")
+        self.label.grid(row=row, column=0, sticky="ew", padx=5, pady=3)
+        self.value_frame = tk.Frame(parent)
+        self.value_frame.grid(row=row, column=1, sticky="ew")
+        self.entry = None
+        self.axes = None
+        self.combo = None
+        self.label_fg = self.label.cget("fg")
+
+    def edited(self, event=None):
+        self.on_edit(event, self.name)
+
+    def widgets(self):
+        if self.kind == "vector":
+            return list(self.axes.values())
+        elif self.kind == "enum":
+            return [self.combo]
+        elif self.kind == "value":
+            return [self.entry]
+        return []
+
+    def set_kind(self, kind):
+        # Value widgets are only created the first time a row needs them
+        if kind == self.kind:
+            return
+        for w in self.widgets():
+            w.pack_forget()
+        self.kind = kind
+        if kind == "vector":
+            if self.axes is None:
+                self.axes = {}
+                for axis in VECTOR_AXES:
+                    e = tk.Entry(self.value_frame, width=7, justify="center")
+                    e.bind("<KeyRelease>", self.edited)
+                    self.axes[axis] = e
+            for e in self.axes.values():
+                e.pack(side="left", fill="x", expand=True)
+        elif kind == "enum":
+            if self.combo is None:
+                self.combo = ttk.Combobox(self.value_frame, state="readonly")
+                self.combo.bind("<<ComboboxSelected>>", self.edited)
+                self.combo.bind("<KeyRelease>", self.edited)
+            self.combo.pack(side="left", fill="x", expand=True)
+        else:
+            if self.entry is None:
+                self.entry = tk.Entry(self.value_frame, width=12, justify="center")
+                self.entry.bind("<KeyRelease>", self.edited)
+            self.entry.pack(side="left", fill="x", expand=True)
+
+    def bind(self, name, value, enum_labels=None, selected=None):
+        # Returns the widget (or {axis: widget}) now showing this parameter
+        self.name = name
+        self.label.config(text=name)
+        if isinstance(value, dict):
+            self.set_kind("vector")
+            for axis, e in self.axes.items():
+                e.delete(0, tk.END)
+                e.insert(0, value[axis])
+            return self.axes
+        elif enum_labels is not None:
+            # No known values for the type: the combobox takes free text
+            self.set_kind("enum")
+            self.combo.config(values=enum_labels, state="readonly" if enum_labels else "normal")
+            self.combo.set(selected)
+            return self.combo
+        self.set_kind("value")
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, value)
+        return self.entry
+
+    def flag(self, issues):
+        # Colour the name by the worst validation issue, if any
+        color = self.label_fg
+        for severity in reversed(VALIDATION_SEVERITIES):
+            if any(issue["severity"] == severity for issue in issues or ()):
+                color = SEVERITY_COLORS[severity]
+        self.label.config(fg=color)
+
+    def set_locked(self, locked):
+        for w in self.widgets():
+            if isinstance(w, ttk.Combobox):
+                w.config(state="disabled" if locked else "readonly")
+            else:
+                w.config(state="disabled" if locked else "normal")
+
+    def show(self):
+        self.label.grid()
+        self.value_frame.grid()
+
+    def hide(self):
+        self.label.grid_remove()
+        self.value_frame.grid_remove()
+
+
+class InspectorCategory:
+    ROW_BATCH = 30   # rows materialized per step while scrolling
+
+    def __init__(self, parent, title, on_toggle):
+        self.title = title
+        self.names = []
+        self.lowered = []
+        self.visible_names = []
+        self.rows = []
+        self.shown = 0
+        self.expanded = True
+        self.outer = tk.Frame(parent, bd=1, relief="solid")
+        self.outer.pack(fill="x", pady=6, padx=6)
+        self.header = tk.Label(
+            self.outer,
+            text=title,
+            bg="#2b2b2b",
+            fg="white",
+            anchor="w",
+            padx=6,
+            pady=4
+        )
+        self.header.pack(fill="x")
+        self.content = tk.Frame(self.outer)
+        self.content.pack(fill="x", padx=8, pady=6)
+        self.content.grid_columnconfigure(1, weight=1)
+        self.on_toggle = on_toggle
+        self.header.bind("<Button-1>", self.toggle)
+
+    def toggle(self, event=None):
+        self.expanded = not self.expanded
+        if self.expanded:
+            self.content.pack(fill="x", padx=8, pady=6)
+        else:
+            self.content.pack_forget()
+        self.on_toggle()
+
+    def set_names(self, names):
+        self.names = names
+        self.lowered = [name.lower() for name in names]
+
+    def filter(self, text):
+        # Substring match on the lowered names; the rows are rebound lazily
+        if text:
+            self.visible_names = [
+                name for name, low in zip(self.names, self.lowered) if text in low
+            ]
+            self.header.config(text=f"{self.title} ({len(self.visible_names)}/{len(self.names)})")
+        else:
+            self.visible_names = self.names
+            self.header.config(text=f"{self.title} ({len(self.names)})")
+        for row in self.rows[:self.shown]:
+            row.hide()
+        self.shown = 0
+
+    def content_bottom(self):
+        # y of the last shown row inside the scrollable frame
+        return self.outer.winfo_y() + self.content.winfo_y() + self.content.winfo_height()
+
 
-CONFIG_FILE = "config.json"
 class PlaneConfigEditor:
 
     def __init__(self, root):
         self.root = root
         self.root.title("PlayerPlaneConfig Editor")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.file_path = None
-        self.original_data = None
         self.data = None
         self.parameters = {}
         self.param_widgets = {}
+        self.entry_index = {}
+        self.curves = None
+        self.issues = {}   # parameter name → validation issues
+        self.issue_cursor = 0
+        self.validation_pending = None
+        self.dirty_params = set()
+        self.synced_params = set()   # dragged points whose widget text is stale
         self.dragging_point = None
+        self.editing_locked = False
         self.create_ui()
         self.line_map = {}   # maps matplotlib line → (type, index, axis)
-        self.engine_version = "VER_UE4_18"
+        self.graph_lines = {}
+        self.graph_built_shape = None
+        self.drag_background = None
+        self.engine_version = DEFAULT_ENGINE_VERSION
         self.mappings_name = None
         self.temp_json_path = None
         self.uasset_path = None
+        self.native_asset = None
+        self.json_source = None
+        self.watcher = None
         self.uassetgui_path = None
+        self.update_scheduler = UpdateScheduler(self.root, self.process_pending_updates)
+        self.tasks = TaskRunner(self.root, self.on_task_state)
+        self.journal = EditJournal(DEFAULT_UNDO_MAX_MB * 1024 * 1024)
+        self.drag_changes = {}
         self.load_config()
-        self.fixed_enums = {
-            "DriftPostStallManeuverability": {
-                "Kulbit": "EDriftPostStallManeuverability::Kulbit",
-                "Cobra": "EDriftPostStallManeuverability::Cobra",
-                "None": "EDriftPostStallManeuverability::None"
-            }
-        }
+        self.enum_types = {}
+        self.name_index = NameIndex(None)
 
     def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-                self.uassetgui_path = config.get("uassetgui_path")
-        else:
-            self.uassetgui_path = None
+        self.config = read_config()
+        self.conversion_cache = open_conversion_cache(self.config)
+        self.uassetgui_path = self.config.get("uassetgui_path")
+        self.update_scheduler.latency_ms = self.config.get(
+            "update_latency_ms", DEFAULT_UPDATE_LATENCY_MS
+        )
+        self.conversion_timeout = self.config.get(
+            "conversion_timeout_s", DEFAULT_CONVERSION_TIMEOUT_S
+        )
+        self.journal.max_bytes = self.config.get("undo_max_mb", DEFAULT_UNDO_MAX_MB) * 1024 * 1024
+        if self.config.get("curve_interpolation") in INTERPOLATION_MODES:
+            self.capability_mode.set(self.config["curve_interpolation"])
+        self.corner_band = self.config.get("corner_band", DEFAULT_CORNER_BAND)
+        try:
+            self.validator = Validator(read_validation_rules(self.config))
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"validation_rules in {CONFIG_FILE} ignored: {e}", file=sys.stderr)
+            self.validator = Validator()
+        self.watch_interval_ms = self.config.get("watch_interval_ms", DEFAULT_WATCH_INTERVAL_MS)
+        self.set_watching(self.config.get("watch_files", False))
+        if self.config.get("profile"):
+            PROFILER.enabled = True
+        if PROFILER.enabled:
+            self.show_profile_readout()
         if self.uassetgui_path:
             self.uassetgui_label.config(
                 text=f"UAssetGUI: {os.path.dirname(self.uassetgui_path)}",
@@ -50,10 +532,9 @@ class PlaneConfigEditor:
             )
 
     def save_config(self):
-        with open(CONFIG_FILE, "w") as f:
-            json.dump({
-                "uassetgui_path": self.uassetgui_path
-            }, f, indent=2)
+        self.config["uassetgui_path"] = self.uassetgui_path
+        self.config["update_latency_ms"] = self.update_scheduler.latency_ms
+        write_config(self.config)
 
     def select_uassetgui(self):
         path = filedialog.askopenfilename(
@@ -84,9 +565,36 @@ class PlaneConfigEditor:
         tk.Button(top, text="Replace", command=self.replace_plane_id).pack(side="left")
         tk.Button(top, text="Save", command=self.save_file).pack(side="right")
         tk.Button(top, text="Revert", command=self.revert_changes).pack(side="right")
+        tk.Button(top, text="Redo", command=self.redo).pack(side="right")
+        tk.Button(top, text="Undo", command=self.undo).pack(side="right")
         tk.Button(top, text="Set UAssetGUI.exe", command=self.select_uassetgui).pack(side="left")
         self.uassetgui_label = tk.Label(top, text="UAssetGUI: Not Set", fg="gray")
         self.uassetgui_label.pack(side="left", padx=10)
+        self.watch_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            top, text="Watch file", variable=self.watch_var,
+            command=lambda: self.set_watching(self.watch_var.get(), save=True)
+        ).pack(side="left")
+        self.file_buttons = [
+            child for child in top.winfo_children() if isinstance(child, tk.Button)
+        ]
+        self.root.bind("<Control-z>", self.undo)
+        self.root.bind("<Control-y>", self.redo)
+        self.root.bind("<Control-Z>", self.redo)
+        # ---------------- Status Bar ----------------
+        status = tk.Frame(self.root)
+        status.pack(side="bottom", fill="x")
+        self.status_label = tk.Label(status, text="Ready", anchor="w")
+        self.status_label.pack(side="left", fill="x", expand=True, padx=6)
+        self.cancel_button = tk.Button(
+            status, text="Cancel", state="disabled", command=lambda: self.tasks.cancel()
+        )
+        self.cancel_button.pack(side="right")
+        self.progress = ttk.Progressbar(status, mode="indeterminate", length=120)
+        self.progress.pack(side="right", padx=6)
+        # Packed by show_profile_readout when profiling is enabled
+        self.profile_label = tk.Label(status, anchor="e", fg="gray")
+        self.trace_button = tk.Button(status, text="Save trace", command=self.save_profile_trace)
         # ---------------- Main Split Layout ----------------
         main_container = tk.PanedWindow(
             self.root,
@@ -99,22 +607,83 @@ class PlaneConfigEditor:
         right_frame = tk.Frame(main_container)
         main_container.add(left_frame, minsize=300)
         main_container.add(right_frame, minsize=400)
+        # ---------------- Filter ----------------
+        filter_bar = tk.Frame(left_frame)
+        filter_bar.pack(side="top", fill="x", padx=6, pady=(6, 0))
+        tk.Label(filter_bar, text="Filter").pack(side="left")
+        self.filter_var = tk.StringVar()
+        filter_entry = tk.Entry(filter_bar, textvariable=self.filter_var)
+        filter_entry.pack(side="left", fill="x", expand=True, padx=4)
+        filter_entry.bind("<KeyRelease>", lambda ev: self.refresh_inspector())
+        # Validation summary; clicking it filters to the next flagged parameter
+        self.problems_label = tk.Label(left_frame, text="", anchor="w", fg="gray", cursor="hand2")
+        self.problems_label.pack(side="top", fill="x", padx=6)
+        self.problems_label.bind("<Button-1>", self.next_problem)
         # ---------------- Scrollable Inspector ----------------
         canvas = tk.Canvas(left_frame)
         scrollbar = tk.Scrollbar(left_frame, orient="vertical", command=canvas.yview)
+        self.inspector_canvas = canvas
         self.scrollable_frame = tk.Frame(canvas)
         self.scrollable_frame.bind(
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_fill()
+
+        canvas.configure(yscrollcommand=on_scroll)
+        canvas.bind("<Configure>", lambda e: self.schedule_fill())
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        # Category shells are built once; their rows fill in on demand
+        self.fill_pending = None
+        self.categories = {
+            title: InspectorCategory(self.scrollable_frame, title, self.schedule_fill)
+            for title in ("Speed", "Rotation", "Drift", "Other")
+        }
         # ---------------- Graphs ----------------
-        self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(3, 1, figsize=(6, 8))
+        # The figure is created by ensure_figure on the first load
+        self.graph_frame = right_frame
+        self.fig = None
+        self.canvas = None
+        self.ax1 = self.ax2 = self.ax3 = None
+        # ---------------- Capabilities ----------------
+        # Packed first so the figure takes whatever space is left above it
+        capability_frame = tk.LabelFrame(right_frame, text="Capabilities")
+        capability_frame.pack(side="bottom", fill="x", padx=6, pady=4)
+        tk.Label(capability_frame, text="Interpolation").grid(row=0, column=0, sticky="w")
+        self.capability_mode = ttk.Combobox(
+            capability_frame, values=INTERPOLATION_MODES, state="readonly", width=8
+        )
+        self.capability_mode.set("linear")
+        self.capability_mode.grid(row=0, column=1, sticky="w")
+        self.capability_mode.bind("<<ComboboxSelected>>", lambda ev: self.set_capability_mode())
+        self.capability_labels = []
+        for i, (title, template) in enumerate(CAPABILITY_ROWS):
+            row, column = 1 + i // 2, (i % 2) * 2
+            tk.Label(capability_frame, text=title, fg="gray").grid(row=row, column=column, sticky="w", padx=(0, 6))
+            label = tk.Label(capability_frame, text="-", anchor="w", width=22)
+            label.grid(row=row, column=column + 1, sticky="w")
+            self.capability_labels.append(label)
+        self.graph_placeholder = tk.Label(
+            right_frame, text="Open a JSON/UASSET file to see its curves", fg="gray"
+        )
+        self.graph_placeholder.pack(fill="both", expand=True)
+
+    @profiled("ensure_figure")
+    def ensure_figure(self):
+        if self.fig is not None:
+            return
+        Figure, FigureCanvasTkAgg = import_matplotlib()
+        self.graph_placeholder.destroy()
+        self.fig = Figure(figsize=(6, 8))
+        self.ax1, self.ax2, self.ax3 = self.fig.subplots(3, 1)
         self.fig.tight_layout(pad=3)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
+        self.canvas.draw = profiled("canvas.draw")(self.canvas.draw)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
         # Enable dragging
         self.canvas.mpl_connect("pick_event", self.on_pick)
@@ -126,6 +695,8 @@ class PlaneConfigEditor:
     # =====================================================
 
     def load_file(self):
+        if self.tasks.busy:
+            return
         path = filedialog.askopenfilename(
             filetypes=[
                 ("Plane Files", "*.json *.uasset"),
@@ -135,127 +706,443 @@ class PlaneConfigEditor:
         )
         if not path:
             return
-        # ------------------------------------------
-        # If JSON → load normally
-        # ------------------------------------------
-        if path.endswith(".json"):
-            self.file_path = path
-            with open(path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-        # ------------------------------------------
-        # If UASSET → convert to JSON first
-        # ------------------------------------------
-        elif path.endswith(".uasset"):
-            if not self.uassetgui_path:
-                messagebox.showerror("Error", "Please set UAssetGUI.exe first.")
-                return
+        self.update_scheduler.cancel()
+        self.run_task(
+            f"Opening {os.path.basename(path)}",
+            self.document_reader(path),
+            lambda result: self.finish_load(path, *result),
+            error_title="Conversion Error"
+        )
+
+    def document_reader(self, path):
+        # Job returning (data, json_path, native_asset, json_source) for path
+        uassetgui_path = self.uassetgui_path
+        native = self.config.get("native_uasset", False)
+
+        def job(cancel_event):
+            # ------------------------------------------
+            # If JSON → load normally
+            # ------------------------------------------
+            if path.endswith(".json"):
+                source = JsonSource.read(path)
+                return source.parse(), path, None, source
+            # ------------------------------------------
+            # If UASSET → read natively or convert to JSON first
+            # ------------------------------------------
+            data, json_path, native_asset = load_document(
+                path, uassetgui_path, self.engine_version, self.conversion_cache,
+                native, self.conversion_timeout, cancel_event
+            )
+            if cancel_event.is_set():
+                if json_path:
+                    os.remove(json_path)
+                raise OperationCancelled("Open cancelled")
+            # Kept so saves only re-encode the edited part of the temp JSON
+            source = JsonSource.read(json_path) if json_path else None
+            return data, json_path, native_asset, source
+
+        return job
+
+    @profiled("finish_load")
+    def finish_load(self, path, data, json_path, native_asset, json_source):
+        self.cleanup_temp_json()
+        self.data = data
+        self.native_asset = native_asset
+        self.json_source = json_source
+        if path.endswith(".uasset"):
+            self.temp_json_path = json_path
+            self.file_path = json_path or path
             self.uasset_path = path
-            temp_json = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-            temp_json.close()
-            cmd = [
-                self.uassetgui_path,
-                "tojson",
-                path,
-                temp_json.name,
-                "VER_UE4_18"
-            ]
-            try:
-                subprocess.run(cmd, check=True)
-            except Exception as e:
-                messagebox.showerror("Conversion Error", str(e))
-                return
-            self.file_path = temp_json.name
-            with open(temp_json.name, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+        else:
+            self.file_path = path
+            self.uasset_path = None
         # ------------------------------------------
-        self.original_data = copy.deepcopy(self.data)
+        self.rebuild_document_view()
+
+    def rebuild_document_view(self):
+        # Everything derived from self.data, rebuilt after a load or a
+        # change that renames entries; starts a fresh journal
+        self.journal.reset()
         self.parameters = self.extract_all_parameters()
-        self.build_parameter_inspector()
         self.extract_graph_data()
-        self.update_graphs()
+        self.validate()
+        self.build_parameter_inspector()
+        self.ensure_figure()
+        self.build_graph_artists()
+        self.refresh_capabilities()
+        if self.watcher is not None:
+            self.watcher.watch(self.uasset_path or self.file_path)
 
     def save_file(self):
-        if not self.file_path:
+        if not self.file_path or self.tasks.busy:
             return
+        self.update_scheduler.flush()
         self.apply_changes_to_json()
-        # Always save JSON first
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
-        # If editing a .uasset, convert back
-        if self.uasset_path:
-            cmd = [
-                self.uassetgui_path,
-                "fromjson",
-                self.file_path,
-                self.uasset_path
-            ]
+        if self.validation_pending is not None:
+            self.root.after_cancel(self.validation_pending)
+            self.validate()
+        errors = [name for name, issues in self.issues.items()
+                  if any(issue["severity"] == "error" for issue in issues)]
+        if errors and not messagebox.askyesno(
+            "Validation",
+            f"{len(errors)} parameter(s) have errors, e.g. {errors[0]}: "
+            f"{self.issues[errors[0]][0]['message']}.\n\nSave anyway?"
+        ):
+            return
+
+        # The document is encoded here on the Tk thread; the worker only
+        # writes the snapshot, so edits flushed meanwhile cannot race it
+        saved = {key: self.current_value(key) for key in self.journal.baseline}
+        file_path = self.file_path
+        uasset_path = self.uasset_path
+        asset_bytes = None
+        text = sections = None
+        if self.native_asset is not None:
             try:
-                subprocess.run(cmd, check=True)
-                messagebox.showinfo("Saved", "UAsset saved successfully.")
-            except Exception as e:
+                asset_bytes = self.native_asset.serialize(self.data)
+            except NativeAssetError as e:
                 messagebox.showerror("Conversion Error", str(e))
+                return
+        elif self.json_source is not None:
+            text, sections = self.json_source.render(self.data)
         else:
-            messagebox.showinfo("Saved", "JSON saved successfully.")
+            text = json_dumps(self.data)
+
+        def job(cancel_event):
+            # Always save JSON first (unless the asset is written natively)
+            if text is not None:
+                write_json_text(text, file_path)
+            # If editing a .uasset, convert back
+            if uasset_path:
+                self.forget_cached_conversion(uasset_path)
+                if asset_bytes is not None:
+                    write_file_pair(uasset_path, *asset_bytes)
+                else:
+                    convert_to_uasset(
+                        self.uassetgui_path, file_path, uasset_path,
+                        self.conversion_timeout, cancel_event
+                    )
+
+        def done(result):
+            if text is not None:
+                self.json_source = JsonSource(text, sections)
+            if self.watcher is not None:
+                self.watcher.rebase()
+            self.journal.mark_saved(saved)
+            if uasset_path:
+                messagebox.showinfo("Saved", "UAsset saved successfully.")
+            else:
+                messagebox.showinfo("Saved", "JSON saved successfully.")
+
+        self.run_task("Saving", job, done, error_title="Conversion Error")
+
+    # =====================================================
+    # Background Tasks
+    # =====================================================
+
+    def run_task(self, label, job, on_done, error_title="Error"):
+        # Editing is locked until the job has finished, so the worker can
+        # read self.data without copying it.
+        def on_error(error):
+            if isinstance(error, OperationCancelled):
+                return
+            messagebox.showerror(error_title, str(error))
+        return self.tasks.start(label, job, on_done, on_error, self.conversion_timeout)
+
+    def on_task_state(self, state, label, elapsed):
+        if state in ("running", "cancelling"):
+            if not self.editing_locked:
+                self.set_editing_locked(True)
+                self.progress.start(15)
+            suffix = " (cancelling)" if state == "cancelling" else ""
+            self.status_label.config(text=f"{label}… {elapsed:.1f} s{suffix}")
+            return
+        self.set_editing_locked(False)
+        self.progress.stop()
+        self.status_label.config(text=f"{label}: {state} ({elapsed:.1f} s)")
+
+    def set_editing_locked(self, locked):
+        self.editing_locked = locked
+        self.cancel_button.config(state="normal" if locked else "disabled")
+        for button in self.file_buttons:
+            button.config(state="disabled" if locked else "normal")
+        for category in self.categories.values():
+            for row in category.rows:
+                row.set_locked(locked)
+
+    def forget_cached_conversion(self, uasset_path):
+        # Called before new bytes are written over an asset: its current
+        # digest will never match again, so drop that entry now.
+        if self.conversion_cache is not None and os.path.exists(uasset_path):
+            self.conversion_cache.discard(asset_digest(uasset_path, self.engine_version))
+
+    def cleanup_temp_json(self):
+        if self.temp_json_path and os.path.exists(self.temp_json_path):
+            os.remove(self.temp_json_path)
+        self.temp_json_path = None
+
+    def on_close(self):
+        if PROFILER.enabled and self.config.get("profile_trace"):
+            PROFILER.dump_chrome_trace(self.config["profile_trace"])
+        self.set_watching(False)
+        self.tasks.shutdown()
+        self.cleanup_temp_json()
+        self.root.destroy()
+
+    # =====================================================
+    # External Changes
+    # =====================================================
+
+    def set_watching(self, enabled, save=False):
+        self.watch_var.set(enabled)
+        if save:
+            self.config["watch_files"] = enabled
+            write_config(self.config)
+        if enabled and self.watcher is None:
+            self.watcher = FileWatcher(self.watch_interval_ms / 1000.0, self.engine_version)
+            if self.data is not None:
+                self.watcher.watch(self.uasset_path or self.file_path)
+            self.root.after(self.watch_interval_ms, self.poll_watcher)
+        elif not enabled and self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def poll_watcher(self):
+        if self.watcher is None:
+            return
+        self.root.after(self.watch_interval_ms, self.poll_watcher)
+        # A change seen during a save or drag is picked up once it is over
+        if self.tasks.busy or hasattr(self, "dragging_line") or not self.watcher.take_change():
+            return
+        path = self.uasset_path or self.file_path
+
+        def on_error(error):
+            # Often a file caught half-written; the next write is seen again
+            if not isinstance(error, OperationCancelled):
+                self.status_label.config(text=f"Reload of {os.path.basename(path)} failed: {error}")
+
+        self.tasks.start(
+            f"Reloading {os.path.basename(path)}",
+            self.document_reader(path),
+            lambda result: self.merge_from_disk(path, *result),
+            on_error,
+            self.conversion_timeout
+        )
+
+    def has_local_edits(self):
+        return any(
+            self.current_value(key) != self.journal.disk_value(key, None)
+            for key in self.journal.baseline
+        )
+
+    @profiled("merge_from_disk")
+    def merge_from_disk(self, path, data, json_path, native_asset, json_source):
+        # Three-way merge of the reloaded document into the open one: the
+        # journal knows what is on disk for every key edited here, so a
+        # key changed only on disk is taken over, one changed only here is
+        # kept, and one changed on both sides is a conflict.
+        if self.data is None or path != (self.uasset_path or self.file_path):
+            if json_path:
+                os.remove(json_path)
+            return
+        self.update_scheduler.flush()
+        if table_layout(data) != table_layout(self.data):
+            # Entries were added, removed or moved: positions no longer line up
+            if self.has_local_edits() and not messagebox.askyesno(
+                "File changed on disk",
+                f"{os.path.basename(path)} was restructured by another program.\n\n"
+                "Reload it and discard your unsaved edits?"
+            ):
+                if json_path:
+                    os.remove(json_path)
+                return
+            self.finish_load(path, data, json_path, native_asset, json_source)
+            self.status_label.config(text=f"Reloaded {os.path.basename(path)} from disk")
+            return
+        values = get_table_values(self.data)
+        remote = {
+            position: entry["Value"] for position, entry in enumerate(get_table_values(data))
+        }
+        taken = []
+        conflicts = []
+        for key, theirs in remote.items():
+            ours = values[key]["Value"]
+            if theirs == ours:
+                if key in self.journal.baseline:
+                    self.journal.on_disk[key] = copy.deepcopy(theirs)
+                continue
+            base = self.journal.disk_value(key, ours)
+            if theirs == base:
+                continue
+            (taken if ours == base else conflicts).append(key)
+        kept = 0
+        if conflicts:
+            names = [values[key]["Name"] for key in conflicts]
+            shown = ", ".join(names[:10]) + (f" and {len(names) - 10} more" if len(names) > 10 else "")
+            if messagebox.askyesno(
+                "Conflicting changes",
+                f"{len(names)} parameter(s) were changed both here and in "
+                f"{os.path.basename(path)}: {shown}.\n\n"
+                "Take the version on disk? (No keeps your edits)"
+            ):
+                taken += conflicts
+            else:
+                kept = len(conflicts)
+        # The reloaded file is the new base for saving
+        self.native_asset = native_asset
+        if json_path != self.file_path:
+            self.cleanup_temp_json()
+            self.temp_json_path = json_path
+            self.file_path = json_path or path
+        self.json_source = json_source
+        changes = {}
+        axes = set()
+        remote_names = data.get("NameMap")
+        if remote_names is not None and "NameMap" in self.data:
+            # A union, never a pick of one side: the file's names in its own
+            # order (the reloaded asset indexes them), then the names only
+            # known here, which local values may still reference
+            before = self.current_value("NameMap")
+            known = set(remote_names)
+            merged = list(remote_names) + [name for name in before if name not in known]
+            if merged != before:
+                self.data["NameMap"][:] = merged
+                self.name_index.rebuild()
+                EditJournal.note(changes, "NameMap", before, merged)
+        for key in taken:
+            before = self.current_value(key)
+            entry = values[key]
+            entry["Value"] = copy.deepcopy(remote[key])
+            name = entry["Name"]
+            if name in self.entry_index:
+                self.parameters[name] = parse_entry(entry, self.enum_types)
+                self.show_parameter(name)
+            axes |= self.update_curve_point(name)
+            EditJournal.note(changes, key, before, self.current_value(key))
+        self.journal.commit(changes, f"disk changes in {os.path.basename(path)}")
+        self.schedule_validation()
+        for key in set(taken) | set(conflicts):
+            self.journal.on_disk[key] = copy.deepcopy(remote[key])
+        if remote_names is not None and "NameMap" in self.journal.baseline:
+            self.journal.on_disk["NameMap"] = list(remote_names)
+        if axes:
+            self.update_graphs(axes)
+        self.status_label.config(
+            text=f"{len(taken)} change(s) merged from {os.path.basename(path)}"
+                 + (f", {kept} local edit(s) kept" if kept else "")
+        )
+
+    # =====================================================
+    # Profiling
+    # =====================================================
+
+    def show_profile_readout(self):
+        self.trace_button.pack(side="right")
+        self.profile_label.pack(side="right", padx=6)
+        self.refresh_profile_readout()
+
+    def refresh_profile_readout(self):
+        # last / p95 latency of the main spans and the drag update rate
+        parts = []
+        for name, label in (
+            ("apply_changes_to_json", "apply"),
+            ("update_graphs", "graphs"),
+            ("canvas.draw", "draw"),
+            ("on_drag", "drag")
+        ):
+            latency = PROFILER.latency(name)
+            if latency:
+                parts.append(f"{label} {latency[0]:.1f}/{latency[1]:.1f} ms")
+        fps = PROFILER.rate("on_drag")
+        if fps:
+            parts.append(f"{fps:.0f} drag fps")
+        self.profile_label.config(text=" · ".join(parts) or "profiling (last/p95)")
+        self.root.after(500, self.refresh_profile_readout)
+
+    def save_profile_trace(self):
+        path = filedialog.asksaveasfilename(
+            title="Save Chrome trace",
+            defaultextension=".json",
+            filetypes=[("Trace JSON", "*.json")]
+        )
+        if path:
+            count = PROFILER.dump_chrome_trace(path)
+            self.status_label.config(text=f"Trace saved: {count} events → {os.path.basename(path)}")
 
     def revert_changes(self):
-        if self.original_data:
-            self.data = copy.deepcopy(self.original_data)
-            self.parameters = self.extract_all_parameters()
-            self.build_parameter_inspector()
-            self.extract_graph_data()
-            self.update_graphs()
+        # Replays the load-time value of every entry the journal has seen,
+        # as one undoable step, instead of copying the whole document.
+        if self.tasks.busy or self.data is None:
+            return
+        self.update_scheduler.flush()
+        self.restore_step(self.journal.revert(self.current_value))
+
+    def undo(self, event=None):
+        if self.tasks.busy or self.data is None or hasattr(self, "dragging_line"):
+            return
+        self.update_scheduler.flush()
+        self.restore_step(self.journal.undo(), "Undid")
+
+    def redo(self, event=None):
+        if self.tasks.busy or self.data is None or hasattr(self, "dragging_line"):
+            return
+        self.update_scheduler.flush()
+        self.restore_step(self.journal.redo(), "Redid")
+
+    def current_value(self, key):
+        if key == "NameMap":
+            return list(self.data["NameMap"])
+        return copy.deepcopy(get_table_values(self.data)[key]["Value"])
+
+    def restore_step(self, result, verb=None):
+        if result is None:
+            return
+        label, values = result
+        table = get_table_values(self.data)
+        axes = set()
+        for key, value in values.items():
+            if key == "NameMap":
+                self.data["NameMap"][:] = value
+                self.name_index.rebuild()
+                continue
+            entry = table[key]
+            entry["Value"] = copy.deepcopy(value)
+            name = entry["Name"]
+            if name in self.entry_index:
+                self.parameters[name] = parse_entry(entry, self.enum_types)
+                self.show_parameter(name)
+            axes |= self.update_curve_point(name)
+        self.update_graphs(axes)
+        self.schedule_validation()
+        self.status_label.config(text=f"{verb} {label}" if verb else label)
 
     # =====================================================
     # Parameter Extraction
     # =====================================================
 
+    @profiled("extract_all_parameters")
     def extract_all_parameters(self):
-        parameters = {}
-        self.enum_types = {}   # store enum type info
-        values = self.data["Exports"][0]["Table"]["Data"][0]["Value"]
-        for entry in values:
-            name = entry["Name"]
-            value = entry["Value"]
-            entry_type = entry.get("$type", "")
-            # ---------------- ENUM ----------------
-            if "EnumPropertyData" in entry_type:
-                parameters[name] = value  # current enum value (string)
-                self.enum_types[name] = entry["EnumType"]
-            # ---------------- BOOL ----------------
-            elif isinstance(value, bool):
-                parameters[name] = value
-            # ---------------- NUMBER / STRING ----------------
-            elif isinstance(value, (int, float, str)):
-                try:
-                    parameters[name] = round(float(value), 3)
-                except:
-                    parameters[name] = value
-            # ---------------- VECTOR ----------------
-            elif isinstance(value, list):
-                vec = value[0]["Value"]
-                parameters[name] = {
-                    "X": round(float(vec["X"]), 3),
-                    "Y": round(float(vec["Y"]), 3),
-                    "Z": round(float(vec["Z"]), 3)
-                }
+        # enum_types stores enum type info, entry_index maps each parameter
+        # name → position in Table Data; name_index backs enum options and
+        # NameMap inserts
+        parameters, self.enum_types, self.entry_index = extract_parameters(self.data)
+        self.name_index = NameIndex(self.data.get("NameMap"))
         return parameters
 
     def get_enum_options(self, enum_type_name):
-        options = []
-        name_map = self.data.get("NameMap", [])
-        for name in name_map:
-            if name.startswith(enum_type_name + "::"):
-                options.append(name)
-        return options
+        return [f"{enum_type_name}::{value}" for value in self.name_index.enum_values(enum_type_name)]
 
     # =====================================================
     # Inspector with Collapsible Categories
     # =====================================================
 
+    @profiled("build_parameter_inspector")
     def build_parameter_inspector(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # Rebinds the pooled rows to the current parameters; only the rows
+        # that scroll into view are bound (or created) by fill_visible_rows.
         self.param_widgets = {}
+        self.dirty_params = set()
+        self.synced_params = set()
         categories = {
             "Speed": [],
             "Rotation": [],
@@ -272,197 +1159,347 @@ class PlaneConfigEditor:
             else:
                 categories["Other"].append(name)
         for cat, names in categories.items():
-            self.create_category(cat, names)
+            self.categories[cat].set_names(names)
+        self.show_filtered_rows()
 
-    def create_category(self, title, names):
-        outer = tk.Frame(self.scrollable_frame, bd=1, relief="solid")
-        outer.pack(fill="x", pady=6, padx=6)
-        header = tk.Label(
-            outer,
-            text=title,
-            bg="#2b2b2b",
-            fg="white",
-            anchor="w",
-            padx=6,
-            pady=4
-        )
-        header.pack(fill="x")
-        content = tk.Frame(outer)
-        content.pack(fill="x", padx=8, pady=6)
-        content.grid_columnconfigure(1, weight=1)
-        def toggle(event=None):
-            if content.winfo_ismapped():
-                content.pack_forget()
-            else:
-                content.pack(fill="x", padx=8, pady=6)
-        header.bind("<Button-1>", toggle)
-        for row, name in enumerate(names):
-            value = self.parameters[name]
-            lbl = tk.Label(content, text=name, anchor="w")
-            lbl.grid(row=row, column=0, sticky="ew", padx=5, pady=3)
-            value_frame = tk.Frame(content)
-            value_frame.grid(row=row, column=1, sticky="ew")
-            if isinstance(value, dict):
-                entries = {}
-                for axis in ["X", "Y", "Z"]:
-                    e = tk.Entry(value_frame, width=7, justify="center")
-                    e.insert(0, value[axis])
-                    e.pack(side="left", fill="x", expand=True,)
-                    e.bind("<KeyRelease>", self.live_update)
-                    entries[axis] = e
-                self.param_widgets[name] = entries
+    def refresh_inspector(self):
+        # Filter changed: finish pending edits before their rows are reused
+        self.update_scheduler.flush()
+        self.show_filtered_rows()
+
+    def show_filtered_rows(self):
+        text = self.filter_var.get().strip().lower()
+        self.param_widgets = {}
+        for category in self.categories.values():
+            category.filter(text)
+        self.inspector_canvas.yview_moveto(0)
+        self.schedule_fill()
+
+    def schedule_fill(self):
+        if self.fill_pending is None:
+            self.fill_pending = self.root.after_idle(self.fill_visible_rows)
+
+    @profiled("fill_visible_rows")
+    def fill_visible_rows(self):
+        # Show rows of expanded categories until they reach past the bottom
+        # of the visible area (plus one screen of preload).
+        self.fill_pending = None
+        canvas = self.inspector_canvas
+        height = canvas.winfo_height()
+        bottom = canvas.canvasy(height) + height
+        for category in self.categories.values():
+            if not category.expanded:
+                continue
+            while category.shown < len(category.visible_names):
+                self.scrollable_frame.update_idletasks()
+                if category.content_bottom() > bottom:
+                    break
+                self.show_rows(category, InspectorCategory.ROW_BATCH)
+
+    def show_rows(self, category, count):
+        end = min(category.shown + count, len(category.visible_names))
+        for index in range(category.shown, end):
+            name = category.visible_names[index]
+            if index < len(category.rows):
+                row = category.rows[index]
             else:
-                # -------- ENUM --------
-                if hasattr(self, "fixed_enums") and name in self.fixed_enums:
-                    enum_map = self.fixed_enums[name]
-                    combo = ttk.Combobox(
-                        value_frame,
-                        values=list(enum_map.keys()),
-                        state="readonly"
-                    )
-                    # Convert stored value → clean label
-                    reverse_map = {v: k for k, v in enum_map.items()}
-                    if value in reverse_map:
-                        combo.set(reverse_map[value])
-                    else:
-                        combo.set(list(enum_map.keys())[0])
-                    combo.pack(side="left", fill="x", expand=True)
-                    combo.bind("<<ComboboxSelected>>", self.live_update)
-                    self.param_widgets[name] = combo
-                # -------- NORMAL VALUE --------
-                else:
-                    e = tk.Entry(value_frame, width=12, justify="center")
-                    e.insert(0, value)
-                    e.pack(side="left", fill="x", expand=True)
-                    e.bind("<KeyRelease>", self.live_update)
-                    self.param_widgets[name] = e
+                row = InspectorRow(category.content, index, self.live_update)
+                category.rows.append(row)
+            self.param_widgets[name] = row.bind(name, self.parameters[name], *self.enum_labels(name))
+            row.flag(self.issues.get(name))
+            row.set_locked(self.editing_locked)
+            row.show()
+        category.shown = end
+
+    def enum_labels(self, name):
+        # (labels, selected label) for enum rows, (None, None) otherwise;
+        # a label is the stored value without its "Type::" prefix. Labels
+        # only come from the NameMap and are empty when it has none.
+        enum_type = self.enum_types.get(name)
+        if enum_type is None:
+            return None, None
+        labels = self.name_index.enum_values(enum_type)
+        selected = enum_label(self.parameters[name])
+        if labels and selected not in labels:
+            labels.append(selected)
+        return labels, selected
+
+    # =====================================================
+    # Validation
+    # =====================================================
+
+    def schedule_validation(self):
+        # Edits come in bursts; validate once they pause
+        if self.validation_pending is not None:
+            self.root.after_cancel(self.validation_pending)
+        self.validation_pending = self.root.after(VALIDATION_DELAY_MS, self.validate)
+
+    def validate(self):
+        self.validation_pending = None
+        if self.data is None:
+            return
+        self.issues = {}
+        for issue in self.validator.run(self.data, self.curves, self.name_index):
+            self.issues.setdefault(issue["name"], []).append(issue)
+        for category in self.categories.values():
+            for row in category.rows[:category.shown]:
+                row.flag(self.issues.get(row.name))
+        counts = count_severities(issue for issues in self.issues.values() for issue in issues)
+        if not self.issues:
+            self.problems_label.config(text="No problems found", fg="gray")
+            return
+        worst = "error" if counts["error"] else "warning"
+        self.problems_label.config(
+            text=f"{counts['error']} error(s), {counts['warning']} warning(s) - click to show",
+            fg=SEVERITY_COLORS[worst]
+        )
+
+    def next_problem(self, event=None):
+        # Filter the inspector down to the next flagged parameter
+        if not self.issues:
+            return
+        names = list(self.issues)
+        name = names[self.issue_cursor % len(names)]
+        self.issue_cursor += 1
+        self.filter_var.set(name)
+        self.refresh_inspector()
+        self.status_label.config(
+            text=f"{name}: " + "; ".join(issue["message"] for issue in self.issues[name])
+        )
 
     # =====================================================
     # Live Update
     # =====================================================
 
     def ensure_name_in_namemap(self, name_string):
-        if "NameMap" not in self.data:
-            return
-        if name_string not in self.data["NameMap"]:
-            self.data["NameMap"].append(name_string)
+        ensure_name_in_namemap(self.data, name_string, self.name_index)
+
+    def live_update(self, event=None, name=None):
+        if name is not None:
+            self.dirty_params.add(name)
+        self.update_scheduler.request()
 
-    def live_update(self, event=None):
+    def process_pending_updates(self):
+        # While a point is being dragged the graph is blitted directly, so
+        # only the JSON side is brought up to date here.
         try:
-            self.apply_changes_to_json()
-        except:
-            pass
+            self.sync_dragged_widgets()
+            self.apply_changes_to_json(redraw=not hasattr(self, "dragging_line"))
+        except (ValueError, tk.TclError) as e:
+            # A half-typed value or a widget gone with a rebuilt inspector;
+            # the name stays dirty and is applied with the next edit
+            self.status_label.config(text=f"Edit not applied yet: {e}")
+        except Exception as e:
+            self.status_label.config(text=f"Applying edits failed: {type(e).__name__}: {e}")
+            raise
 
-    def apply_changes_to_json(self):
-        values = self.data["Exports"][0]["Table"]["Data"][0]["Value"]
-        for entry in values:
-            name = entry["Name"]
-            if name not in self.param_widgets:
-                continue
-            widget = self.param_widgets[name]
-            # -------- VECTOR --------
-            if isinstance(widget, dict):
-                vec = entry["Value"][0]["Value"]
-                for axis in ["X", "Y", "Z"]:
-                    try:
-                        vec[axis] = float(widget[axis].get())
-                    except:
-                        pass
-            # -------- NORMAL --------
+    def sync_dragged_widgets(self):
+        # Dragging already wrote the JSON entries through the curve model;
+        # only the parameter values and inspector text follow here.
+        names = self.synced_params
+        self.synced_params = set()
+        values = get_table_values(self.data)
+        for name in names:
+            entry = values[self.entry_index[name]]
+            self.parameters[name] = parse_entry(entry, self.enum_types)
+            self.show_parameter(name)
+
+    def show_parameter(self, name):
+        # Put self.parameters[name] back into its inspector widget
+        widget = self.param_widgets.get(name)
+        if widget is None:
+            return
+        value = self.parameters[name]
+        if isinstance(widget, dict):
+            for axis in VECTOR_AXES:
+                widget[axis].delete(0, tk.END)
+                widget[axis].insert(0, str(value[axis]))
+        elif name in self.enum_types:
+            widget.set(enum_label(value))
+        else:
+            widget.delete(0, tk.END)
+            widget.insert(0, str(value))
+
+    @profiled("apply_changes_to_json")
+    def apply_changes_to_json(self, names=None, redraw=True):
+        # Only the entries recorded as dirty are written back; every widget
+        # was bound to its entry index when the inspector was built.
+        if names is None:
+            names = self.dirty_params
+        self.dirty_params = set()
+        values = get_table_values(self.data)
+        name_map = self.data.get("NameMap")
+        name_count = len(name_map) if name_map is not None else 0
+        changes = {}
+        axes = set()
+        pending = set(names)
+        try:
+            for name in names:
+                index = self.entry_index.get(name)
+                widget = self.param_widgets.get(name)
+                if index is None or widget is None:
+                    pending.discard(name)
+                    continue
+                entry = values[index]
+                before = copy.deepcopy(entry["Value"])
+                self.write_widget_to_entry(name, widget, entry)
+                EditJournal.note(changes, index, before, copy.deepcopy(entry["Value"]))
+                pending.discard(name)
+                self.parameters[name] = parse_entry(entry, self.enum_types)
+                axes |= self.update_curve_point(name)
+        finally:
+            # Names not written because a widget raised are retried on the
+            # next flush; what was written is journaled either way
+            self.dirty_params |= pending
+            if name_map is not None and len(name_map) > name_count:
+                EditJournal.note(changes, "NameMap", name_map[:name_count], list(name_map))
+            if len(names) == 1:
+                self.journal.commit(changes, next(iter(names)), merge_key=("edit", next(iter(names))))
             else:
-                # -------- ENUM --------
-                if hasattr(self, "fixed_enums") and name in self.fixed_enums:
-                    enum_map = self.fixed_enums[name]
-                    selected_label = widget.get()
-                    enum_value = enum_map[selected_label]
-                    # Ensure enum string exists in NameMap
-                    self.ensure_name_in_namemap(enum_value)
-                    entry["Value"] = enum_value
-                # -------- NORMAL --------
-                else:
-                    try:
-                        entry["Value"] = float(widget.get())
-                    except:
-                        entry["Value"] = widget.get()
-        self.parameters = self.extract_all_parameters()
-        self.extract_graph_data()
-        self.update_graphs()
+                self.journal.commit(changes, f"{len(changes)} edits")
+        if changes:
+            self.schedule_validation()
+        if axes and redraw:
+            self.update_graphs(axes)
+
+    def write_widget_to_entry(self, name, widget, entry):
+        # -------- VECTOR --------
+        if isinstance(widget, dict):
+            set_entry_value(self.data, entry, {
+                axis: widget[axis].get() for axis in VECTOR_AXES
+            })
+        # -------- ENUM --------
+        elif name in self.enum_types:
+            set_entry_value(self.data, entry, widget.get(), self.name_index)
+        # -------- NORMAL --------
+        else:
+            set_entry_value(self.data, entry, widget.get())
 
     # =====================================================
     # Graph Handling
     # =====================================================
 
+    @profiled("extract_graph_data")
     def extract_graph_data(self):
-        self.speed_graph = []
-        self.diff_nose = []
-        self.speed_rot = []
-        self.rot_grav = []
-        indexed_speed = {}
-        indexed_diff = {}
-        for name, value in self.parameters.items():
-            if name.startswith("SpeedGraph"):
-                idx = int(name.replace("SpeedGraph", ""))
-                indexed_speed[idx] = float(value)
-            elif name.startswith("DiffNoseVelocityR"):
-                idx = int(name.replace("DiffNoseVelocityR", ""))
-                indexed_diff[idx] = float(value)
-            elif name.startswith("SpeedRot"):
-                self.speed_rot.append([value["X"], value["Y"], value["Z"]])
-            elif name.startswith("RotGravR"):
-                self.rot_grav.append([value["X"], value["Y"], value["Z"]])
-        # Rebuild in correct index order
-        for i in sorted(indexed_speed.keys()):
-            self.speed_graph.append(indexed_speed[i])
-            self.diff_nose.append(indexed_diff.get(i, 0.0))
-
-    def update_graphs(self):
-        self.ax1.clear()
-        self.ax2.clear()
-        self.ax3.clear()
+        # Built once per load/revert; edits then go through the model
+        self.curves = CurveModel(self.data)
+
+    def curve_axes(self, curve):
+        if curve == "speed_graph":
+            return {self.ax1, self.ax2, self.ax3}
+        elif curve == "diff_nose":
+            return {self.ax1}
+        elif curve == "speed_rot":
+            return {self.ax2}
+        elif curve == "rot_grav":
+            return {self.ax3}
+        return set()
+
+    def update_curve_point(self, name):
+        # Refresh one curve point from its JSON entry and return the axes
+        # whose lines need replotting.
+        return self.curve_axes(self.curves.refresh(name))
+
+    def graph_shape(self):
+        return self.curves.shape() if self.curves is not None else None
+
+    @profiled("build_graph_artists")
+    def build_graph_artists(self):
+        # Lines are created once per loaded file; later refreshes only
+        # push new data into them (see update_graphs).
+        for ax in (self.ax1, self.ax2, self.ax3):
+            ax.clear()
         self.line_map.clear()
-        if not self.speed_graph:
+        self.graph_lines = {}
+        self.graph_built_shape = self.graph_shape()
+        self.drag_background = None
+        curves = self.curves
+        if curves is None or not len(curves.speed_graph):
+            self.canvas.draw_idle()
             return
         # ================= GRAPH 1 =================
         line1, = self.ax1.plot(
-            self.speed_graph,
-            self.diff_nose,
+            curves.speed_graph,
+            curves.diff_nose,
             marker="o",
             picker=5,
         )
         self.ax1.set_title("DiffNoseVelocityR")
         self.line_map[line1] = ("diff_nose", None, None)
+        self.graph_lines["diff_nose"] = [line1]
         # ================= GRAPH 2 =================
-        if self.speed_rot:
-            x_vals = self.speed_graph
-            rx = [v[0] for v in self.speed_rot]
-            ry = [v[1] for v in self.speed_rot]
-            rz = [v[2] for v in self.speed_rot]
-            line_rx, = self.ax2.plot(x_vals, rx, marker="o", picker=5, label="Pitch")
-            line_ry, = self.ax2.plot(x_vals, ry, marker="o", picker=5, label="Yaw")
-            line_rz, = self.ax2.plot(x_vals, rz, marker="o", picker=5, label="Roll")
+        if len(curves.speed_rot):
+            x_vals = curves.speeds_for("speed_rot")
+            labels = CURVE_LINE_LABELS["speed_rot"]
+            line_rx, = self.ax2.plot(x_vals, curves.speed_rot[:, 0], marker="o", picker=5, label=labels[0])
+            line_ry, = self.ax2.plot(x_vals, curves.speed_rot[:, 1], marker="o", picker=5, label=labels[1])
+            line_rz, = self.ax2.plot(x_vals, curves.speed_rot[:, 2], marker="o", picker=5, label=labels[2])
             self.ax2.set_title("SpeedRot")
             self.line_map[line_rx] = ("speed_rot", 0, "X")
             self.line_map[line_ry] = ("speed_rot", 1, "Y")
             self.line_map[line_rz] = ("speed_rot", 2, "Z")
+            self.graph_lines["speed_rot"] = [line_rx, line_ry, line_rz]
             self.ax2.legend(loc="upper right", fontsize="small")
         # ================= GRAPH 3 =================
-        if self.rot_grav:
-            x_vals = self.speed_graph
-            gx = [v[0] for v in self.rot_grav]
-            gy = [v[1] for v in self.rot_grav]
-            gz = [v[2] for v in self.rot_grav]
-            line_gx, = self.ax3.plot(x_vals, gx, marker="o", picker=5, label="Gravity (Upside Down)")
-            line_gy, = self.ax3.plot(x_vals, gy, marker="o", picker=5, label="Gravity (Side)")
-            line_gz, = self.ax3.plot(x_vals, gz, marker="o", picker=5, label="Unused") 
+        if len(curves.rot_grav):
+            x_vals = curves.speeds_for("rot_grav")
+            labels = CURVE_LINE_LABELS["rot_grav"]
+            line_gx, = self.ax3.plot(x_vals, curves.rot_grav[:, 0], marker="o", picker=5, label=labels[0])
+            line_gy, = self.ax3.plot(x_vals, curves.rot_grav[:, 1], marker="o", picker=5, label=labels[1])
+            line_gz, = self.ax3.plot(x_vals, curves.rot_grav[:, 2], marker="o", picker=5, label=labels[2])
             self.ax3.set_title("RotGravR")
             self.line_map[line_gx] = ("rot_grav", 0, "X")
             self.line_map[line_gy] = ("rot_grav", 1, "Y")
             self.line_map[line_gz] = ("rot_grav", 2, "Z")
+            self.graph_lines["rot_grav"] = [line_gx, line_gy, line_gz]
             self.ax3.legend(loc="upper right", fontsize="small")
         self.ax1.grid(True)
         self.ax2.grid(True)
-        self.ax3.grid(True)    
-        self.canvas.draw()
+        self.ax3.grid(True)
+        self.canvas.draw_idle()
+
+    @profiled("update_graphs")
+    def update_graphs(self, axes=None):
+        # Curve lengths changed (or nothing plotted yet) → rebuild the lines
+        if self.graph_built_shape != self.graph_shape():
+            self.build_graph_artists()
+            self.refresh_capabilities()
+            return
+        curves = self.curves
+        if curves is None or not len(curves.speed_graph):
+            return
+        if axes is None:
+            axes = {self.ax1, self.ax2, self.ax3}
+        if self.ax1 in axes:
+            self.graph_lines["diff_nose"][0].set_data(curves.speed_graph, curves.diff_nose)
+        if self.ax2 in axes and "speed_rot" in self.graph_lines:
+            x_vals = curves.speeds_for("speed_rot")
+            for i, line in enumerate(self.graph_lines["speed_rot"]):
+                line.set_data(x_vals, curves.speed_rot[:, i])
+        if self.ax3 in axes and "rot_grav" in self.graph_lines:
+            x_vals = curves.speeds_for("rot_grav")
+            for i, line in enumerate(self.graph_lines["rot_grav"]):
+                line.set_data(x_vals, curves.rot_grav[:, i])
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+        self.refresh_capabilities()
+
+    @profiled("refresh_capabilities")
+    def refresh_capabilities(self):
+        if self.curves is None:
+            return
+        results = curve_model_capabilities(
+            self.curves, mode=self.capability_mode.get(), band=self.corner_band
+        )
+        for label, (title, template) in zip(self.capability_labels, CAPABILITY_ROWS):
+            label.config(text=template.format(**results))
+
+    def set_capability_mode(self):
+        self.config["curve_interpolation"] = self.capability_mode.get()
+        write_config(self.config)
+        self.refresh_capabilities()
 
     # =====================================================
     # Drag Graph Points
@@ -470,11 +1507,20 @@ class PlaneConfigEditor:
 
     def on_pick(self, event):
         line = event.artist
-        if line not in self.line_map:
+        if line not in self.line_map or self.editing_locked:
             return
         self.dragging_line = line
         self.dragging_index = event.ind[0]
+        self.drag_changes = {}   # the whole drag becomes one journal step
+        # Render everything except the dragged line once and keep that
+        # background; motion events then only blit the line over it.
+        line.set_animated(True)
+        self.canvas.draw()
+        self.drag_background = self.canvas.copy_from_bbox(line.axes.bbox)
+        line.axes.draw_artist(line)
+        self.canvas.blit(line.axes.bbox)
 
+    @profiled("on_drag")
     def on_drag(self, event):
         if not hasattr(self, "dragging_line"):
             return
@@ -483,50 +1529,55 @@ class PlaneConfigEditor:
         line = self.dragging_line
         if line not in self.line_map:
             return  # prevents KeyError
+        if event.inaxes is not line.axes:
+            return
         line_type, axis_index, axis_name = self.line_map[line]
-        index = self.dragging_index
-        # ================= DIFF NOSE =================
-        if line_type == "diff_nose":
-            self.diff_nose[index] = event.ydata
-            line.set_ydata(self.diff_nose)
-            param_name = f"DiffNoseVelocityR{index}"
-            if param_name in self.param_widgets:
-                widget = self.param_widgets[param_name]
-                widget.delete(0, tk.END)
-                widget.insert(0, str(round(event.ydata, 3)))
-        # ================= SPEED ROT =================
-        elif line_type == "speed_rot":
-            self.speed_rot[index][axis_index] = event.ydata
-            new_y = [v[axis_index] for v in self.speed_rot]
-            line.set_ydata(new_y)
-            param_name = f"SpeedRot{index}"
-            if param_name in self.param_widgets:
-                widget = self.param_widgets[param_name][axis_name]
-                widget.delete(0, tk.END)
-                widget.insert(0, str(round(event.ydata, 3)))
-        # ================= ROT GRAV =================
-        elif line_type == "rot_grav":
-            self.rot_grav[index][axis_index] = event.ydata
-            new_y = [v[axis_index] for v in self.rot_grav]
-            line.set_ydata(new_y)
-            param_name = f"RotGravR{index}"
-            if param_name in self.param_widgets:
-                widget = self.param_widgets[param_name][axis_name]
-                widget.delete(0, tk.END)
-                widget.insert(0, str(round(event.ydata, 3)))
-        self.canvas.draw_idle()
+        position = self.curves.positions[line_type][self.dragging_index]
+        if position >= 0 and position not in self.drag_changes:
+            self.drag_changes[position] = [self.current_value(position), None]
+        # The model writes the array and the JSON entry in place; the
+        # inspector text is synced once per frame by the scheduler.
+        param_name = self.curves.set_point(line_type, self.dragging_index, event.ydata, axis_index)
+        if param_name is None:
+            return
+        array = self.curves.arrays[line_type]
+        line.set_ydata(array if axis_index is None else array[:, axis_index])
+        self.synced_params.add(param_name)
+        self.update_scheduler.request()
+        self.blit_line(line)
+
+    def blit_line(self, line):
+        if self.drag_background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.drag_background)
+        line.axes.draw_artist(line)
+        self.canvas.blit(line.axes.bbox)
 
     def on_release(self, event):
         if hasattr(self, "dragging_line"):
+            line = self.dragging_line
+            line.set_animated(False)
+            self.drag_background = None
             del self.dragging_line
             del self.dragging_index
+            for position, delta in self.drag_changes.items():
+                delta[1] = self.current_value(position)
+            line_type = self.line_map[line][0]
+            self.journal.commit(self.drag_changes, f"drag {CURVE_PREFIXES[line_type]}")
+            self.drag_changes = {}
+            self.schedule_validation()
+            # Bring the inspector up to date and rescale the dragged axes
+            self.update_scheduler.request()
+            self.update_scheduler.flush()
+            self.update_graphs({line.axes})
 
     # =====================================================
     # Replace PlaneID
     # =====================================================
 
     def replace_plane_id(self):
-        if not self.file_path:
+        if not self.file_path or self.tasks.busy:
             return
         new_id = self.new_id.get().strip()
         if not new_id:
@@ -541,7 +1592,7 @@ class PlaneConfigEditor:
             full_filename = os.path.basename(self.file_path)
         name_without_ext = os.path.splitext(full_filename)[0]
         # Expecting: PlayerPlaneConfig_PLXXX
-        prefix = "PlayerPlaneConfig_"
+        prefix = PLANE_CONFIG_PREFIX
         if not name_without_ext.startswith(prefix):
             messagebox.showerror(
                 "Error",
@@ -549,73 +1600,89 @@ class PlaneConfigEditor:
             )
             return
         old_id = name_without_ext.replace(prefix, "")
-        new_name_without_ext = prefix + new_id
-
-        # -------------------------------------------------
-        # Replace inside JSON
-        # -------------------------------------------------
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            text = f.read()
-        updated_text = text.replace(old_id, new_id)
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write(updated_text)
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            self.data = json.load(f)
-        self.original_data = copy.deepcopy(self.data)
-        # -------------------------------------------------
-        # If editing UASSET
-        # -------------------------------------------------
-        if self.uasset_path:
-            try:
-                # Convert JSON back to UASSET
-                subprocess.run([
-                    self.uassetgui_path,
-                    "fromjson",
-                    self.file_path,
-                    self.uasset_path
-                ], check=True)
-                directory = os.path.dirname(self.uasset_path)
-                old_uasset_path = self.uasset_path
-                new_uasset_path = os.path.join(
-                    directory,
-                    new_name_without_ext + ".uasset"
-                )
-                # Rename .uasset
-                os.rename(old_uasset_path, new_uasset_path)
-                self.uasset_path = new_uasset_path
-                # Rename .uexp
-                old_uexp = old_uasset_path.replace(".uasset", ".uexp")
-                new_uexp = new_uasset_path.replace(".uasset", ".uexp")
-                if os.path.exists(old_uexp):
-                    os.rename(old_uexp, new_uexp)
-                messagebox.showinfo(
-                    "Success",
-                    f"PlaneID changed:\n{old_id} → {new_id}"
-                )
-            except Exception as e:
-                messagebox.showerror("Conversion Error", str(e))
-        # -------------------------------------------------
-        # JSON only
-        # -------------------------------------------------
-        else:
-            directory = os.path.dirname(self.file_path)
-            new_path = os.path.join(
-                directory,
-                new_name_without_ext + ".json"
-            )
-            os.rename(self.file_path, new_path)
-            self.file_path = new_path
-            messagebox.showinfo(
-                "Success",
-                f"PlaneID changed:\n{old_id} → {new_id}"
+        if new_id == old_id:
+            return
+        self.update_scheduler.flush()
+        # The re-ID moves the file on disk; it must not also save edits
+        # and lose their undo history with them
+        if self.has_local_edits():
+            messagebox.showwarning(
+                "Unsaved edits",
+                "Save or revert your edits before changing the PlaneID."
             )
+            return
+
+        uasset_path = self.uasset_path
+        file_path = self.file_path
+        source_path = uasset_path or file_path
+        new_path = reid_target_path(source_path, new_id)
+        native_asset = self.native_asset
+        uassetgui_path = self.uassetgui_path
+        timeout = self.conversion_timeout
+        # The worker renames a copy; the open document is swapped for it in done
+        data = copy.deepcopy(self.data)
+        mentions = []
+
+        def job(cancel_event):
+            if os.path.exists(new_path):
+                raise FileExistsError(f"{os.path.basename(new_path)} already exists")
+            # Only the names carrying the ID are rewritten; other mentions
+            # are kept and listed once the re-ID is done
+            mentions[:] = reid_document(data, old_id, new_id)[1]
+            if uasset_path:
+                if native_asset is not None:
+                    native_asset.write(data, new_path)
+                else:
+                    write_json(data, file_path)
+                    convert_to_uasset(uassetgui_path, file_path, new_path, timeout, cancel_event)
+            else:
+                replace_json(data, new_path)
+            # The new files are complete; only now drop the old ones
+            if uasset_path:
+                self.forget_cached_conversion(uasset_path)
+            remove_config_files(source_path)
+            return new_path
+
+        def done(new_path):
+            # Entries were renamed: rebuild everything bound to them, with
+            # a fresh journal whose baseline is the renamed asset
+            self.data = data
+            self.json_source = None   # the next save writes the whole document
+            if uasset_path:
+                self.uasset_path = new_path
+                if native_asset is not None:
+                    self.file_path = new_path
+            else:
+                self.file_path = new_path
+            self.rebuild_document_view()
+            message = f"PlaneID changed:\n{old_id} → {new_id}"
+            if mentions:
+                kept = "\n".join(f"{location}: {value}" for location, value in mentions[:10])
+                message += f"\n\nKept {len(mentions)} other mention(s) of {old_id}:\n{kept}"
+            messagebox.showinfo("Success", message)
+
+        self.run_task(f"Changing PlaneID to {new_id}", job, done, error_title="Conversion Error")
 
 
 # =====================================================
 # Run
 # =====================================================
 
-if __name__ == "__main__":
+def run_gui():
     root = tk.Tk()
     app = PlaneConfigEditor(root)
+    # Load matplotlib while the user is still picking a file
+    root.after(100, warm_up_matplotlib)
     root.mainloop()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        run_gui()
+        return 0
+    return cli.main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# The editor's three graphs rendered offscreen (Agg) for every plane of a
+# directory, plus overlays of several planes. Curves come from the fleet
+# index, which is refreshed first, so only changed configs are parsed.
+# charts.json in the output directory maps each chart to the hash of its
+# data and options; unchanged charts are not rendered again.
+
+import hashlib
+import html
+import os
+
+from .conversion import WorkerJob
+from .curves import CURVE_LINE_LABELS, CURVE_PREFIXES, VECTOR_CURVES
+from .documents import VECTOR_AXES, canonical_json
+
+
+CHART_FORMATS = ("png", "svg")
+CHART_PANELS = ("diff_nose", "speed_rot", "rot_grav")
+CHART_MANIFEST = "charts.json"
+CONTACT_SHEET = "index.html"
+
+
+def chart_series(row):
+    # The plottable part of FleetIndex.row(); vector row i sits on
+    # SpeedGraph knot i, as in the capability analysis
+    return {
+        "label": row["plane_id"] or os.path.splitext(row["file"])[0],
+        **{curve: row["curves"][curve] for curve in CURVE_PREFIXES}
+    }
+
+
+def chart_digest(series, options):
+    return hashlib.sha256(canonical_json({"series": series, "options": options})).hexdigest()
+
+
+def render_chart(series, path, options):
+    # Runs in a worker process; always returns a result instead of raising.
+    # One series draws every axis of each curve, several draw options["axis"].
+    result = {"path": path, "ok": False, "error": None}
+    with WorkerJob(result, options):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        figure = Figure(figsize=(6, 8))
+        FigureCanvasAgg(figure)
+        axes = figure.subplots(3, 1)
+        overlay = len(series) > 1
+        axis_index = VECTOR_AXES.index(options["axis"])
+        for ax, curve in zip(axes, CHART_PANELS):
+            for plane in series:
+                speeds = plane["speed_graph"]
+                values = plane[curve][:len(speeds)]
+                x = speeds[:len(values)]
+                if curve not in VECTOR_CURVES:
+                    ax.plot(x, values, marker="o", label=plane["label"] if overlay else None)
+                elif overlay:
+                    ax.plot(x, [v[axis_index] for v in values], marker="o", label=plane["label"])
+                else:
+                    for i, label in enumerate(CURVE_LINE_LABELS[curve]):
+                        ax.plot(x, [v[i] for v in values], marker="o", label=label)
+            title = CURVE_PREFIXES[curve]
+            if overlay and curve in VECTOR_CURVES:
+                title += f": {CURVE_LINE_LABELS[curve][axis_index]}"
+            ax.set_title(title)
+            ax.grid(True)
+            if overlay or curve in VECTOR_CURVES:
+                ax.legend(loc="upper right", fontsize="small")
+        if not overlay:
+            figure.suptitle(series[0]["label"])
+        figure.tight_layout(pad=3)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        figure.savefig(temp_path, format=options["format"], dpi=options["dpi"])
+        os.replace(temp_path, path)
+        result["ok"] = True
+    return result
+
+
+def parse_overlay(text):
+    # "NAME=PL001,PL002" or "PL0*,PL1*" → (name or None, [plane ID patterns])
+    name, sep, ids = text.rpartition("=")
+    return (name if sep else None), [part.strip() for part in ids.split(",") if part.strip()]
+
+
+def write_contact_sheet(path, title, charts):
+    # charts: [(file name, caption, {row title: text})]
+    cells = []
+    for file, caption, values in charts:
+        rows = "".join(
+            f"<tr><th>{html.escape(name)}</th><td>{html.escape(text)}</td></tr>"
+            for name, text in values.items()
+        )
+        cells.append(
+            f'<figure><a href="{html.escape(file)}"><img src="{html.escape(file)}" loading="lazy"></a>'
+            f"<figcaption>{html.escape(caption)}<table>{rows}</table></figcaption></figure>"
+        )
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 1em; }}
+main {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 1em; }}
+figure {{ margin: 0; border: 1px solid #ccc; padding: 0.5em; }}
+img {{ width: 100%; }}
+figcaption {{ font-weight: bold; }}
+table {{ font-weight: normal; font-size: small; }}
+th {{ text-align: left; color: gray; padding-right: 1em; }}
+</style></head>
+<body><h1>{html.escape(title)}</h1><main>
+{chr(10).join(cells)}
+</main></body></html>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
@@ -0,0 +1,1191 @@
+# The headless commands of `python AC7CA.py <command>`: argument parsing,
+# the per-file workers and one run_<command> per command.
+
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import posixpath
+import re
+import secrets
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .charts import (
+    CHART_FORMATS, CHART_MANIFEST, CONTACT_SHEET, chart_digest, chart_series, parse_overlay,
+    render_chart, write_contact_sheet
+)
+from .conversion import (
+    DEFAULT_CACHE_DIR, WorkerJob, asset_digest, config_digest, config_stamp, conversion_options,
+    load_document, options_cache, save_document
+)
+from .curves import (
+    CAPABILITY_METRICS, CAPABILITY_ROWS, DEFAULT_CAPABILITY_SAMPLES, DEFAULT_CORNER_BAND,
+    INTERPOLATION_MODES
+)
+from .documents import (
+    DEFAULT_ENGINE_VERSION, PLANE_CONFIG_PREFIX, VECTOR_AXES, apply_patch, extract_parameters,
+    find_config_files, json_dumps, plane_id_from_path, read_config, read_json, reid_document,
+    reid_target_path, remove_config_files, replace_json, uexp_path_for, write_json
+)
+from .fleet import AXIS_ALIASES, FLEET_INDEX_DIR, FleetIndex
+from .merge import diff_documents, merge_documents
+from .native import NativeAsset, NativeAssetError, verify_native_round_trip, write_file_pair
+from .pak import PAK_COMPRESSION_METHODS, PAK_COMPRESSION_ZLIB, PakArchive
+from .rpc import (
+    DEFAULT_SERVER_DOCUMENTS, DEFAULT_SERVER_PORT, DocumentStore, RpcHandler, RpcTcpServer,
+    RpcUnixServer
+)
+from .validation import ValidationCache, Validator, count_severities, read_validation_rules
+
+
+def parse_patch_value(text):
+    # "1,2,3" → vector, anything else is left to set_entry_value
+    if "," in text:
+        return [part.strip() for part in text.split(",")]
+    return text
+
+
+def add_patch_item(section, name, value):
+    # "SpeedRot3.X" addresses one axis of a vector parameter
+    base, _, axis = name.rpartition(".")
+    if base and axis in VECTOR_AXES:
+        current = section.get(base)
+        if isinstance(current, (list, tuple)):
+            current = dict(zip(VECTOR_AXES, current))
+        elif not isinstance(current, dict):
+            current = {} if current is None else {a: current for a in VECTOR_AXES}
+        section[base] = current
+        current[axis] = value
+    else:
+        section[name] = value
+
+
+def read_patch_file(path):
+    # JSON: {"set": {...}, "scale": {...}} or a flat {name: value} dict
+    # CSV:  name,value  or  name,X,Y,Z  per row
+    patch = {"set": {}, "scale": {}}
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                row = [cell.strip() for cell in row]
+                if not row or not row[0] or row[0].startswith("#") or row[0].lower() == "name":
+                    continue
+                if len(row) == 2:
+                    add_patch_item(patch["set"], row[0], row[1])
+                elif len(row) == 4:
+                    patch["set"][row[0]] = row[1:]
+                else:
+                    raise ValueError(f"Bad patch row: {','.join(row)}")
+        return patch
+    loaded = read_json(path)
+    if "set" not in loaded and "scale" not in loaded:
+        loaded = {"set": loaded}
+    for section in ("set", "scale"):
+        for name, value in loaded.get(section, {}).items():
+            add_patch_item(patch[section], name, value)
+    return patch
+
+
+def split_assignment(text):
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    return name.strip(), value.strip()
+
+
+def build_patch(args):
+    patch = {"set": {}, "scale": {}}
+    if args.patch:
+        patch = read_patch_file(args.patch)
+    for name, value in args.set:
+        add_patch_item(patch["set"], name, parse_patch_value(value))
+    for name, value in args.scale:
+        add_patch_item(patch["scale"], name, float(value))
+    return patch
+
+
+def process_config_file(path, patch, options):
+    # Runs in a worker process; always returns a result instead of raising
+    result = {"path": path, "ok": False, "changed": 0, "error": None}
+    with WorkerJob(result, options) as job:
+        data, json_path, native_asset = job.load(path)
+        result["changed"] = len(apply_patch(data, patch))
+        if not options["dry_run"]:
+            out_path = path
+            if options["out_dir"]:
+                out_path = os.path.join(options["out_dir"], os.path.basename(path))
+            if path.endswith(".uasset"):
+                if job.cache is not None and out_path == path:
+                    job.cache.discard(asset_digest(path, options["engine_version"]))
+                save_document(
+                    data, json_path, out_path, options["uassetgui_path"], native_asset,
+                    options["timeout"]
+                )
+            elif out_path == path:
+                replace_json(data, out_path)   # a killed worker never truncates the input
+            else:
+                write_json(data, out_path)
+        result["ok"] = True
+    return result
+
+
+def run_batch(args):
+    config = read_config()
+    try:
+        patch = build_patch(args)
+    except (OSError, ValueError) as e:
+        print(f"Invalid patch: {e}", file=sys.stderr)
+        return 2
+    files = find_config_files(args.directory, args.pattern)
+    if not files:
+        print(f"No files matching {args.pattern} in {args.directory}", file=sys.stderr)
+        return 1
+    options = dict(conversion_options(args, config), out_dir=args.out, dry_run=args.dry_run)
+    if (not options["uassetgui_path"] and not args.native
+            and any(path.endswith(".uasset") for path in files)):
+        print("UAssetGUI path is not set (use --uassetgui)", file=sys.stderr)
+        return 2
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(process_config_file, path, patch, options) for path in files]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            name = os.path.basename(result["path"])
+            if result["ok"]:
+                print(f"OK    {name} ({result['changed']} changed)")
+            else:
+                print(f"FAIL  {name}: {result['error']}")
+    failures = sum(1 for result in results if not result["ok"])
+    suffix = " (dry run)" if args.dry_run else ""
+    print(f"{len(files) - failures}/{len(files)} files patched{suffix}")
+    hits = sum(result.get("cache", {}).get("hits", 0) for result in results)
+    misses = sum(result.get("cache", {}).get("misses", 0) for result in results)
+    if hits or misses:
+        print(f"conversion cache: {hits} hits, {misses} misses")
+    if args.report:
+        results.sort(key=lambda result: result["path"])
+        write_json(results, args.report)
+    return 1 if failures else 0
+
+
+def expand_id_range(text):
+    # "PL001-PL040=PL101" → {"PL001": "PL101", ..., "PL040": "PL140"}
+    source, sep, first_target = text.partition("=")
+    first, _, last = source.partition("-")
+    match_first = re.match(r"(.*?)(\d+)$", first.strip())
+    match_last = re.match(r"(.*?)(\d+)$", (last or first).strip())
+    match_target = re.match(r"(.*?)(\d+)$", first_target.strip())
+    if not sep or not (match_first and match_last and match_target):
+        raise argparse.ArgumentTypeError(f"expected OLD1-OLD2=NEW1, got {text!r}")
+    if match_first.group(1) != match_last.group(1):
+        raise argparse.ArgumentTypeError(f"range ends have different prefixes: {text!r}")
+    start, end = int(match_first.group(2)), int(match_last.group(2))
+    target = int(match_target.group(2))
+    width, target_width = len(match_first.group(2)), len(match_target.group(2))
+    return {
+        f"{match_first.group(1)}{i:0{width}d}": f"{match_target.group(1)}{target + i - start:0{target_width}d}"
+        for i in range(start, end + 1)
+    }
+
+
+def build_id_map(args):
+    id_map = {}
+    for old, new in args.map:
+        id_map[old] = new
+    for item in args.range:
+        id_map.update(item)
+    return id_map
+
+
+def reid_config_file(path, new_id, options):
+    # Runs in a worker process; always returns a result instead of raising
+    old_id = plane_id_from_path(path)
+    target = reid_target_path(path, new_id, options["out_dir"])
+    result = {
+        "path": path, "target": target, "ok": False, "changes": [], "mentions": [], "error": None
+    }
+    with WorkerJob(result, options) as job:
+        if os.path.exists(target) and not options["force"]:
+            raise FileExistsError(f"{os.path.basename(target)} already exists (use --force)")
+        data, json_path, native_asset = job.load(path)
+        refs, mentions = reid_document(data, old_id, new_id)
+        result["changes"] = [(location, old, new) for _, _, old, new, location in refs]
+        result["mentions"] = mentions
+        if not options["dry_run"]:
+            if path.endswith(".uasset"):
+                save_document(
+                    data, json_path, target, options["uassetgui_path"], native_asset,
+                    options["timeout"]
+                )
+            else:
+                replace_json(data, target)
+            if options["move"]:
+                remove_config_files(path)
+        result["ok"] = True
+    return result
+
+
+def run_reid(args):
+    config = read_config()
+    id_map = build_id_map(args)
+    if not id_map:
+        print("Nothing to do: give --map OLD=NEW or --range OLD1-OLD2=NEW1", file=sys.stderr)
+        return 2
+    # Chains like PL001→PL002, PL002→PL003 would depend on worker order
+    chained = sorted(set(id_map) & set(id_map.values()))
+    if chained and not args.out:
+        print(f"IDs are both source and target: {', '.join(chained)}", file=sys.stderr)
+        return 2
+    jobs = []
+    for path in find_config_files(args.directory, args.pattern):
+        old_id = plane_id_from_path(path)
+        if old_id in id_map:
+            jobs.append((path, id_map[old_id]))
+    missing = sorted(set(id_map) - {plane_id_from_path(path) for path, _ in jobs})
+    if not jobs:
+        print(f"No configs for the given IDs in {args.directory}", file=sys.stderr)
+        return 1
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    options = dict(
+        conversion_options(args, config),
+        out_dir=args.out, dry_run=args.dry_run, move=args.move, force=args.force
+    )
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(reid_config_file, path, new_id, options) for path, new_id in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            name = os.path.basename(result["path"])
+            if result["ok"]:
+                target = os.path.basename(result["target"])
+                print(f"OK    {name} → {target} ({len(result['changes'])} references)")
+                if args.dry_run:
+                    for location, old, new in result["changes"]:
+                        print(f"        {location}: {old} → {new}")
+                # Not an asset name: reported, never rewritten
+                for location, value in result["mentions"]:
+                    print(f"        kept {location}: {value}")
+            else:
+                print(f"FAIL  {name}: {result['error']}")
+    for old_id in missing:
+        print(f"MISS  {PLANE_CONFIG_PREFIX}{old_id}: not found")
+    failures = sum(1 for result in results if not result["ok"])
+    suffix = " (dry run)" if args.dry_run else ""
+    print(f"{len(jobs) - failures}/{len(jobs)} configs re-IDed{suffix}")
+    if args.report:
+        results.sort(key=lambda result: result["path"])
+        write_json(results, args.report)
+    return 1 if failures else 0
+
+
+def run_index(args):
+    config = read_config()
+    index_dir = args.index_dir or os.path.join(args.directory, FLEET_INDEX_DIR)
+    options = conversion_options(args, config)
+    start = time.perf_counter()
+    index = FleetIndex.open(index_dir)
+    stats = index.update(args.directory, args.pattern, options, args.workers)
+    index.save()
+    for result in stats["failed"]:
+        print(f"FAIL  {os.path.basename(result['path'])}: {result['error']}")
+    print(
+        f"{len(index.planes)} planes indexed in {time.perf_counter() - start:.2f}s "
+        f"({stats['added']} added, {stats['updated']} updated, "
+        f"{stats['unchanged']} unchanged, {stats['removed']} removed)"
+    )
+    return 1 if stats["failed"] else 0
+
+
+def run_query(args):
+    index_dir = args.index_dir or os.path.join(args.directory, FLEET_INDEX_DIR)
+    start = time.perf_counter()
+    index = FleetIndex.open(index_dir)
+    if not index.planes:
+        print(f"No index in {index_dir} (run the index command first)", file=sys.stderr)
+        return 1
+    try:
+        rows = index.query(args.condition, args.show, args.sort, args.desc)
+    except (KeyError, ValueError) as e:
+        print(e.args[0] if e.args else e, file=sys.stderr)
+        return 2
+    elapsed = (time.perf_counter() - start) * 1000.0
+    matched = len(rows)
+    if args.limit:
+        rows = rows[:args.limit]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    metrics = [key for key in (rows[0] if rows else {}) if key not in ("plane_id", "file")]
+    print("  ".join([f"{'plane':<12}"] + [f"{metric:>20}" for metric in metrics]))
+    for row in rows:
+        print("  ".join([f"{row['plane_id'] or row['file']:<12}"] + [f"{row[m]:>20.3f}" for m in metrics]))
+    print(f"{matched}/{len(index.planes)} planes match ({elapsed:.1f} ms)")
+    return 0
+
+
+def run_report(args):
+    index_dir = args.index_dir or os.path.join(args.directory, FLEET_INDEX_DIR)
+    index = FleetIndex.open(index_dir)
+    if not index.planes:
+        print(f"No index in {index_dir} (run the index command first)", file=sys.stderr)
+        return 1
+    index.capability_options = {"samples": args.samples, "mode": args.interpolation, "band": args.band}
+    start = time.perf_counter()
+    try:
+        rows = index.query(args.condition, CAPABILITY_METRICS, args.sort, args.desc)
+    except (KeyError, ValueError) as e:
+        print(e.args[0] if e.args else e, file=sys.stderr)
+        return 2
+    elapsed = (time.perf_counter() - start) * 1000.0
+    matched = len(rows)
+    if args.limit:
+        rows = rows[:args.limit]
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, ["plane_id", "file"] + list(CAPABILITY_METRICS))
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    widths = [max(len(metric), 9) for metric in CAPABILITY_METRICS]
+    print("  ".join([f"{'plane':<12}"] + [f"{m:>{w}}" for m, w in zip(CAPABILITY_METRICS, widths)]))
+    for row in rows:
+        print("  ".join(
+            [f"{row['plane_id'] or row['file']:<12}"]
+            + [f"{row[m]:>{w}.2f}" for m, w in zip(CAPABILITY_METRICS, widths)]
+        ))
+    print(f"{matched}/{len(index.planes)} planes analysed in {elapsed:.1f} ms ({args.interpolation})")
+    return 0
+
+
+def known_digests(directory):
+    # file name → (mtime_ns, size, digest) from the directory's fleet index
+    try:
+        planes = read_json(os.path.join(directory, FLEET_INDEX_DIR, "meta.json"))["planes"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    return {plane["file"]: (plane["mtime_ns"], plane["size"], plane["digest"]) for plane in planes}
+
+
+def cached_digest(path, known, engine_version):
+    # The indexed digest when the file's (mtime, size) still match it
+    stamp = known.get(os.path.basename(path))
+    if stamp is not None and config_stamp(path) == tuple(stamp[:2]):
+        return stamp[2]
+    return config_digest(path, engine_version)
+
+
+def diff_config_pair(left, right, options):
+    # Runs in a worker process; always returns a result instead of raising
+    result = {"file": os.path.basename(right), "left": left, "right": right,
+              "ok": False, "identical": False, "changes": [], "error": None}
+    with WorkerJob(result, options) as job:
+        engine_version = options["engine_version"]
+        if (cached_digest(left, options["left_digests"], engine_version)
+                == cached_digest(right, options["right_digests"], engine_version)):
+            result["identical"] = True
+        else:
+            result["changes"] = diff_documents(job.load(left)[0], job.load(right)[0])
+            result["identical"] = not result["changes"]
+        result["ok"] = True
+    return result
+
+
+def format_diff_value(value):
+    if isinstance(value, dict):
+        return "(" + ", ".join(f"{value[axis]:g}" for axis in VECTOR_AXES) + ")"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+def print_changes(changes, indent="  "):
+    for change in changes:
+        name = change["name"]
+        if change["change"] == "added":
+            print(f"{indent}+ {name} = {format_diff_value(change['new'])}")
+        elif change["change"] == "removed":
+            print(f"{indent}- {name} (was {format_diff_value(change['old'])})")
+        else:
+            delta = change["delta"]
+            if isinstance(delta, dict):
+                delta = ", ".join(f"{axis}{delta[axis]:+g}" for axis in VECTOR_AXES if delta[axis])
+            elif delta is not None:
+                delta = f"{delta:+g}"
+            suffix = f"  [{delta}]" if delta else ""
+            print(f"{indent}~ {name}: {format_diff_value(change['old'])} → "
+                  f"{format_diff_value(change['new'])}{suffix}")
+
+
+def run_diff(args):
+    # Exit status like diff(1): 0 identical, 1 different, 2 trouble
+    config = read_config()
+    options = dict(conversion_options(args, config), left_digests={}, right_digests={})
+    if os.path.isfile(args.left) and os.path.isfile(args.right):
+        results = [diff_config_pair(args.left, args.right, options)]
+        only_left = only_right = []
+    elif os.path.isdir(args.left) and os.path.isdir(args.right):
+        # Paired by name without extension, so a .json can be compared to a .uasset
+        left = {os.path.splitext(os.path.basename(p))[0]: p
+                for p in reversed(find_config_files(args.left, args.pattern))}
+        right = {os.path.splitext(os.path.basename(p))[0]: p
+                 for p in reversed(find_config_files(args.right, args.pattern))}
+        only_left = sorted(set(left) - set(right))
+        only_right = sorted(set(right) - set(left))
+        common = sorted(set(left) & set(right))
+        options["left_digests"] = known_digests(args.left)
+        options["right_digests"] = known_digests(args.right)
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(
+                diff_config_pair, [left[k] for k in common], [right[k] for k in common],
+                [options] * len(common)
+            ))
+    else:
+        print("Give two config files or two directories", file=sys.stderr)
+        return 2
+    failures = [result for result in results if not result["ok"]]
+    different = [result for result in results if result["ok"] and not result["identical"]]
+    if args.json:
+        print(json.dumps({"only_left": only_left, "only_right": only_right, "files": results}, indent=2))
+    else:
+        for name in only_left:
+            print(f"ONLY  {name} (left)")
+        for name in only_right:
+            print(f"ONLY  {name} (right)")
+        for result in results:
+            if not result["ok"]:
+                print(f"FAIL  {result['file']}: {result['error']}")
+            elif not result["identical"]:
+                counts = {}
+                for change in result["changes"]:
+                    counts[change["change"]] = counts.get(change["change"], 0) + 1
+                print(f"DIFF  {result['file']} (" + ", ".join(
+                    f"{count} {kind}" for kind, count in sorted(counts.items())
+                ) + ")")
+                if not args.summary:
+                    print_changes(result["changes"])
+        if len(results) > 1 or only_left or only_right:
+            identical = len(results) - len(different) - len(failures)
+            print(f"{len(different)} different, {identical} identical, "
+                  f"{len(only_left) + len(only_right)} unpaired, {len(failures)} failed")
+    if failures:
+        return 2
+    return 1 if different or only_left or only_right else 0
+
+
+def run_merge(args):
+    options = conversion_options(args, read_config())
+    out = args.out or args.ours
+    result = {"ok": False, "error": None}
+    with WorkerJob(result, options) as job:
+        documents = [job.load(path) for path in (args.base, args.ours, args.theirs)]
+        merged, taken, conflicts = merge_documents(
+            documents[0][0], documents[1][0], documents[2][0], args.prefer
+        )
+        for conflict in conflicts:
+            print(f"CONFLICT  {conflict['name']}: base {format_diff_value(conflict['base'])}, "
+                  f"ours {format_diff_value(conflict['ours'])}, "
+                  f"theirs {format_diff_value(conflict['theirs'])}")
+        if not args.dry_run:
+            if out.endswith(".uasset"):
+                _, ours_json, ours_native = documents[1]
+                json_path = ours_json
+                if ours_native is None and json_path in (None, args.ours):
+                    # A .json OURS is an input: UAssetGUI converts a temp copy
+                    json_path = f"{out}.{os.getpid()}.tmp.json"
+                    job.temp_paths.append(json_path)
+                save_document(
+                    merged, json_path, out, options["uassetgui_path"], ours_native, options["timeout"]
+                )
+            else:
+                replace_json(merged, out)
+        result["ok"] = True
+    if not result["ok"]:
+        print(f"FAIL  {result['error']}", file=sys.stderr)
+        return 2
+    if args.report:
+        write_json({"taken": taken, "conflicts": conflicts}, args.report)
+    target = "(dry run)" if args.dry_run else f"into {out}"
+    print(f"{len(taken)} change(s) merged {target}, {len(conflicts)} conflict(s) "
+          f"({args.prefer} kept)")
+    return 1 if conflicts else 0
+
+
+def validate_config_file(path, options):
+    # Runs in a worker process; always returns a result instead of raising
+    result = {"path": path, "ok": False, "issues": [], "error": None}
+    with WorkerJob(result, options) as job:
+        result["stamp"] = config_stamp(path)
+        result["digest"] = config_digest(path, options["engine_version"])
+        data, _, _ = job.load(path)
+        result["issues"] = Validator(options["rules"]).run(data)
+        result["ok"] = True
+    return result
+
+
+def run_validate(args):
+    # Exit status: 0 clean, 1 errors (or warnings with --strict), 2 failures
+    config = read_config()
+    rules = read_validation_rules(config, args.rules)
+    validator = Validator(rules)
+    results_cache = None
+    if not args.no_cache:
+        results_cache = ValidationCache(
+            os.path.join(config.get("cache_dir", DEFAULT_CACHE_DIR), "validation.json")
+        )
+    options = dict(conversion_options(args, config), rules=validator.rules)
+    if os.path.isdir(args.path):
+        files = find_config_files(args.path, args.pattern)
+    else:
+        files = [args.path]
+    start = time.perf_counter()
+    results = {}
+    pending = []
+    for path in files:
+        # Unchanged files (same stamp → same digest) are answered from the
+        # cache; touched or copied ones by their content hash, still unparsed
+        issues = None
+        if results_cache is not None:
+            try:
+                stamp = config_stamp(path)
+                digest = results_cache.known_digest(path, stamp)
+                if digest is not None:
+                    issues = results_cache.get(digest, validator.digest)
+                if issues is None:
+                    digest = config_digest(path, options["engine_version"])
+                    issues = results_cache.get(digest, validator.digest)
+                    if issues is not None:
+                        results_cache.put(path, stamp, digest, validator.digest, issues)
+            except OSError:
+                pass
+        if issues is None:
+            pending.append(path)
+        else:
+            results[path] = {"path": path, "ok": True, "issues": issues, "error": None, "cached": True}
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(validate_config_file, path, options) for path in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result["path"]] = result
+                if result["ok"] and results_cache is not None:
+                    results_cache.put(result["path"], result["stamp"], result["digest"],
+                                      validator.digest, result["issues"])
+    if results_cache is not None:
+        results_cache.save()
+    results = [results[path] for path in files]
+    failures = [result for result in results if not result["ok"]]
+    totals = count_severities(issue for result in results for issue in result["issues"])
+    if args.json:
+        print(json.dumps([
+            {key: result.get(key) for key in ("path", "ok", "issues", "error")} for result in results
+        ], indent=2))
+    else:
+        for result in results:
+            name = os.path.basename(result["path"])
+            if not result["ok"]:
+                print(f"FAIL  {name}: {result['error']}")
+                continue
+            issues = [issue for issue in result["issues"]
+                      if not args.errors_only or issue["severity"] == "error"]
+            if issues:
+                print(name)
+            for issue in issues:
+                print(f"  {issue['severity']:<8} {issue['name']}: {issue['message']}")
+        cached = sum(1 for result in results if result.get("cached"))
+        print(f"{len(results)} file(s) validated in {time.perf_counter() - start:.2f}s "
+              f"({cached} cached): {totals['error']} error(s), {totals['warning']} warning(s), "
+              f"{len(failures)} failed")
+    if failures:
+        return 2
+    return 1 if totals["error"] or (args.strict and totals["warning"]) else 0
+
+
+def run_serve(args):
+    config = read_config()
+    options = conversion_options(args, config)
+    store = DocumentStore(options, options_cache(options), args.max_documents, args.root)
+    if args.socket:
+        if RpcUnixServer is None:
+            print("Unix sockets are not available on this platform", file=sys.stderr)
+            return 2
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        server = RpcUnixServer(args.socket, RpcHandler)
+        os.chmod(args.socket, 0o600)
+        address = args.socket
+    else:
+        server = RpcTcpServer((args.host, args.port), RpcHandler)
+        address = f"{args.host}:{server.server_address[1]}"
+    server.store = store
+    server.token = args.token or secrets.token_urlsafe(16)
+    print(f"Serving {store.root} on {address} (Ctrl+C to stop)", flush=True)
+    print(f"Token: {server.token}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+        unsaved = store.shutdown()
+    for path in unsaved:
+        print(f"UNSAVED  {path}", file=sys.stderr)
+    return 1 if unsaved else 0
+
+
+def run_charts(args):
+    config = read_config()
+    out_dir = args.out or os.path.join(args.directory, "charts")
+    index_dir = args.index_dir or os.path.join(args.directory, FLEET_INDEX_DIR)
+    options = conversion_options(args, config)
+    start = time.perf_counter()
+    # The fleet index is the parsed-data cache: only changed configs are read
+    index = FleetIndex.open(index_dir)
+    stats = index.update(args.directory, args.pattern, options, args.workers)
+    index.save()
+    for result in stats["failed"]:
+        print(f"FAIL  {os.path.basename(result['path'])}: {result['error']}")
+    axis = AXIS_ALIASES.get(args.axis.lower(), args.axis.upper())
+    if axis not in VECTOR_AXES:
+        print(f"Unknown axis: {args.axis}", file=sys.stderr)
+        return 2
+    chart_options = {"format": args.format, "dpi": args.dpi, "axis": axis}
+    series = [chart_series(index.row(i)) for i in range(len(index.planes))]
+    index.capability_options = {"mode": config.get("curve_interpolation", "linear")}
+    results = index.capabilities() if series else {}
+    jobs = []   # (file name, series list, caption, caption rows)
+    for i, plane in enumerate(series):
+        rows = {title: template.format(**{m: float(results[m][i]) for m in CAPABILITY_METRICS})
+                for title, template in CAPABILITY_ROWS[:3]}
+        jobs.append((f"{plane['label']}.{args.format}", [plane], plane["label"], rows))
+    for number, text in enumerate(args.overlay, 1):
+        name, patterns = parse_overlay(text)
+        planes = [plane for plane in series
+                  if any(fnmatch.fnmatchcase(plane["label"], p) for p in patterns)]
+        if not planes:
+            print(f"No planes match overlay {text!r}", file=sys.stderr)
+            continue
+        name = name or f"overlay_{number}"
+        caption = ", ".join(plane["label"] for plane in planes)
+        jobs.append((f"{name}.{args.format}", planes, name, {"Planes": caption}))
+    # Skip charts whose data and options hash like the last run's
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, CHART_MANIFEST)
+    try:
+        manifest = read_json(manifest_path)
+    except (OSError, ValueError):
+        manifest = {}
+    digests = {file: chart_digest(planes, chart_options) for file, planes, _, _ in jobs}
+    todo = [
+        (file, planes) for file, planes, _, _ in jobs
+        if args.force or manifest.get(file) != digests[file]
+        or not os.path.exists(os.path.join(out_dir, file))
+    ]
+    failed = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {
+                pool.submit(render_chart, planes, os.path.join(out_dir, file), chart_options): file
+                for file, planes in todo
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if not result["ok"]:
+                    failed.append(futures[future])
+                    print(f"FAIL  {futures[future]}: {result['error']}")
+    # Charts of planes that are gone (or renamed) are removed
+    for file in set(manifest) - set(digests):
+        if os.path.exists(os.path.join(out_dir, file)):
+            os.remove(os.path.join(out_dir, file))
+    replace_json({file: digest for file, digest in digests.items() if file not in failed}, manifest_path)
+    write_contact_sheet(
+        os.path.join(out_dir, CONTACT_SHEET), os.path.basename(os.path.abspath(args.directory)),
+        [(file, caption, rows) for file, _, caption, rows in jobs if file not in failed]
+    )
+    print(
+        f"{len(jobs)} charts in {time.perf_counter() - start:.2f}s: "
+        f"{len(todo) - len(failed)} rendered, {len(jobs) - len(todo)} unchanged, "
+        f"{len(failed)} failed → {os.path.join(out_dir, CONTACT_SHEET)}"
+    )
+    return 1 if failed or stats["failed"] else 0
+
+
+def run_verify_native(args):
+    # Round-trips every asset through the native reader/writer and, when
+    # UAssetGUI is available, checks both readers extract the same values.
+    uassetgui_path = args.uassetgui or read_config().get("uassetgui_path")
+    files = [
+        path for path in find_config_files(args.directory, args.pattern)
+        if path.endswith(".uasset")
+    ]
+    if not files:
+        print(f"No .uasset files matching {args.pattern} in {args.directory}", file=sys.stderr)
+        return 1
+    failures = 0
+    for path in files:
+        name = os.path.basename(path)
+        try:
+            asset = NativeAsset.from_files(path, args.engine_version)
+        except NativeAssetError as e:
+            print(f"SKIP  {name}: {e}")
+            continue
+        problems = []
+        if not verify_native_round_trip(path, args.engine_version):
+            problems.append("round trip is not byte-identical")
+        if uassetgui_path:
+            data, json_path, _ = load_document(
+                path, uassetgui_path, args.engine_version, native=False
+            )
+            os.remove(json_path)
+            if extract_parameters(data)[0] != extract_parameters(asset.to_document())[0]:
+                problems.append("parameters differ from UAssetGUI")
+        if problems:
+            failures += 1
+            print(f"FAIL  {name}: {', '.join(problems)}")
+        else:
+            print(f"OK    {name}")
+    return 1 if failures else 0
+
+
+def open_pak(path):
+    try:
+        return PakArchive(path)
+    except (OSError, NativeAssetError) as e:
+        print(f"Cannot open {path}: {e}", file=sys.stderr)
+        return None
+
+
+def pak_output_ok(args):
+    # The source stays mapped while the new pak is written
+    if not args.out:
+        print("--out is required", file=sys.stderr)
+        return False
+    if os.path.abspath(args.out) == os.path.abspath(args.pak):
+        print("--out must not be the source pak", file=sys.stderr)
+        return False
+    return True
+
+
+def pak_compression(name):
+    # "keep" → None: every replaced member keeps its own method
+    return None if name == "keep" else PAK_COMPRESSION_METHODS[name]
+
+
+def patch_pak_member(pak_path, name, patch, options):
+    # Runs in a worker process; always returns a result instead of raising.
+    # The member is read from the mapped pak and never touches the disk.
+    result = {"name": name, "ok": False, "changed": 0, "error": None, "files": None}
+    with WorkerJob(result, options):
+        with PakArchive(pak_path) as pak:
+            asset = pak.load_asset(name, options["engine_version"])
+        data = asset.to_document()
+        result["changed"] = len(apply_patch(data, patch))
+        if result["changed"] and not options["dry_run"]:
+            uasset_bytes, uexp_bytes = asset.serialize(data)
+            result["files"] = {name: uasset_bytes, uexp_path_for(name): uexp_bytes}
+        result["ok"] = True
+    return result
+
+
+def run_pak_list(args):
+    pak = open_pak(args.pak)
+    if pak is None:
+        return 2
+    rows = []
+    failures = 0
+    with pak:
+        for name in pak.find(args.pattern):
+            members = [name, uexp_path_for(name)]
+            entries = [pak.entries.get(member) for member in members]
+            row = {
+                "name": name,
+                "plane_id": plane_id_from_path(name),
+                "size": sum(entry.uncompressed_size for entry in entries if entry),
+                "stored": sum(entry.size for entry in entries if entry),
+                "compression": "zlib" if entries[0].compression == PAK_COMPRESSION_ZLIB else "none",
+                "uexp": entries[1] is not None
+            }
+            if args.verify:
+                row["ok"] = entries[1] is not None and all(pak.verify(member) for member in members)
+                failures += not row["ok"]
+            rows.append(row)
+        if args.json:
+            print(json_dumps(rows))
+            return 1 if failures else 0
+        for row in rows:
+            flag = ""
+            if not row["uexp"]:
+                flag = "  (no .uexp)"
+            elif args.verify and not row["ok"]:
+                flag = "  CHECKSUM MISMATCH"
+            print(f"{row['plane_id'] or '-':<10} {row['size']:>10} {row['compression']:<5} {row['name']}{flag}")
+        print(f"{len(rows)} config(s) in {pak.name} ({len(pak.entries)} members, "
+              f"pak version {pak.version}, mount point {pak.mount_point!r})")
+    return 1 if failures else 0
+
+
+def run_pak_extract(args):
+    pak = open_pak(args.pak)
+    if pak is None:
+        return 2
+    out_dir = args.out or os.path.splitext(args.pak)[0]
+    os.makedirs(out_dir, exist_ok=True)
+    failures = 0
+    with pak:
+        names = pak.find(args.pattern)
+        for name in names:
+            target = os.path.join(out_dir, posixpath.basename(name))
+            try:
+                write_file_pair(target, pak.read(name), pak.read(uexp_path_for(name)))
+                print(f"OK    {posixpath.basename(name)}")
+            except (OSError, NativeAssetError) as e:
+                failures += 1
+                print(f"FAIL  {posixpath.basename(name)}: {e}")
+    print(f"{len(names) - failures}/{len(names)} configs extracted to {out_dir}")
+    return 1 if failures else 0
+
+
+def run_pak_patch(args):
+    if not args.dry_run and not pak_output_ok(args):
+        return 2
+    try:
+        patch = build_patch(args)
+    except (OSError, ValueError) as e:
+        print(f"Invalid patch: {e}", file=sys.stderr)
+        return 2
+    pak = open_pak(args.pak)
+    if pak is None:
+        return 2
+    options = {"engine_version": args.engine_version, "dry_run": args.dry_run}
+    replacements = {}
+    results = []
+    with pak:
+        names = pak.find(args.pattern)
+        if not names:
+            print(f"No members matching {args.pattern} in {pak.name}", file=sys.stderr)
+            return 1
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(patch_pak_member, args.pak, name, patch, options) for name in names]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                name = posixpath.basename(result["name"])
+                if result["ok"]:
+                    replacements.update(result["files"] or {})
+                    print(f"OK    {name} ({result['changed']} changed)")
+                else:
+                    print(f"FAIL  {name}: {result['error']}")
+        suffix = " (dry run)"
+        if not args.dry_run and replacements:
+            try:
+                count = pak.repack(args.out, replacements, pak_compression(args.compression))
+            except (OSError, NativeAssetError) as e:
+                print(f"FAIL  {type(e).__name__}: {e}", file=sys.stderr)
+                return 2
+            suffix = f", {count} members written to {args.out}"
+        elif not args.dry_run:
+            suffix = f", nothing changed so {args.out} was not written"
+    failures = sum(1 for result in results if not result["ok"])
+    print(f"{len(names) - failures}/{len(names)} configs patched{suffix}")
+    if args.report:
+        results.sort(key=lambda result: result["name"])
+        write_json([{k: v for k, v in result.items() if k != "files"} for result in results], args.report)
+    return 1 if failures else 0
+
+
+def run_pak_repack(args):
+    # Swaps loose .uasset/.uexp files from a directory in for the pak
+    # members with the same file name
+    if not pak_output_ok(args):
+        return 2
+    pak = open_pak(args.pak)
+    if pak is None:
+        return 2
+    replacements = {}
+    with pak:
+        for name in pak.find(args.pattern):
+            loose = os.path.join(args.directory, posixpath.basename(name))
+            if not os.path.exists(loose):
+                continue
+            if not os.path.exists(uexp_path_for(loose)):
+                print(f"SKIP  {os.path.basename(loose)}: no .uexp next to it")
+                continue
+            for member, path in ((name, loose), (uexp_path_for(name), uexp_path_for(loose))):
+                with open(path, "rb") as f:
+                    replacements[member] = f.read()
+            print(f"OK    {os.path.basename(loose)}")
+        try:
+            count = pak.repack(args.out, replacements, pak_compression(args.compression))
+        except (OSError, NativeAssetError) as e:
+            print(f"FAIL  {type(e).__name__}: {e}", file=sys.stderr)
+            return 2
+    print(f"{len(replacements) // 2} config(s) replaced, {count} members written to {args.out}")
+    return 0
+
+
+def add_conversion_args(parser, workers=True, cache_help="always run UAssetGUI tojson"):
+    # The flags conversion_options reads; cache_help=None leaves out
+    # --no-cache for commands that never use the conversion cache
+    parser.add_argument("--uassetgui", help="UAssetGUI executable (default: config.json)")
+    parser.add_argument("--engine-version", default=DEFAULT_ENGINE_VERSION)
+    if workers:
+        parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float,
+                        help="seconds before a UAssetGUI conversion is killed")
+    if cache_help is not None:
+        parser.add_argument("--no-cache", action="store_true", help=cache_help)
+    parser.add_argument("--native", action="store_true",
+                        help="read and write .uasset files natively, with UAssetGUI as the fallback")
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="AC7CA",
+        description="PlayerPlaneConfig editor. Starts the GUI when no command is given."
+    )
+    commands = parser.add_subparsers(dest="command")
+    # ---------------- batch ----------------
+    batch = commands.add_parser(
+        "batch",
+        help="apply a parameter patch to every config in a directory"
+    )
+    batch.add_argument("directory")
+    batch.add_argument("--patch", help="JSON or CSV file of name → value (and scale factors)")
+    batch.add_argument("--set", action="append", default=[], type=split_assignment,
+                       metavar="NAME=VALUE", help="e.g. MaxSpeed=1200 or SpeedRot3.X=1.5")
+    batch.add_argument("--scale", action="append", default=[], type=split_assignment,
+                       metavar="NAME=FACTOR", help="e.g. SpeedRot=1.1 or SpeedRot.Z=0.9")
+    batch.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                       help="filename pattern without extension")
+    batch.add_argument("--out", help="write results here instead of in place")
+    add_conversion_args(batch)
+    batch.add_argument("--report", help="write per-file results as JSON")
+    batch.add_argument("--dry-run", action="store_true")
+    batch.set_defaults(func=run_batch)
+    # ---------------- reid ----------------
+    reid = commands.add_parser(
+        "reid",
+        help="copy (or move) configs to new PlaneIDs"
+    )
+    reid.add_argument("directory")
+    reid.add_argument("--map", action="append", default=[], type=split_assignment,
+                      metavar="OLD=NEW", help="e.g. PL001=PL101")
+    reid.add_argument("--range", action="append", default=[], type=expand_id_range,
+                      metavar="OLD1-OLD2=NEW1", help="e.g. PL001-PL040=PL101")
+    reid.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                      help="filename pattern without extension")
+    reid.add_argument("--out", help="write the new configs here instead of next to the old ones")
+    reid.add_argument("--move", action="store_true", help="delete the old configs afterwards")
+    reid.add_argument("--force", action="store_true", help="overwrite existing targets")
+    add_conversion_args(reid, cache_help=None)
+    reid.add_argument("--report", help="write per-file results as JSON")
+    reid.add_argument("--dry-run", action="store_true",
+                      help="list the references that would change")
+    reid.set_defaults(func=run_reid)
+    # ---------------- index / query ----------------
+    index = commands.add_parser(
+        "index",
+        help="build or refresh the fleet index of a directory of configs"
+    )
+    index.add_argument("directory")
+    index.add_argument("--index-dir", help=f"default: <directory>/{FLEET_INDEX_DIR}")
+    index.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                       help="filename pattern without extension")
+    add_conversion_args(index)
+    index.set_defaults(func=run_index)
+    query = commands.add_parser(
+        "query",
+        help="filter indexed planes, e.g. \"max(SpeedRot.pitch) > 40\""
+    )
+    query.add_argument("directory")
+    query.add_argument("condition", nargs="?",
+                       help="METRIC OP NUMBER [and ...]; METRIC is a scalar parameter, "
+                            "max/min/mean/len(Curve[.axis]) or a report metric")
+    query.add_argument("--index-dir", help=f"default: <directory>/{FLEET_INDEX_DIR}")
+    query.add_argument("--show", action="append", default=[], metavar="METRIC",
+                       help="extra metric to print")
+    query.add_argument("--sort", metavar="METRIC")
+    query.add_argument("--desc", action="store_true")
+    query.add_argument("--limit", type=int)
+    query.add_argument("--json", action="store_true")
+    query.set_defaults(func=run_query)
+    report = commands.add_parser(
+        "report",
+        help="capability metrics (peak rates, corner band, gravity penalties) of indexed planes"
+    )
+    report.add_argument("directory")
+    report.add_argument("condition", nargs="?",
+                        help="only report planes matching a query condition")
+    report.add_argument("--index-dir", help=f"default: <directory>/{FLEET_INDEX_DIR}")
+    report.add_argument("--interpolation", choices=INTERPOLATION_MODES, default="linear")
+    report.add_argument("--samples", type=int, default=DEFAULT_CAPABILITY_SAMPLES,
+                        help="resampling points between the first and last SpeedGraph knot")
+    report.add_argument("--band", type=float, default=DEFAULT_CORNER_BAND,
+                        help="corner band: fraction of the peak pitch rate (default 0.9)")
+    report.add_argument("--sort", metavar="METRIC")
+    report.add_argument("--desc", action="store_true")
+    report.add_argument("--limit", type=int)
+    report.add_argument("--csv", help="also write the report as CSV")
+    report.add_argument("--json", action="store_true")
+    report.set_defaults(func=run_report)
+    # ---------------- diff / merge ----------------
+    diff = commands.add_parser(
+        "diff",
+        help="compare two configs (or two directories of configs) parameter by parameter"
+    )
+    diff.add_argument("left")
+    diff.add_argument("right")
+    diff.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                      help="filename pattern without extension (directories)")
+    diff.add_argument("--summary", action="store_true", help="only list the files that differ")
+    diff.add_argument("--json", action="store_true")
+    add_conversion_args(diff, cache_help=None)
+    diff.set_defaults(func=run_diff)
+    merge = commands.add_parser(
+        "merge",
+        help="three-way merge: apply the changes from BASE to THEIRS onto OURS"
+    )
+    merge.add_argument("base")
+    merge.add_argument("ours")
+    merge.add_argument("theirs")
+    merge.add_argument("--out", help="default: overwrite OURS")
+    merge.add_argument("--prefer", choices=("ours", "theirs"), default="ours",
+                       help="side kept for conflicting parameters")
+    merge.add_argument("--report", help="write taken changes and conflicts as JSON")
+    merge.add_argument("--dry-run", action="store_true")
+    add_conversion_args(merge, workers=False, cache_help=None)
+    merge.set_defaults(func=run_merge)
+    # ---------------- validate ----------------
+    validate = commands.add_parser(
+        "validate",
+        help="check a config or a directory of configs against the validation rules"
+    )
+    validate.add_argument("path")
+    validate.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                          help="filename pattern without extension (directories)")
+    validate.add_argument("--rules", help="JSON list of rules (default: config.json or built-in)")
+    validate.add_argument("--errors-only", action="store_true", help="do not list warnings")
+    validate.add_argument("--strict", action="store_true", help="warnings fail the run too")
+    validate.add_argument("--json", action="store_true")
+    add_conversion_args(
+        validate, cache_help="re-validate every file and always run UAssetGUI tojson"
+    )
+    validate.set_defaults(func=run_validate)
+    # ---------------- charts ----------------
+    charts = commands.add_parser(
+        "charts",
+        help="render the curve charts of every config in a directory, with an HTML contact sheet"
+    )
+    charts.add_argument("directory")
+    charts.add_argument("--out", help="default: <directory>/charts")
+    charts.add_argument("--format", choices=CHART_FORMATS, default="png")
+    charts.add_argument("--dpi", type=int, default=100)
+    charts.add_argument("--overlay", action="append", default=[],
+                        help="[NAME=]ID,ID*,... planes drawn together in one chart (repeatable)")
+    charts.add_argument("--axis", default="pitch",
+                        help="SpeedRot/RotGravR axis drawn in overlays (pitch/yaw/roll or X/Y/Z)")
+    charts.add_argument("--force", action="store_true", help="render unchanged charts too")
+    charts.add_argument("--index-dir", help=f"default: <directory>/{FLEET_INDEX_DIR}")
+    charts.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                        help="filename pattern without extension")
+    add_conversion_args(charts)
+    charts.set_defaults(func=run_charts)
+    # ---------------- serve ----------------
+    serve = commands.add_parser(
+        "serve",
+        help="keep configs open in memory for scripts (JSON-RPC over localhost or a Unix socket)"
+    )
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_SERVER_PORT, help="0 picks a free port")
+    serve.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    serve.add_argument("--max-documents", type=int, default=DEFAULT_SERVER_DOCUMENTS,
+                       help="open documents kept in memory (unsaved ones are never dropped)")
+    serve.add_argument("--root", help="only files under this folder can be opened or written "
+                                      "(default: the current folder)")
+    serve.add_argument("--token", help="the token clients must send with auth() "
+                                       "(default: a random one, printed at startup)")
+    add_conversion_args(serve, workers=False)
+    serve.set_defaults(func=run_serve)
+    # ---------------- pak ----------------
+    pak = commands.add_parser(
+        "pak",
+        help="list, extract, patch or repack configs inside a UE4.18 .pak without extracting it"
+    )
+    pak_commands = pak.add_subparsers(dest="pak_command", required=True)
+    pak_list = pak_commands.add_parser("list", help="list the configs in a pak")
+    pak_list.add_argument("pak")
+    pak_list.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                          help="filename pattern without extension")
+    pak_list.add_argument("--verify", action="store_true", help="check the SHA-1 of every member")
+    pak_list.add_argument("--json", action="store_true")
+    pak_list.set_defaults(func=run_pak_list)
+    pak_extract = pak_commands.add_parser("extract", help="write the configs out as loose files")
+    pak_extract.add_argument("pak")
+    pak_extract.add_argument("--out", help="default: a folder named after the pak")
+    pak_extract.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                             help="filename pattern without extension")
+    pak_extract.set_defaults(func=run_pak_extract)
+    pak_patch = pak_commands.add_parser(
+        "patch",
+        help="apply a parameter patch to the configs in a pak and write a new pak"
+    )
+    pak_patch.add_argument("pak")
+    pak_patch.add_argument("--out", help="the new pak")
+    pak_patch.add_argument("--patch", help="JSON or CSV file of name → value (and scale factors)")
+    pak_patch.add_argument("--set", action="append", default=[], type=split_assignment,
+                           metavar="NAME=VALUE", help="e.g. MaxSpeed=1200 or SpeedRot3.X=1.5")
+    pak_patch.add_argument("--scale", action="append", default=[], type=split_assignment,
+                           metavar="NAME=FACTOR", help="e.g. SpeedRot=1.1 or SpeedRot.Z=0.9")
+    pak_patch.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                           help="filename pattern without extension")
+    pak_patch.add_argument("--compression", choices=("keep",) + tuple(PAK_COMPRESSION_METHODS),
+                           default="keep", help="for the patched members")
+    pak_patch.add_argument("--engine-version", default=DEFAULT_ENGINE_VERSION)
+    pak_patch.add_argument("--workers", type=int, default=None)
+    pak_patch.add_argument("--report", help="write per-config results as JSON")
+    pak_patch.add_argument("--dry-run", action="store_true")
+    pak_patch.set_defaults(func=run_pak_patch)
+    pak_repack = pak_commands.add_parser(
+        "repack",
+        help="write a new pak with configs replaced by loose files from a folder"
+    )
+    pak_repack.add_argument("pak")
+    pak_repack.add_argument("directory", help="folder of edited .uasset/.uexp files")
+    pak_repack.add_argument("--out", help="the new pak")
+    pak_repack.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*",
+                            help="filename pattern without extension")
+    pak_repack.add_argument("--compression", choices=("keep",) + tuple(PAK_COMPRESSION_METHODS),
+                            default="keep", help="for the replaced members")
+    pak_repack.set_defaults(func=run_pak_repack)
+    # ---------------- verify-native ----------------
+    verify = commands.add_parser(
+        "verify-native",
+        help="check the native .uasset reader/writer against a folder of assets"
+    )
+    verify.add_argument("directory")
+    verify.add_argument("--pattern", default=PLANE_CONFIG_PREFIX + "*")
+    verify.add_argument("--uassetgui", help="also compare against UAssetGUI's JSON")
+    verify.add_argument("--engine-version", default=DEFAULT_ENGINE_VERSION)
+    verify.set_defaults(func=run_verify_native)
+    return parser
+
+
+def main(argv=None):
+    # Runs one command without loading Tk; AC7CA.main starts the GUI when
+    # no command is given
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.error("a command is required")
+    return args.func(args)
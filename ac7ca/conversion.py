@@ -0,0 +1,305 @@
+# Getting documents in and out of .uasset files: UAssetGUI runs, the
+# native reader, the content-addressed conversion cache, and the options
+# and job wrapper shared by worker processes.
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from .documents import DEFAULT_ENGINE_VERSION, read_json, uexp_path_for, write_json
+from .native import NativeAsset, NativeAssetError
+from .profiling import profiled
+
+
+DEFAULT_CACHE_DIR = ".ac7ca_cache"
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CONVERSION_TIMEOUT_S = 120
+
+
+# ---------------- UAssetGUI ----------------
+
+class OperationCancelled(Exception):
+    pass
+
+
+def run_process(cmd, timeout=None, cancel_event=None):
+    # subprocess.run(check=True) that can also be cancelled from another
+    # thread; the process is killed on cancel or timeout.
+    process = subprocess.Popen(cmd)
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        try:
+            code = process.wait(timeout=0.1)
+            break
+        except subprocess.TimeoutExpired:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            expired = deadline is not None and time.monotonic() > deadline
+            if cancelled or expired:
+                process.kill()
+                process.wait()
+                if cancelled:
+                    raise OperationCancelled(f"{os.path.basename(cmd[0])} {cmd[1]} cancelled")
+                raise subprocess.TimeoutExpired(cmd, timeout)
+    if code:
+        raise subprocess.CalledProcessError(code, cmd)
+
+
+@profiled("UAssetGUI tojson")
+def uasset_to_json(uassetgui_path, uasset_path, json_path, engine_version=DEFAULT_ENGINE_VERSION,
+                   timeout=None, cancel_event=None):
+    run_process([
+        uassetgui_path,
+        "tojson",
+        uasset_path,
+        json_path,
+        engine_version
+    ], timeout, cancel_event)
+
+
+@profiled("UAssetGUI fromjson")
+def json_to_uasset(uassetgui_path, json_path, uasset_path, timeout=None, cancel_event=None):
+    run_process([
+        uassetgui_path,
+        "fromjson",
+        json_path,
+        uasset_path
+    ], timeout, cancel_event)
+
+
+def convert_to_uasset(uassetgui_path, json_path, uasset_path, timeout=None, cancel_event=None):
+    # UAssetGUI writes a temp pair next to the target which is then renamed
+    # into place, so a failed or cancelled conversion leaves the old files.
+    temp_path = f"{os.path.splitext(uasset_path)[0]}.{os.getpid()}.tmp.uasset"
+    try:
+        json_to_uasset(uassetgui_path, json_path, temp_path, timeout, cancel_event)
+        if os.path.exists(uexp_path_for(temp_path)):
+            os.replace(uexp_path_for(temp_path), uexp_path_for(uasset_path))
+        os.replace(temp_path, uasset_path)
+    finally:
+        for path in (temp_path, uexp_path_for(temp_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# ---------------- Documents ----------------
+
+@profiled("load_document")
+def load_document(path, uassetgui_path=None, engine_version=DEFAULT_ENGINE_VERSION,
+                  cache=None, native=False, timeout=None, cancel_event=None):
+    # Returns (data, json_path, native_asset). A .uasset is read natively
+    # when possible (json_path is then None); otherwise it is converted by
+    # UAssetGUI into a temp JSON file the caller is responsible for.
+    if path.endswith(".json"):
+        return read_json(path), path, None
+    native_error = None
+    if native:
+        try:
+            asset = NativeAsset.from_files(path, engine_version)
+            return asset.to_document(), None, asset
+        except NativeAssetError as e:
+            native_error = e
+    temp_json = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
+    temp_json.close()
+    try:
+        key = None
+        cached = None
+        if cache is not None:
+            key = asset_digest(path, engine_version)
+            cached = cache.get(key)
+        if cached:
+            shutil.copyfile(cached, temp_json.name)
+        else:
+            if not uassetgui_path:
+                if native_error:
+                    raise RuntimeError(f"{native_error}. Please set UAssetGUI.exe to open this asset.")
+                raise RuntimeError("Please set UAssetGUI.exe first.")
+            uasset_to_json(
+                uassetgui_path, path, temp_json.name, engine_version, timeout, cancel_event
+            )
+            if cache is not None:
+                cache.put(key, temp_json.name)
+        return read_json(temp_json.name), temp_json.name, None
+    except Exception:
+        os.remove(temp_json.name)
+        raise
+
+
+@profiled("save_document")
+def save_document(data, json_path, uasset_path=None, uassetgui_path=None, native_asset=None,
+                  timeout=None, cancel_event=None):
+    if native_asset is not None:
+        native_asset.write(data, uasset_path)
+        return
+    write_json(data, json_path)
+    if uasset_path:
+        convert_to_uasset(uassetgui_path, json_path, uasset_path, timeout, cancel_event)
+
+
+# ---------------- Conversion cache ----------------
+
+def asset_digest(uasset_path, engine_version=DEFAULT_ENGINE_VERSION):
+    # Content address of a .uasset/.uexp pair for a given engine version
+    digest = hashlib.sha256(engine_version.encode("utf-8"))
+    for path in (uasset_path, uexp_path_for(uasset_path)):
+        digest.update(b"\0")
+        if not os.path.exists(path):
+            digest.update(b"missing")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_stamp(path):
+    # (mtime_ns, size) of a config, including the .uexp of a .uasset
+    paths = [path]
+    if path.endswith(".uasset") and os.path.exists(uexp_path_for(path)):
+        paths.append(uexp_path_for(path))
+    stats = [os.stat(p) for p in paths]
+    return max(s.st_mtime_ns for s in stats), sum(s.st_size for s in stats)
+
+
+def config_digest(path, engine_version=DEFAULT_ENGINE_VERSION):
+    if path.endswith(".uasset"):
+        return asset_digest(path, engine_version)
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ConversionCache:
+    # On-disk store of UAssetGUI tojson output keyed by asset_digest.
+    # File mtimes double as the LRU order so several processes can share
+    # one directory without a separate index.
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_MB << 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        self.hits += 1
+        os.utime(path)
+        return path
+
+    def put(self, key, json_path):
+        path = self.path_for(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(json_path, temp_path)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def discard(self, key):
+        if key and os.path.exists(self.path_for(key)):
+            os.remove(self.path_for(key))
+
+    def evict(self):
+        entries = []
+        total = 0
+        for item in os.scandir(self.directory):
+            if item.name.endswith(".json"):
+                stat = item.stat()
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+        entries.sort()
+        # Always keep the newest entry, even if it alone is over the limit
+        for _, size, path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+def open_conversion_cache(config):
+    # "cache_dir"/"cache_max_mb" in config.json; cache_max_mb 0 disables it
+    max_mb = config.get("cache_max_mb", DEFAULT_CACHE_MAX_MB)
+    if not max_mb:
+        return None
+    return ConversionCache(config.get("cache_dir", DEFAULT_CACHE_DIR), int(max_mb) << 20)
+
+
+# ---------------- Worker jobs ----------------
+
+def conversion_options(args, config):
+    # The load/save options set by add_conversion_args' flags; plain data
+    # so they can be passed to worker processes. Commands without
+    # --no-cache never use the conversion cache.
+    cache = None if getattr(args, "no_cache", True) else open_conversion_cache(config)
+    return {
+        "uassetgui_path": args.uassetgui or config.get("uassetgui_path"),
+        "engine_version": args.engine_version,
+        "native": args.native,
+        "timeout": args.timeout or config.get("conversion_timeout_s", DEFAULT_CONVERSION_TIMEOUT_S),
+        "cache_dir": cache.directory if cache else None,
+        "cache_max_bytes": cache.max_bytes if cache else 0
+    }
+
+
+def options_cache(options):
+    if not options.get("cache_dir"):
+        return None
+    return ConversionCache(options["cache_dir"], options["cache_max_bytes"])
+
+
+class WorkerJob:
+    # The body of a worker process's job. Used as a context manager it
+    # turns any exception into result["error"] and removes the temporary
+    # JSON files load() converted, so workers always return their result
+    # instead of raising:
+    #
+    #   with WorkerJob(result, options) as job:
+    #       data, json_path, native_asset = job.load(path)
+    #       ...
+    #       result["ok"] = True
+
+    def __init__(self, result, options):
+        self.result = result
+        self.options = options
+        self.cache = options_cache(options)
+        self.temp_paths = []
+
+    def load(self, path):
+        data, json_path, native_asset = load_document(
+            path, self.options["uassetgui_path"], self.options["engine_version"],
+            self.cache, self.options["native"], self.options["timeout"]
+        )
+        if json_path and json_path != path:
+            self.temp_paths.append(json_path)
+        return data, json_path, native_asset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if isinstance(exc, Exception):
+            self.result["error"] = f"{type(exc).__name__}: {exc}"
+        for path in self.temp_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        if self.cache is not None:
+            self.result["cache"] = self.cache.stats()
+        return isinstance(exc, Exception)
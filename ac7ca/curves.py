@@ -0,0 +1,335 @@
+# The plotted curves as arrays, and the capability metrics derived from
+# them.
+
+import re
+
+import numpy as np
+
+from .documents import VECTOR_AXES, get_table_values
+from .profiling import profiled
+
+
+# =====================================================
+# Curve Model
+# =====================================================
+# The four plotted curves as NumPy arrays. Every point remembers the
+# position of its Table Data entry, so reading or writing a point never
+# searches the document again.
+
+CURVE_PREFIXES = {
+    "speed_graph": "SpeedGraph",
+    "diff_nose": "DiffNoseVelocityR",
+    "speed_rot": "SpeedRot",
+    "rot_grav": "RotGravR"
+}
+VECTOR_CURVES = ("speed_rot", "rot_grav")
+CURVE_LINE_LABELS = {
+    "speed_rot": ("Pitch", "Yaw", "Roll"),
+    "rot_grav": ("Gravity (Upside Down)", "Gravity (Side)", "Unused")
+}
+CURVE_NAME_PATTERN = re.compile(r"(SpeedGraph|DiffNoseVelocityR|SpeedRot|RotGravR)(\d+)$")
+
+
+def split_curve_name(name):
+    # "SpeedRot12" → ("speed_rot", 12); anything else → (None, None)
+    match = CURVE_NAME_PATTERN.match(name)
+    if match is None:
+        return None, None
+    for curve, prefix in CURVE_PREFIXES.items():
+        if prefix == match.group(1):
+            return curve, int(match.group(2))
+
+
+def read_curve_entry(entry):
+    value = entry["Value"]
+    if isinstance(value, list):
+        vec = value[0]["Value"]
+        return [float(vec[axis]) for axis in VECTOR_AXES]
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class CurveModel:
+    # Rows follow the numeric suffix of the entry names, not their order in
+    # the file. speed_graph and diff_nose are (N,) arrays, speed_rot and
+    # rot_grav (M, 3); positions holds the Table Data index of every row
+    # (-1 where a DiffNoseVelocityR point is missing and reads as 0).
+
+    def __init__(self, data):
+        self.values = get_table_values(data)
+        found = {curve: {} for curve in CURVE_PREFIXES}
+        for position, entry in enumerate(self.values):
+            curve, index = split_curve_name(entry["Name"])
+            if curve is not None:
+                found[curve][index] = position
+        knots = sorted(found["speed_graph"])
+        self.indices = {
+            "speed_graph": knots,
+            "diff_nose": knots,
+            "speed_rot": sorted(found["speed_rot"]),
+            "rot_grav": sorted(found["rot_grav"])
+        }
+        self.arrays = {}
+        self.positions = {}
+        self.slots = {}   # parameter name → (curve, row)
+        for curve, indices in self.indices.items():
+            width = 3 if curve in VECTOR_CURVES else None
+            shape = (len(indices), width) if width else (len(indices),)
+            array = np.zeros(shape, dtype=float)
+            positions = np.full(len(indices), -1, dtype=np.int64)
+            for row, index in enumerate(indices):
+                position = found[curve].get(index)
+                if position is None:
+                    continue
+                positions[row] = position
+                array[row] = read_curve_entry(self.values[position])
+                self.slots[self.values[position]["Name"]] = (curve, row)
+            self.arrays[curve] = array
+            self.positions[curve] = positions
+        # Row of the SpeedGraph knot each vector row is plotted against
+        knot_rows = {index: row for row, index in enumerate(knots)}
+        self.knot_rows = {
+            curve: np.array([knot_rows.get(i, -1) for i in self.indices[curve]], dtype=np.int64)
+            for curve in CURVE_PREFIXES
+        }
+
+    @property
+    def speed_graph(self):
+        return self.arrays["speed_graph"]
+
+    @property
+    def diff_nose(self):
+        return self.arrays["diff_nose"]
+
+    @property
+    def speed_rot(self):
+        return self.arrays["speed_rot"]
+
+    @property
+    def rot_grav(self):
+        return self.arrays["rot_grav"]
+
+    def shape(self):
+        return tuple(len(self.arrays[curve]) for curve in CURVE_PREFIXES)
+
+    def speeds_for(self, curve):
+        # X values for a curve; NaN where the row has no SpeedGraph knot
+        rows = self.knot_rows[curve]
+        speeds = self.speed_graph[np.maximum(rows, 0)] if len(rows) else np.zeros(0)
+        return np.where(rows >= 0, speeds, np.nan)
+
+    def name_for(self, curve, row):
+        return f"{CURVE_PREFIXES[curve]}{self.indices[curve][row]}"
+
+    def refresh(self, name):
+        # Re-read one point after its JSON entry was written elsewhere.
+        # Returns the curve it belongs to, or None.
+        slot = self.slots.get(name)
+        if slot is None:
+            return None
+        curve, row = slot
+        self.arrays[curve][row] = read_curve_entry(self.values[self.positions[curve][row]])
+        return curve
+
+    def set_point(self, curve, row, value, axis_index=None):
+        # Writes the array and the JSON entry together. Returns the
+        # parameter name, or None when the point has no entry.
+        position = self.positions[curve][row]
+        if position < 0:
+            return None
+        entry = self.values[position]
+        value = float(value)
+        if axis_index is None:
+            self.arrays[curve][row] = value
+            entry["Value"] = value
+        else:
+            self.arrays[curve][row, axis_index] = value
+            entry["Value"][0]["Value"][VECTOR_AXES[axis_index]] = value
+        return entry["Name"]
+
+
+# =====================================================
+# Capability Analysis
+# =====================================================
+# Derived flight-model metrics, computed for many planes at once. Every
+# curve is resampled on a dense speed grid spanning the plane's SpeedGraph
+# knots (linear segments, or cubic Hermite segments with UE-style auto
+# tangents) and each metric is a reduction over that grid. The corner band
+# spans the speeds where the pitch rate is within `band` of its peak;
+# gravity penalties are RotGravR integrated over speed.
+
+CAPABILITY_AXES = ("pitch", "yaw", "roll")
+CAPABILITY_METRICS = (
+    "min_speed", "max_speed",
+    "peak_pitch_rate", "peak_pitch_speed", "peak_yaw_rate", "peak_yaw_speed",
+    "peak_roll_rate", "peak_roll_speed",
+    "corner_low", "corner_high",
+    "grav_inverted", "grav_side",
+    "peak_diff_nose", "mean_diff_nose"
+)
+INTERPOLATION_MODES = ("linear", "cubic")
+DEFAULT_CAPABILITY_SAMPLES = 256
+DEFAULT_CORNER_BAND = 0.9   # corner band: speeds within 90% of the peak pitch rate
+# Rows of the editor's capability panel: (title, str.format template)
+CAPABILITY_ROWS = (
+    ("Speed range", "{min_speed:.0f} – {max_speed:.0f}"),
+    ("Corner band", "{corner_low:.0f} – {corner_high:.0f}"),
+    ("Peak pitch", "{peak_pitch_rate:.2f} @ {peak_pitch_speed:.0f}"),
+    ("Peak yaw", "{peak_yaw_rate:.2f} @ {peak_yaw_speed:.0f}"),
+    ("Peak roll", "{peak_roll_rate:.2f} @ {peak_roll_speed:.0f}"),
+    ("DiffNose peak/mean", "{peak_diff_nose:.3f} / {mean_diff_nose:.3f}"),
+    ("Gravity ∫ upside down", "{grav_inverted:.1f}"),
+    ("Gravity ∫ side", "{grav_side:.1f}")
+)
+
+
+def sort_knots(x, y):
+    # x (P, K) speeds, y (P, K) or (P, K, C) values, NaN-padded → sorted
+    # copies with every incomplete knot moved to the end, y as (P, K, C),
+    # and the number of usable knots per plane
+    x = np.array(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 2:
+        y = y[:, :, None]
+    invalid = ~np.isfinite(x) | ~np.all(np.isfinite(y), axis=2)
+    x[invalid] = np.nan
+    order = np.argsort(x, axis=1, kind="stable")   # NaN sorts last
+    x = np.take_along_axis(x, order, axis=1)
+    y = np.take_along_axis(y, order[:, :, None], axis=1)
+    return x, y, np.sum(~invalid, axis=1)
+
+
+def knot_tangents(x, y, counts):
+    # Centred differences at inner knots, flat at the first and last one
+    m = np.zeros_like(y)
+    if x.shape[1] > 2:
+        dx = (x[:, 2:] - x[:, :-2])[:, :, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            m[:, 1:-1] = np.where(dx > 0, (y[:, 2:] - y[:, :-2]) / dx, 0.0)
+    last = np.arange(x.shape[1])[None, :] >= (counts - 1)[:, None]
+    m[last] = 0.0
+    return m
+
+
+def interpolate_knots(x, y, counts, grid, mode="linear"):
+    # Output of sort_knots evaluated at grid (P, S) → (P, S, C); NaN
+    # outside a plane's first..last knot
+    if mode not in INTERPOLATION_MODES:
+        raise ValueError(f"Unknown interpolation: {mode}")
+    planes, knots = x.shape
+    if knots < 2:
+        return np.full(grid.shape + (y.shape[2],), np.nan)
+    padded = np.where(np.isnan(x), np.inf, x)
+    segment = np.sum(padded[:, :, None] <= grid[:, None, :], axis=1) - 1
+    segment = np.clip(segment, 0, np.maximum(counts - 2, 0)[:, None])
+    x0 = np.take_along_axis(x, segment, axis=1)
+    x1 = np.take_along_axis(x, segment + 1, axis=1)
+    y0 = np.take_along_axis(y, segment[:, :, None], axis=1)
+    y1 = np.take_along_axis(y, segment[:, :, None] + 1, axis=1)
+    h = x1 - x0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(h > 0, (grid - x0) / h, 0.0)[:, :, None]
+    if mode == "linear":
+        values = y0 + t * (y1 - y0)
+    else:
+        m = knot_tangents(x, y, counts)
+        m0 = np.take_along_axis(m, segment[:, :, None], axis=1)
+        m1 = np.take_along_axis(m, segment[:, :, None] + 1, axis=1)
+        t2 = t * t
+        t3 = t2 * t
+        h = h[:, :, None]
+        values = ((2 * t3 - 3 * t2 + 1) * y0 + (t3 - 2 * t2 + t) * h * m0
+                  + (3 * t2 - 2 * t3) * y1 + (t3 - t2) * h * m1)
+    first = x[:, :1]
+    last = np.take_along_axis(x, np.maximum(counts - 1, 0)[:, None], axis=1)
+    inside = (counts[:, None] >= 2) & (grid >= first) & (grid <= last)
+    return np.where(inside[:, :, None], values, np.nan)
+
+
+def peak_along(values, grid):
+    # (P, S) → (max, grid value at the max), NaN for all-NaN rows
+    filled = np.where(np.isnan(values), -np.inf, values)
+    at = np.argmax(filled, axis=1)[:, None]
+    peak = np.take_along_axis(filled, at, axis=1)[:, 0]
+    found = np.isfinite(peak)
+    return np.where(found, peak, np.nan), np.where(found, np.take_along_axis(grid, at, axis=1)[:, 0], np.nan)
+
+
+def integrate_along(values, grid):
+    # Trapezoid integral over the grid, skipping undefined segments
+    segments = (values[:, 1:] + values[:, :-1]) * 0.5 * np.diff(grid, axis=1)
+    defined = np.isfinite(segments)
+    total = np.where(defined, segments, 0.0).sum(axis=1)
+    return np.where(defined.any(axis=1), total, np.nan)
+
+
+def knot_speeds(speed_graph, rows):
+    # SpeedGraph knot i for vector row i, NaN-padded to `rows` columns
+    speeds = np.full((len(speed_graph), rows), np.nan)
+    width = min(rows, speed_graph.shape[1])
+    speeds[:, :width] = speed_graph[:, :width]
+    return speeds
+
+
+@profiled("analyze_capabilities")
+def analyze_capabilities(speed_graph, diff_nose, speed_rot, rot_grav, rot_speeds=None,
+                         grav_speeds=None, samples=DEFAULT_CAPABILITY_SAMPLES, mode="linear",
+                         band=DEFAULT_CORNER_BAND):
+    # NaN-padded arrays as stored in FleetIndex.curves: speed_graph and
+    # diff_nose (P, K), speed_rot and rot_grav (P, M, 3). Vector rows sit
+    # at SpeedGraph knot i unless rot_speeds / grav_speeds give their
+    # speeds. Returns {metric: (P,) array} for CAPABILITY_METRICS.
+    speed_graph = np.asarray(speed_graph, dtype=float).reshape(len(speed_graph), -1)
+    speed_rot = np.asarray(speed_rot, dtype=float).reshape(len(speed_graph), -1, 3)
+    rot_grav = np.asarray(rot_grav, dtype=float).reshape(len(speed_graph), -1, 3)
+    if rot_speeds is None:
+        rot_speeds = knot_speeds(speed_graph, speed_rot.shape[1])
+    if grav_speeds is None:
+        grav_speeds = knot_speeds(speed_graph, rot_grav.shape[1])
+    finite = np.isfinite(speed_graph)
+    known = finite.any(axis=1)
+    low = np.where(known, np.where(finite, speed_graph, np.inf).min(axis=1, initial=np.inf), np.nan)
+    high = np.where(known, np.where(finite, speed_graph, -np.inf).max(axis=1, initial=-np.inf), np.nan)
+    grid = low[:, None] + (high - low)[:, None] * np.linspace(0.0, 1.0, samples)[None, :]
+    # The knots themselves are on the grid, so linear peaks are exact
+    grid = np.sort(np.concatenate([grid, np.where(finite, speed_graph, high[:, None])], axis=1), axis=1)
+
+    def resample(x, y):
+        return interpolate_knots(*sort_knots(x, y), grid, mode)
+
+    nose = resample(speed_graph, np.asarray(diff_nose, dtype=float).reshape(speed_graph.shape))[:, :, 0]
+    rot = resample(rot_speeds, speed_rot)
+    grav = resample(grav_speeds, rot_grav)
+    results = {"min_speed": low, "max_speed": high}
+    for axis, name in enumerate(CAPABILITY_AXES):
+        peak, speed = peak_along(rot[:, :, axis], grid)
+        results[f"peak_{name}_rate"] = peak
+        results[f"peak_{name}_speed"] = speed
+    pitch = rot[:, :, 0]
+    with np.errstate(invalid="ignore"):
+        in_band = pitch >= band * results["peak_pitch_rate"][:, None]
+    banded = in_band.any(axis=1)
+    results["corner_low"] = np.where(banded, np.where(in_band, grid, np.inf).min(axis=1), np.nan)
+    results["corner_high"] = np.where(banded, np.where(in_band, grid, -np.inf).max(axis=1), np.nan)
+    results["grav_inverted"] = integrate_along(grav[:, :, 0], grid)
+    results["grav_side"] = integrate_along(grav[:, :, 1], grid)
+    results["peak_diff_nose"] = peak_along(nose, grid)[0]
+    defined = np.isfinite(nose)
+    count = defined.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        results["mean_diff_nose"] = np.where(defined, nose, 0.0).sum(axis=1) / np.where(count, count, np.nan)
+    return results
+
+
+def curve_model_capabilities(model, samples=DEFAULT_CAPABILITY_SAMPLES, mode="linear",
+                             band=DEFAULT_CORNER_BAND):
+    # One plane's CurveModel → {metric: float}
+    results = analyze_capabilities(
+        model.speed_graph[None, :], model.diff_nose[None, :],
+        model.speed_rot[None, :], model.rot_grav[None, :],
+        model.speeds_for("speed_rot")[None, :], model.speeds_for("rot_grav")[None, :],
+        samples, mode, band
+    )
+    return {name: float(values[0]) for name, values in results.items()}
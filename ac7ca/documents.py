@@ -0,0 +1,605 @@
+# Config documents in UAssetGUI's JSON form: config.json, JSON reading and
+# writing, Table Data entries and their values, parameter patches and
+# PlaneIDs. Nothing in the ac7ca package imports tkinter; the editor lives
+# in AC7CA.py.
+
+import copy
+import fnmatch
+import functools
+import json
+import os
+import re
+
+try:
+    import orjson   # optional: a faster JSON parser/encoder
+except ImportError:
+    orjson = None
+
+from .profiling import profiled
+
+
+CONFIG_FILE = "config.json"
+DEFAULT_ENGINE_VERSION = "VER_UE4_18"
+PLANE_CONFIG_PREFIX = "PlayerPlaneConfig_"
+VECTOR_AXES = ("X", "Y", "Z")
+
+
+# =====================================================
+# Config File
+# =====================================================
+
+def read_config():
+    if os.path.exists(CONFIG_FILE):
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    return {}
+
+
+def write_config(config):
+    with open(CONFIG_FILE, "w") as f:
+        json.dump(config, f, indent=2)
+
+
+# =====================================================
+# Document Handling
+# =====================================================
+
+def get_table_values(data):
+    return data["Exports"][0]["Table"]["Data"][0]["Value"]
+
+
+# ---------------- JSON ----------------
+# orjson is used when it is installed (AC7CA_JSON=stdlib forces the stdlib
+# module). Both backends write the same bytes: documents orjson would
+# encode differently (NaN/Infinity, floats repr() prints with an exponent,
+# non-ASCII text, huge integers) are written by the stdlib.
+
+JSON_BACKEND = "orjson" if orjson is not None and os.environ.get("AC7CA_JSON") != "stdlib" else "stdlib"
+JSON_DECODER = json.JSONDecoder()
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBERED_FNAME_PATTERN = re.compile(r"(.+)(_\d+)$")
+
+
+def json_loads(raw):
+    if JSON_BACKEND == "orjson":
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass   # NaN / Infinity literals are only accepted by the stdlib
+    return json.loads(raw)
+
+
+def orjson_floats_match(value):
+    # True when every float in value is finite and in the range where repr()
+    # uses no exponent; orjson writes NaN as null and "1e-05" as "1e-5"
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, float) and not 1e-4 <= abs(item) < 1e16 and item != 0.0:
+            return False
+    return True
+
+
+def json_dumps(value):
+    if JSON_BACKEND == "orjson" and orjson_floats_match(value):
+        try:
+            text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            text = None   # e.g. integers beyond 64 bits
+        # The stdlib escapes everything past ASCII 0x7E
+        if text is not None and text.isascii() and "\x7f" not in text:
+            return text
+    return json.dumps(value, indent=2)
+
+
+@profiled("read_json")
+def read_json(path):
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+@profiled("write_json")
+def write_json(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json_dumps(data))
+
+
+def replace_json(data, path):
+    # Written beside the target and renamed over it in one step
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write_json(data, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def json_skip(text, i):
+    # End of the JSON value starting at i (decoded by the C scanner)
+    try:
+        return JSON_DECODER.scan_once(text, i)[1]
+    except StopIteration:
+        raise ValueError(f"Invalid JSON value at offset {i}") from None
+
+
+def json_value_span(text, path):
+    # (start, end) of the value at path (object keys and list indices),
+    # skipping over everything that comes before it on the way down
+    i = JSON_WHITESPACE.match(text, 0).end()
+    for key in path:
+        if isinstance(key, str):
+            if text[i] != "{":
+                raise ValueError(f"Expected an object for {key!r}")
+            i = JSON_WHITESPACE.match(text, i + 1).end()
+            while True:
+                if text[i] != '"':
+                    raise KeyError(key)
+                name, i = json.decoder.scanstring(text, i + 1)
+                i = JSON_WHITESPACE.match(text, i).end()
+                if text[i] != ":":
+                    raise ValueError(f"Expected ':' at offset {i}")
+                i = JSON_WHITESPACE.match(text, i + 1).end()
+                if name == key:
+                    break
+                i = JSON_WHITESPACE.match(text, json_skip(text, i)).end()
+                if text[i] != ",":
+                    raise KeyError(key)
+                i = JSON_WHITESPACE.match(text, i + 1).end()
+        else:
+            if text[i] != "[":
+                raise ValueError(f"Expected a list for index {key}")
+            i = JSON_WHITESPACE.match(text, i + 1).end()
+            for _ in range(key):
+                i = JSON_WHITESPACE.match(text, json_skip(text, i)).end()
+                if text[i] != ",":
+                    raise IndexError(key)
+                i = JSON_WHITESPACE.match(text, i + 1).end()
+    return i, json_skip(text, i)
+
+
+def json_array_items(text, start):
+    # [(value, start, end)] for each item of the list opening at start
+    if text[start] != "[":
+        raise ValueError(f"Expected a list at offset {start}")
+    items = []
+    i = JSON_WHITESPACE.match(text, start + 1).end()
+    if text[i] == "]":
+        return items
+    while True:
+        try:
+            value, end = JSON_DECODER.scan_once(text, i)
+        except StopIteration:
+            raise ValueError(f"Invalid JSON value at offset {i}") from None
+        items.append((value, i, end))
+        i = JSON_WHITESPACE.match(text, end).end()
+        if text[i] == "]":
+            return items
+        if text[i] != ",":
+            raise ValueError(f"Expected ',' at offset {i}")
+        i = JSON_WHITESPACE.match(text, i + 1).end()
+
+
+class JsonSource:
+    # The text a document was loaded from. render() re-encodes only the
+    # NameMap and the Table Data entries that differ from it and splices
+    # them in; everything else keeps its original bytes, so an unchanged
+    # document comes back identical. The items of both lists are decoded
+    # once, on the first render, and carried over to the next source.
+    SPLICED_PATHS = (("NameMap",), ("Exports", 0, "Table", "Data", 0, "Value"))
+
+    def __init__(self, text, sections=None):
+        self.text = text
+        self.sections = sections   # [(start, end, path, items)], sorted by start
+        self.newline = "\r\n" if "\r\n" in text[:65536] else "\n"
+
+    @classmethod
+    def read(cls, path):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return cls(f.read())
+
+    def parse(self):
+        return json_loads(self.text)
+
+    def locate(self):
+        if self.sections is None:
+            sections = []
+            for path in self.SPLICED_PATHS:
+                start, end = json_value_span(self.text, path)
+                sections.append((start, end, path, json_array_items(self.text, start)))
+            self.sections = sorted(sections, key=lambda section: section[0])
+        return self.sections
+
+    def encode(self, value, start):
+        # value as indent=2 JSON continuing the indentation of the line at start
+        line_start = self.text.rfind("\n", 0, start) + 1
+        line = self.text[line_start:start]
+        indent = line[:len(line) - len(line.lstrip())]
+        return json_dumps(value).replace("\n", self.newline + indent)
+
+    def render_section(self, start, end, value, items, base):
+        # Returns (text, items) for the list at start..end, whose output
+        # begins at offset base; items is None when it has to be rescanned
+        if not isinstance(value, list) or not items or len(value) < len(items):
+            return self.encode(value, start), None
+        pieces = []
+        new_items = []
+        cursor = start
+        shift = base - start   # output offset minus input offset
+        for (old, item_start, item_end), new in zip(items, value):
+            if old == new:
+                new_items.append((old, item_start + shift, item_end + shift))
+                continue
+            encoded = self.encode(new, item_start)
+            new_items.append((copy.deepcopy(new), item_start + shift, item_start + shift + len(encoded)))
+            pieces += (self.text[cursor:item_start], encoded)
+            shift += len(encoded) - (item_end - item_start)
+            cursor = item_end
+        # Appended items (new NameMap entries) go after the last one, laid
+        # out like the gap between the last two
+        last_start, last_end = items[-1][1:]
+        pieces.append(self.text[cursor:last_end])
+        if len(items) > 1:
+            separator = self.text[items[-2][2]:last_start]
+        else:
+            separator = "," + self.text[start + 1:last_start]
+        for new in value[len(items):]:
+            encoded = self.encode(new, last_start)
+            item_start = last_end + shift + len(separator)
+            new_items.append((copy.deepcopy(new), item_start, item_start + len(encoded)))
+            pieces += (separator, encoded)
+            shift += len(separator) + len(encoded)
+        pieces.append(self.text[last_end:end])
+        return "".join(pieces), new_items
+
+    def render(self, data):
+        # Returns (text, sections) for data; falls back to a full encode when
+        # the loaded text does not have the expected layout
+        try:
+            pieces = []
+            sections = []
+            cursor = 0
+            offset = 0
+            for start, end, path, items in self.locate():
+                value = data
+                for key in path:
+                    value = value[key]
+                if items is None:
+                    items = json_array_items(self.text, start)
+                head = self.text[cursor:start]
+                offset += len(head)
+                body, body_items = self.render_section(start, end, value, items, offset)
+                sections.append((offset, offset + len(body), path, body_items))
+                offset += len(body)
+                pieces += (head, body)
+                cursor = end
+        except (ValueError, KeyError, IndexError, TypeError):
+            return json_dumps(data), None
+        pieces.append(self.text[cursor:])
+        return "".join(pieces), sections
+
+
+@profiled("save_json")
+def save_json(data, path, source=None):
+    # Writes data to path, splicing into source's text when given, and
+    # returns the JsonSource for the next save
+    text, sections = source.render(data) if source is not None else (json_dumps(data), None)
+    write_json_text(text, path)
+    return JsonSource(text, sections)
+
+
+def write_json_text(text, path):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def canonical_json(value):
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+# ---------------- Files ----------------
+
+def find_config_files(directory, pattern=PLANE_CONFIG_PREFIX + "*"):
+    files = []
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in (".json", ".uasset") and fnmatch.fnmatch(stem, pattern):
+            files.append(os.path.join(directory, name))
+    return files
+
+
+def uexp_path_for(uasset_path):
+    return os.path.splitext(uasset_path)[0] + ".uexp"
+
+
+def remove_config_files(path):
+    # Deletes a config and, for a .uasset, its .uexp
+    os.remove(path)
+    if path.endswith(".uasset") and os.path.exists(uexp_path_for(path)):
+        os.remove(uexp_path_for(path))
+
+
+# ---------------- Entries ----------------
+
+def enum_label(value):
+    # "EType::Value" → "Value"
+    return str(value).partition("::")[2] or str(value)
+
+
+def parse_entry(entry, enum_types=None):
+    name = entry["Name"]
+    value = entry["Value"]
+    entry_type = entry.get("$type", "")
+    # ---------------- ENUM ----------------
+    if "EnumPropertyData" in entry_type:
+        if enum_types is not None:
+            enum_types[name] = entry["EnumType"]
+        return value  # current enum value (string)
+    # ---------------- BOOL ----------------
+    elif isinstance(value, bool):
+        return value
+    # ---------------- NUMBER / STRING ----------------
+    elif isinstance(value, (int, float, str)):
+        try:
+            return round(float(value), 3)
+        except (TypeError, ValueError):
+            return value
+    # ---------------- VECTOR ----------------
+    elif isinstance(value, list):
+        vec = value[0]["Value"]
+        return {
+            "X": round(float(vec["X"]), 3),
+            "Y": round(float(vec["Y"]), 3),
+            "Z": round(float(vec["Z"]), 3)
+        }
+    return None
+
+
+@profiled("extract_parameters")
+def extract_parameters(data):
+    # Returns (parameters, enum_types, entry_index); entry_index maps each
+    # parameter name to its position in the Table Data list.
+    parameters = {}
+    enum_types = {}
+    entry_index = {}
+    for index, entry in enumerate(get_table_values(data)):
+        value = parse_entry(entry, enum_types)
+        if value is None:
+            continue
+        parameters[entry["Name"]] = value
+        entry_index[entry["Name"]] = index
+    return parameters, enum_types, entry_index
+
+
+class NameIndex:
+    # Hash set over a document's NameMap plus its "Type::Value" names
+    # grouped by type; kept in step by add(), rebuilt when the list is
+    # replaced wholesale (undo, merges).
+
+    def __init__(self, names):
+        self.names = names
+        self.rebuild()
+
+    def rebuild(self):
+        self.known = set()
+        self.by_type = {}
+        for name in self.names or ():
+            self.index(name)
+
+    def index(self, name):
+        self.known.add(name)
+        enum_type, sep, _ = name.partition("::")
+        if sep:
+            self.by_type.setdefault(enum_type, []).append(name)
+
+    def __contains__(self, name):
+        return name in self.known
+
+    def add(self, name):
+        if self.names is None or name in self.known:
+            return False
+        self.names.append(name)
+        self.index(name)
+        return True
+
+    def enum_values(self, enum_type):
+        # Value names without the "Type::" prefix, in NameMap order
+        prefix = len(enum_type) + 2
+        return [name[prefix:] for name in self.by_type.get(enum_type, ())]
+
+
+def ensure_name_in_namemap(data, name_string, names=None):
+    # names: the document's NameIndex, if the caller keeps one
+    if names is not None:
+        names.add(name_string)
+        return
+    if "NameMap" not in data:
+        return
+    if name_string not in data["NameMap"]:
+        data["NameMap"].append(name_string)
+
+
+def set_entry_value(data, entry, value, names=None):
+    # Writes a raw value (widget text, number, {axis: value} or a 3-item
+    # list for vectors) into a Table Data entry. Non-numeric scalars are
+    # stored as-is, like the inspector always did.
+    # -------- ENUM --------
+    if "EnumPropertyData" in entry.get("$type", ""):
+        enum_value = str(value)
+        if "::" not in enum_value:
+            enum_value = f"{entry['EnumType']}::{enum_value}"
+        ensure_name_in_namemap(data, enum_value, names)
+        entry["Value"] = enum_value
+    # -------- VECTOR --------
+    elif isinstance(entry["Value"], list):
+        vec = entry["Value"][0]["Value"]
+        if isinstance(value, (list, tuple)) and len(value) == len(VECTOR_AXES):
+            value = dict(zip(VECTOR_AXES, value))
+        if not isinstance(value, dict) or not set(value) <= set(VECTOR_AXES):
+            raise ValueError(
+                f"{entry['Name']} is a vector: give {{axis: value}} for {'/'.join(VECTOR_AXES)} "
+                f"or {len(VECTOR_AXES)} values, not {value!r}"
+            )
+        for axis, axis_value in value.items():
+            try:
+                vec[axis] = float(axis_value)
+            except (TypeError, ValueError):
+                pass
+    # -------- BOOL --------
+    elif isinstance(entry["Value"], bool):
+        if isinstance(value, str):
+            value = value.strip().lower() in ("1", "true", "yes")
+        entry["Value"] = bool(value)
+    # -------- NORMAL --------
+    else:
+        try:
+            entry["Value"] = float(value)
+        except (TypeError, ValueError):
+            entry["Value"] = value
+
+
+def scale_entry_value(entry, factor):
+    # factor is a number, or {axis: number} for vectors
+    value = entry["Value"]
+    if isinstance(value, list):
+        vec = value[0]["Value"]
+        if not isinstance(factor, dict):
+            factor = {axis: factor for axis in VECTOR_AXES}
+        for axis, axis_factor in factor.items():
+            vec[axis] = float(vec[axis]) * float(axis_factor)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        entry["Value"] = float(value) * float(factor)
+    else:
+        raise ValueError(f"{entry['Name']} is not numeric")
+
+
+@functools.lru_cache(maxsize=256)
+def parameter_matcher(pattern):
+    # "SpeedRot" matches SpeedRot0..SpeedRotN, anything else is an
+    # exact name or an fnmatch pattern; compiled once per pattern.
+    return re.compile(f"{fnmatch.translate(pattern)}|{re.escape(pattern)}\\d+\\Z")
+
+
+def matches_parameter(pattern, name):
+    return parameter_matcher(pattern).match(name) is not None
+
+
+def apply_patch(data, patch, entry_index=None, names=None):
+    # patch = {"set": {name: value}, "scale": {name or curve: factor}}
+    # Returns the names of the entries that were touched. Callers that keep
+    # a document open pass its entry_index and NameIndex.
+    values = get_table_values(data)
+    if entry_index is None:
+        _, _, entry_index = extract_parameters(data)
+    if names is None:
+        names = NameIndex(data.get("NameMap"))
+    changed = []
+    for name, value in patch.get("set", {}).items():
+        if name not in entry_index:
+            raise KeyError(f"Unknown parameter: {name}")
+        set_entry_value(data, values[entry_index[name]], value, names)
+        changed.append(name)
+    for pattern, factor in patch.get("scale", {}).items():
+        matcher = parameter_matcher(pattern)
+        matched = [n for n in entry_index if matcher.match(n)]
+        if not matched:
+            raise KeyError(f"No parameter matches: {pattern}")
+        for name in matched:
+            scale_entry_value(values[entry_index[name]], factor)
+            changed.append(name)
+    return changed
+
+
+# ---------------- PlaneID ----------------
+
+def plane_id_from_path(path):
+    # "PlayerPlaneConfig_PL001.uasset" → "PL001"; None for other names
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if not stem.startswith(PLANE_CONFIG_PREFIX):
+        return None
+    return stem[len(PLANE_CONFIG_PREFIX):]
+
+
+def plane_id_pattern(plane_id):
+    # The ID as a whole token: matches "PlayerPlaneConfig_PL001" and
+    # "/PL001/", not "PL0010" or "XPL001"
+    return re.compile(r"(?<![A-Za-z0-9])" + re.escape(plane_id) + r"(?![A-Za-z0-9])")
+
+
+def find_plane_id_refs(data, old_id, new_id):
+    # The strings that name the asset, as (container, key, old, new, location):
+    # NameMap entries carrying old_id, FolderName, and FName values equal to
+    # a renamed NameMap entry (object names, import paths, name properties).
+    # Any other string carrying old_id is only reported, as (location, value)
+    # in mentions: free text and unrelated names are left alone.
+    pattern = plane_id_pattern(old_id)
+    refs = []
+    mentions = []
+    renamed = {}
+    names = data.get("NameMap") or []
+    for index, name in enumerate(names):
+        updated = pattern.sub(new_id, name)
+        if updated != name:
+            renamed[name] = updated
+            refs.append((names, index, name, updated, f"NameMap[{index}]"))
+
+    def visit(container, key, location):
+        value = container[key]
+        if isinstance(value, str):
+            updated = renamed.get(value)
+            if updated is None:
+                # FNames with a number serialize as "Name_N"
+                match = NUMBERED_FNAME_PATTERN.match(value)
+                if match and match.group(1) in renamed:
+                    updated = renamed[match.group(1)] + match.group(2)
+            if updated is not None:
+                refs.append((container, key, value, updated, location))
+            elif pattern.search(value):
+                mentions.append((location, value))
+        elif isinstance(value, dict):
+            for child in value:
+                if child != "$type":
+                    visit(value, child, f"{location}.{child}")
+        elif isinstance(value, list):
+            for index in range(len(value)):
+                visit(value, index, f"{location}[{index}]")
+
+    for key in data:
+        if key == "FolderName" and isinstance(data[key], str):
+            updated = pattern.sub(new_id, data[key])
+            if updated != data[key]:
+                refs.append((data, key, data[key], updated, key))
+        elif key not in ("$type", "NameMap"):
+            visit(data, key, key)
+    return refs, mentions
+
+
+def reid_document(data, old_id, new_id):
+    # Rewrites the PlaneID in place; returns the refs so a failed save can
+    # be rolled back with restore_plane_id_refs, and the mentions it kept.
+    refs, mentions = find_plane_id_refs(data, old_id, new_id)
+    for container, key, old, new, location in refs:
+        container[key] = new
+    return refs, mentions
+
+
+def restore_plane_id_refs(refs):
+    for container, key, old, new, location in refs:
+        container[key] = old
+
+
+def reid_target_path(path, new_id, out_dir=None):
+    ext = os.path.splitext(path)[1]
+    return os.path.join(out_dir or os.path.dirname(path), PLANE_CONFIG_PREFIX + new_id + ext)
@@ -0,0 +1,274 @@
+# One row per plane config in a directory, stored as .npy columns so
+# queries run on memory-mapped arrays without touching the assets.
+# Curves are NaN-padded to the longest curve in the fleet.
+
+import os
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .conversion import WorkerJob, config_digest, config_stamp
+from .curves import (
+    CAPABILITY_METRICS, CURVE_PREFIXES, CurveModel, VECTOR_CURVES, analyze_capabilities
+)
+from .documents import (
+    VECTOR_AXES, extract_parameters, find_config_files, plane_id_from_path, read_json,
+    replace_json
+)
+
+
+FLEET_INDEX_DIR = ".ac7ca_index"
+AXIS_ALIASES = {"pitch": "X", "yaw": "Y", "roll": "Z"}
+METRIC_PATTERN = re.compile(r"(max|min|mean|len)\((\w+)(?:\.(\w+))?\)$")
+CONDITION_PATTERN = re.compile(r"(.+?)\s*(>=|<=|==|!=|>|<)\s*(-?[\d.]+(?:e-?\d+)?)$")
+CONDITION_OPERATORS = {
+    ">": np.greater, ">=": np.greater_equal, "<": np.less,
+    "<=": np.less_equal, "==": np.equal, "!=": np.not_equal
+}
+
+
+def index_config_file(path, options):
+    # Runs in a worker process; always returns a result instead of raising
+    result = {"path": path, "ok": False, "error": None}
+    with WorkerJob(result, options) as job:
+        result["mtime_ns"], result["size"] = config_stamp(path)
+        result["digest"] = config_digest(path, options["engine_version"])
+        data, _, _ = job.load(path)
+        parameters, enum_types, _ = extract_parameters(data)
+        curves = CurveModel(data)
+        scalars = {}
+        enums = {}
+        for name, value in parameters.items():
+            if name in curves.slots:
+                continue
+            if isinstance(value, dict):
+                for axis in VECTOR_AXES:
+                    scalars[f"{name}.{axis}"] = value[axis]
+            elif isinstance(value, str):
+                enums[name] = value
+            else:
+                scalars[name] = float(value)
+        result["scalars"] = scalars
+        result["enums"] = enums
+        result["curves"] = {curve: curves.arrays[curve].tolist() for curve in CURVE_PREFIXES}
+        result["ok"] = True
+    return result
+
+
+class FleetIndex:
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.planes = []    # per row: file, plane_id, mtime_ns, size, digest, enums
+        self.columns = []   # scalar column names
+        self.column_index = {}
+        self.scalars = np.zeros((0, 0))
+        self.curves = {
+            curve: np.zeros((0, 0, 3) if curve in VECTOR_CURVES else (0, 0))
+            for curve in CURVE_PREFIXES
+        }
+        self.lengths = np.zeros((0, len(CURVE_PREFIXES)), dtype=np.int64)
+        self.capability_options = {}   # samples / mode / band for capability metrics
+        self.capability_cache = None
+
+    @classmethod
+    def open(cls, directory):
+        # An index whose arrays do not match meta.json is treated as empty
+        index = cls(directory)
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return index
+        meta = read_json(meta_path)
+        try:
+            scalars = np.load(os.path.join(directory, "scalars.npy"), mmap_mode="r")
+            curves = {
+                curve: np.load(os.path.join(directory, f"{curve}.npy"), mmap_mode="r")
+                for curve in CURVE_PREFIXES
+            }
+            lengths = np.load(os.path.join(directory, "lengths.npy"))
+        except (OSError, ValueError):
+            return index
+        if scalars.shape != (len(meta["planes"]), len(meta["columns"])):
+            return index
+        index.planes = meta["planes"]
+        index.columns = meta["columns"]
+        index.column_index = {name: i for i, name in enumerate(index.columns)}
+        index.scalars = scalars
+        index.curves = curves
+        index.lengths = lengths
+        return index
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        arrays = dict(self.curves, scalars=self.scalars, lengths=self.lengths)
+        for name, array in arrays.items():
+            path = os.path.join(self.directory, f"{name}.npy")
+            temp_path = f"{path}.{os.getpid()}.tmp.npy"
+            np.save(temp_path, np.ascontiguousarray(array))
+            os.replace(temp_path, path)
+        # meta.json goes last and is what open() trusts
+        replace_json({"planes": self.planes, "columns": self.columns},
+                     os.path.join(self.directory, "meta.json"))
+
+    def row(self, i):
+        # One plane back in the shape index_config_file returns
+        plane = self.planes[i]
+        scalars = {
+            name: float(value) for name, value in zip(self.columns, self.scalars[i])
+            if not np.isnan(value)
+        }
+        curves = {
+            curve: np.asarray(self.curves[curve][i, :self.lengths[i, c]]).tolist()
+            for c, curve in enumerate(CURVE_PREFIXES)
+        }
+        return dict(plane, scalars=scalars, curves=curves)
+
+    def set_rows(self, rows):
+        # Rebuilds every array from row dicts (cheap for a few hundred planes)
+        self.capability_cache = None
+        columns = sorted({name for row in rows for name in row["scalars"]})
+        self.columns = columns
+        self.column_index = {name: i for i, name in enumerate(columns)}
+        self.scalars = np.full((len(rows), len(columns)), np.nan)
+        self.lengths = np.zeros((len(rows), len(CURVE_PREFIXES)), dtype=np.int64)
+        width = max([len(row["curves"][curve]) for row in rows for curve in CURVE_PREFIXES] + [0])
+        for curve in CURVE_PREFIXES:
+            shape = (len(rows), width, 3) if curve in VECTOR_CURVES else (len(rows), width)
+            self.curves[curve] = np.full(shape, np.nan)
+        self.planes = []
+        for i, row in enumerate(rows):
+            for name, value in row["scalars"].items():
+                self.scalars[i, self.column_index[name]] = value
+            for c, curve in enumerate(CURVE_PREFIXES):
+                values = row["curves"][curve]
+                self.lengths[i, c] = len(values)
+                if values:
+                    self.curves[curve][i, :len(values)] = values
+            self.planes.append({
+                key: row[key] for key in ("file", "plane_id", "mtime_ns", "size", "digest", "enums")
+            })
+
+    def update(self, source_dir, pattern, options, workers=None):
+        # Re-extracts only configs whose (mtime, size) and content hash both
+        # changed; returns counts and the failed results.
+        known = {plane["file"]: i for i, plane in enumerate(self.planes)}
+        rows = []
+        todo = []
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": []}
+        files = find_config_files(source_dir, pattern)
+        for path in files:
+            name = os.path.basename(path)
+            i = known.get(name)
+            if i is not None:
+                plane = self.planes[i]
+                mtime_ns, size = config_stamp(path)
+                if (plane["mtime_ns"], plane["size"]) == (mtime_ns, size):
+                    rows.append(self.row(i))
+                    stats["unchanged"] += 1
+                    continue
+                if config_digest(path, options["engine_version"]) == plane["digest"]:
+                    rows.append(dict(self.row(i), mtime_ns=mtime_ns, size=size))
+                    stats["unchanged"] += 1
+                    continue
+            todo.append(path)
+        stats["removed"] = len(set(known) - {os.path.basename(path) for path in files})
+        if todo:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for result in pool.map(index_config_file, todo, [options] * len(todo)):
+                    if not result["ok"]:
+                        stats["failed"].append(result)
+                        continue
+                    name = os.path.basename(result["path"])
+                    stats["updated" if name in known else "added"] += 1
+                    rows.append(dict(
+                        result, file=name, plane_id=plane_id_from_path(result["path"])
+                    ))
+        rows.sort(key=lambda row: row["file"])
+        self.set_rows(rows)
+        return stats
+
+    # ---------------- Queries ----------------
+
+    def capabilities(self):
+        # analyze_capabilities over every plane, kept until the rows change
+        key = tuple(sorted(self.capability_options.items()))
+        if self.capability_cache is None or self.capability_cache[0] != key:
+            results = analyze_capabilities(
+                *(np.asarray(self.curves[curve]) for curve in CURVE_PREFIXES),
+                **self.capability_options
+            )
+            self.capability_cache = (key, results)
+        return self.capability_cache[1]
+
+    def metric(self, expression):
+        # "MaxSpeed", "Foo.X" (scalar columns), a capability metric such as
+        # "peak_pitch_rate", or "max(SpeedRot.pitch)", "min(SpeedGraph)",
+        # "len(RotGravR)" over the curves → (planes,)
+        expression = expression.strip()
+        if expression in self.column_index:
+            return np.asarray(self.scalars[:, self.column_index[expression]], dtype=float)
+        if expression in CAPABILITY_METRICS:
+            return self.capabilities()[expression]
+        match = METRIC_PATTERN.match(expression)
+        curve = None
+        if match:
+            for key, prefix in CURVE_PREFIXES.items():
+                if prefix == match.group(2):
+                    curve = key
+        if curve is None:
+            raise KeyError(f"Unknown column or metric: {expression}")
+        function, axis = match.group(1), match.group(3)
+        if function == "len":
+            return self.lengths[:, list(CURVE_PREFIXES).index(curve)].astype(float)
+        values = np.asarray(self.curves[curve])
+        if curve in VECTOR_CURVES:
+            axis = AXIS_ALIASES.get((axis or "").lower(), (axis or "").upper())
+            if axis not in VECTOR_AXES:
+                raise KeyError(f"{match.group(2)} needs an axis (X/Y/Z or pitch/yaw/roll)")
+            values = values[:, :, VECTOR_AXES.index(axis)]
+        elif axis:
+            raise KeyError(f"{match.group(2)} has no axes")
+        reduce = {"max": np.nanmax, "min": np.nanmin, "mean": np.nanmean}[function]
+        if values.shape[1] == 0:
+            return np.full(len(values), np.nan)
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)   # all-NaN rows
+            return reduce(values, axis=1)
+
+    def where(self, condition):
+        # "max(SpeedRot.pitch) > 40 and MaxSpeed <= 900" → boolean mask
+        mask = np.ones(len(self.planes), dtype=bool)
+        for part in re.split(r"\s+and\s+", condition.strip()):
+            match = CONDITION_PATTERN.match(part.strip())
+            if match is None:
+                raise ValueError(f"Bad condition: {part!r}")
+            metric, operator, number = match.groups()
+            values = self.metric(metric)
+            with np.errstate(invalid="ignore"):
+                mask &= CONDITION_OPERATORS[operator](values, float(number))
+        return mask
+
+    def query(self, condition=None, show=(), sort=None, descending=False):
+        # Returns [{"plane_id", "file", <metric>: value, ...}] for matching planes
+        mask = self.where(condition) if condition else np.ones(len(self.planes), dtype=bool)
+        metrics = list(show)
+        if condition:
+            for part in re.split(r"\s+and\s+", condition.strip()):
+                metric = CONDITION_PATTERN.match(part.strip()).group(1).strip()
+                if metric not in metrics:
+                    metrics.append(metric)
+        values = {metric: self.metric(metric) for metric in metrics}
+        rows = np.flatnonzero(mask)
+        if sort:
+            keys = self.metric(sort)[rows]
+            order = np.argsort(-keys if descending else keys, kind="stable")
+            rows = rows[order]
+        return [
+            dict(
+                {"plane_id": self.planes[i]["plane_id"], "file": self.planes[i]["file"]},
+                **{metric: float(values[metric][i]) for metric in metrics}
+            )
+            for i in rows
+        ]
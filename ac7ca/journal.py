@@ -0,0 +1,117 @@
+# Undo/redo history made of per-entry deltas instead of document copies.
+# A delta key is a Table Data position, or "NameMap" when an edit appended
+# names; each delta holds the JSON value before and after the step.
+
+import json
+import time
+
+
+def delta_size(value):
+    # Rough byte count used for the memory cap
+    return len(json.dumps(value))
+
+
+class EditStep:
+
+    def __init__(self, label, changes, merge_key=None):
+        self.label = label
+        self.changes = changes   # key → [before, after]
+        self.merge_key = merge_key
+        self.time = time.monotonic()
+        self.size = sum(delta_size(b) + delta_size(a) for b, a in changes.values())
+
+
+class EditJournal:
+    MERGE_WINDOW_S = 1.5   # keystrokes in one field closer than this are one step
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.reset()
+
+    def reset(self):
+        self.undo_steps = []
+        self.redo_steps = []
+        self.baseline = {}   # key → value at load, for every key ever touched
+        self.on_disk = {}    # key → value last saved or merged from disk, if any
+        self.size = 0
+        self.dropped = 0
+
+    @staticmethod
+    def note(changes, key, before, after):
+        # Accumulate into a pending changes dict; the first "before" wins
+        if key in changes:
+            changes[key][1] = after
+        else:
+            changes[key] = [before, after]
+
+    def commit(self, changes, label, merge_key=None):
+        changes = {key: delta for key, delta in changes.items() if delta[0] != delta[1]}
+        if not changes:
+            return False
+        for key, (before, after) in changes.items():
+            self.baseline.setdefault(key, before)
+        self.size -= sum(step.size for step in self.redo_steps)
+        self.redo_steps = []
+        last = self.undo_steps[-1] if self.undo_steps else None
+        if (merge_key is not None and last is not None and last.merge_key == merge_key
+                and time.monotonic() - last.time < self.MERGE_WINDOW_S):
+            for key, (before, after) in changes.items():
+                self.note(last.changes, key, before, after)
+            merged = EditStep(label, last.changes, merge_key)
+            self.size += merged.size - last.size
+            self.undo_steps[-1] = merged
+        else:
+            step = EditStep(label, changes, merge_key)
+            self.undo_steps.append(step)
+            self.size += step.size
+        self.trim()
+        return True
+
+    def trim(self):
+        # Oldest steps go first; the newest one is always kept. Revert
+        # still works afterwards because it reads the baseline.
+        while self.size > self.max_bytes and len(self.undo_steps) > 1:
+            self.size -= self.undo_steps.pop(0).size
+            self.dropped += 1
+
+    def undo(self):
+        # Returns (label, {key: value to restore}) or None
+        if not self.undo_steps:
+            return None
+        step = self.undo_steps.pop()
+        self.redo_steps.append(step)
+        return step.label, {key: before for key, (before, after) in step.changes.items()}
+
+    def redo(self):
+        if not self.redo_steps:
+            return None
+        step = self.redo_steps.pop()
+        self.undo_steps.append(step)
+        return step.label, {key: after for key, (before, after) in step.changes.items()}
+
+    def revert(self, current):
+        # Records one undoable step that returns every touched key to its
+        # baseline; current(key) gives the value in the document now.
+        changes = {key: [current(key), value] for key, value in self.baseline.items()}
+        if not self.commit(changes, "Revert"):
+            return None
+        return "Revert", {key: after for key, (before, after) in self.undo_steps[-1].changes.items()}
+
+    def disk_value(self, key, current):
+        # Value of key in the file on disk; untouched keys still hold it
+        if key in self.on_disk:
+            return self.on_disk[key]
+        return self.baseline.get(key, current)
+
+    def mark_saved(self, saved):
+        # saved: key → value written, taken when the save started; keys
+        # first edited after that still hold their baseline on disk
+        self.on_disk = {key: saved.get(key, value) for key, value in self.baseline.items()}
+
+    def stats(self):
+        return {
+            "undo": len(self.undo_steps),
+            "redo": len(self.redo_steps),
+            "bytes": self.size,
+            "dropped": self.dropped
+        }
@@ -0,0 +1,173 @@
+# Name-keyed comparison of the Table Data entry lists of two or three
+# documents. Every entry (so every curve point) is fingerprinted from its
+# type and canonical value JSON; entries whose fingerprints match are
+# skipped, the rest are decoded into numeric deltas.
+
+import copy
+import hashlib
+
+from .documents import (
+    NameIndex, VECTOR_AXES, canonical_json, ensure_name_in_namemap, get_table_values,
+    set_entry_value
+)
+from .native import UASSETAPI_TYPES
+from .profiling import profiled
+
+
+def entry_fingerprint(entry):
+    digest = hashlib.blake2b(entry.get("$type", "").encode("utf-8"), digest_size=16)
+    digest.update(canonical_json(entry["Value"]))
+    return digest.digest()
+
+
+def table_fingerprints(data):
+    # name → (fingerprint, entry); a repeated name is keyed "Name#2", "Name#3"...
+    entries = {}
+    for entry in get_table_values(data):
+        key = entry["Name"]
+        count = 1
+        while key in entries:
+            count += 1
+            key = f"{entry['Name']}#{count}"
+        entries[key] = (entry_fingerprint(entry), entry)
+    return entries
+
+
+def entry_number(entry):
+    # Raw value for reports: a float, {axis: float} for vectors, else as stored
+    value = entry["Value"]
+    if isinstance(value, list):
+        vec = value[0]["Value"]
+        return {axis: float(vec[axis]) for axis in VECTOR_AXES}
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def value_delta(old, new):
+    if isinstance(old, float) and isinstance(new, float):
+        return new - old
+    if isinstance(old, dict) and isinstance(new, dict):
+        return {axis: new[axis] - old[axis] for axis in VECTOR_AXES}
+    return None
+
+
+def same_entry(a, b):
+    # a, b: (fingerprint, entry) or None
+    if a is None or b is None:
+        return a is b
+    return a[0] == b[0] or (
+        a[1].get("$type") == b[1].get("$type") and a[1]["Value"] == b[1]["Value"]
+    )
+
+
+@profiled("diff_documents")
+def diff_documents(old, new):
+    # [{"name", "change": added/removed/changed, "old", "new", "delta"}],
+    # in the order of new's table with removed entries last
+    return diff_fingerprints(table_fingerprints(old), table_fingerprints(new))
+
+
+def diff_fingerprints(before, after):
+    changes = []
+    for key, theirs in after.items():
+        ours = before.get(key)
+        if ours is None:
+            changes.append({"name": key, "change": "added", "old": None,
+                            "new": entry_number(theirs[1]), "delta": None})
+        elif not same_entry(ours, theirs):
+            old_value, new_value = entry_number(ours[1]), entry_number(theirs[1])
+            changes.append({"name": key, "change": "changed", "old": old_value,
+                            "new": new_value, "delta": value_delta(old_value, new_value)})
+    for key, ours in before.items():
+        if key not in after:
+            changes.append({"name": key, "change": "removed", "old": entry_number(ours[1]),
+                            "new": None, "delta": None})
+    return changes
+
+
+def entry_name_strings(entry):
+    # NameMap strings an entry refers to, for entries copied between files
+    names = [entry["Name"]]
+    for type_name, type_string in UASSETAPI_TYPES.items():
+        if type_string == entry.get("$type") and type_name.endswith("Property"):
+            names.append(type_name)
+    for key in ("StructType", "EnumType"):
+        if entry.get(key):
+            names.append(entry[key])
+    if "EnumPropertyData" in entry.get("$type", "") and isinstance(entry["Value"], str):
+        names.append(entry["Value"])
+    return names
+
+
+def merge_vector(base, ours, theirs):
+    # Axis-level three-way merge of vector entries: the merged
+    # {axis: value}, or None when an axis changed differently on both sides
+    merged = {}
+    for axis in VECTOR_AXES:
+        b, o, t = base[axis], ours[axis], theirs[axis]
+        if t == b or o == t:
+            merged[axis] = o
+        elif o == b:
+            merged[axis] = t
+        else:
+            return None
+    return merged
+
+
+@profiled("merge_documents")
+def merge_documents(base, ours, theirs, prefer="ours"):
+    # Three-way merge of theirs' changes (relative to base) into a copy of
+    # ours. Returns (merged, taken names, conflicts); a conflicting entry
+    # keeps the `prefer` side. Conflicts are
+    # {"name", "base", "ours", "theirs"} with None for a missing side.
+    merged = copy.deepcopy(ours)
+    base_fp = table_fingerprints(base)
+    ours_fp = table_fingerprints(merged)
+    theirs_fp = table_fingerprints(theirs)
+    values = get_table_values(merged)
+    names = NameIndex(merged.get("NameMap"))
+    removed = set()
+    taken = []
+    conflicts = []
+
+    def take(key, source):
+        # Put theirs' entry (or its absence) into merged
+        if source is None:
+            removed.add(id(ours_fp[key][1]))
+            return
+        entry = copy.deepcopy(source[1])
+        for name in entry_name_strings(entry):
+            ensure_name_in_namemap(merged, name, names)
+        if key in ours_fp:
+            ours_fp[key][1].clear()
+            ours_fp[key][1].update(entry)
+        else:
+            values.append(entry)
+
+    for key in list(dict.fromkeys([*base_fp, *ours_fp, *theirs_fp])):
+        b, o, t = base_fp.get(key), ours_fp.get(key), theirs_fp.get(key)
+        if same_entry(t, b) or same_entry(o, t):
+            continue
+        if same_entry(o, b):
+            take(key, t)
+            taken.append(key)
+            continue
+        if b is not None and o is not None and t is not None:
+            vectors = [entry_number(side[1]) for side in (b, o, t)]
+            if all(isinstance(v, dict) for v in vectors):
+                axes = merge_vector(*vectors)
+                if axes is not None:
+                    set_entry_value(merged, o[1], axes)
+                    taken.append(key)
+                    continue
+        conflicts.append({
+            "name": key,
+            **{side: None if fp is None else entry_number(fp[1])
+               for side, fp in (("base", b), ("ours", o), ("theirs", t))}
+        })
+        if prefer == "theirs":
+            take(key, t)
+    if removed:
+        values[:] = [entry for entry in values if id(entry) not in removed]
+    return merged, taken, conflicts
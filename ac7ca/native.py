@@ -0,0 +1,616 @@
+# Reads and writes the cooked (.uasset + .uexp) DataTable layout used by
+# PlayerPlaneConfig without going through UAssetGUI. Only the NameMap and
+# the DataTable rows are decoded; every other byte is carried over as-is,
+# so an unmodified document serializes back to identical files.
+
+import os
+import struct
+import zlib
+
+from .documents import DEFAULT_ENGINE_VERSION, uexp_path_for
+
+
+PACKAGE_FILE_TAG = 0x9E2A83C1
+UE4_OBJECT_VERSIONS = {
+    "VER_UE4_18": 514
+}
+VER_UE4_SERIALIZE_TEXT_IN_PACKAGES = 459
+VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP = 384
+VER_UE4_NAME_HASHES_SERIALIZED = 504
+VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS = 507
+VER_UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS = 508
+VER_UE4_ADDED_SEARCHABLE_NAMES = 510
+VER_UE4_64BIT_EXPORTMAP_SERIALSIZES = 511
+VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID = 516
+
+UASSETAPI_TYPES = {
+    "FloatProperty": "UAssetAPI.PropertyTypes.Objects.FloatPropertyData, UAssetAPI",
+    "IntProperty": "UAssetAPI.PropertyTypes.Objects.IntPropertyData, UAssetAPI",
+    "BoolProperty": "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI",
+    "ByteProperty": "UAssetAPI.PropertyTypes.Objects.BytePropertyData, UAssetAPI",
+    "EnumProperty": "UAssetAPI.PropertyTypes.Objects.EnumPropertyData, UAssetAPI",
+    "StructProperty": "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI",
+    "Vector": "UAssetAPI.PropertyTypes.Structs.VectorPropertyData, UAssetAPI",
+    "DataTable": "UAssetAPI.ExportTypes.DataTableExport, UAssetAPI",
+    "RawExport": "UAssetAPI.ExportTypes.RawExport, UAssetAPI"
+}
+
+
+class NativeAssetError(Exception):
+    pass
+
+
+def _crc_table_deprecated():
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+CRC_TABLE_DEPRECATED = _crc_table_deprecated()
+
+
+def fname_hashes(name):
+    # The two 16-bit hashes stored after each NameMap string: the engine's
+    # Strihash_DEPRECATED of the upper-cased name and StrCrc32 of the name.
+    wide = any(ord(c) > 0x7F for c in name)
+    non_case = 0
+    for char in name.upper():
+        code = ord(char)
+        for _ in range(2 if wide else 1):
+            non_case = ((non_case >> 8) & 0x00FFFFFF) ^ CRC_TABLE_DEPRECATED[(non_case ^ code) & 0xFF]
+            code >>= 8
+    case = zlib.crc32(name.encode("utf-32-le")) & 0xFFFFFFFF
+    return non_case & 0xFFFF, case & 0xFFFF
+
+
+def encode_fstring(text):
+    if text is None:
+        return struct.pack("<i", 0)
+    if all(ord(c) < 0x80 for c in text):
+        raw = text.encode("ascii") + b"\0"
+        return struct.pack("<i", len(raw)) + raw
+    raw = text.encode("utf-16-le") + b"\0\0"
+    return struct.pack("<i", -(len(raw) // 2)) + raw
+
+
+class AssetReader:
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def read(self, size):
+        if size < 0 or self.pos + size > len(self.data):
+            raise NativeAssetError(f"Unexpected end of data at {self.pos}")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def unpack(self, fmt):
+        size = struct.calcsize(fmt)
+        values = struct.unpack_from(fmt, self.read(size))
+        return values[0] if len(values) == 1 else values
+
+    def int32(self):
+        return self.unpack("<i")
+
+    def uint32(self):
+        return self.unpack("<I")
+
+    def int64(self):
+        return self.unpack("<q")
+
+    def fstring(self):
+        length = self.int32()
+        if length == 0:
+            return None
+        if length > 0:
+            return self.read(length)[:-1].decode("latin-1")
+        return self.read(-length * 2)[:-2].decode("utf-16-le")
+
+
+class NativeAsset:
+    # Layout of one cooked DataTable package, plus enough bookkeeping to
+    # patch offsets when the NameMap or the row data change size.
+
+    def __init__(self, uasset_bytes, uexp_bytes, engine_version=DEFAULT_ENGINE_VERSION):
+        self.uasset = bytes(uasset_bytes)
+        self.uexp = bytes(uexp_bytes)
+        self.engine_version = engine_version
+        self.fields = {}        # summary field → (position, struct format)
+        self.generation_name_counts = []
+        self.parse_summary()
+        self.parse_name_map()
+        self.parse_imports()
+        self.parse_exports()
+        self.tables = {}        # export index → parsed DataTable layout
+        for index, export in enumerate(self.exports):
+            if self.class_name(export) == "DataTable":
+                self.tables[index] = self.parse_data_table(export)
+        if 0 not in self.tables:
+            raise NativeAssetError("First export is not a DataTable")
+
+    @classmethod
+    def from_files(cls, uasset_path, engine_version=DEFAULT_ENGINE_VERSION):
+        uexp_path = uexp_path_for(uasset_path)
+        if not os.path.exists(uexp_path):
+            raise NativeAssetError("Only split cooked assets (.uasset + .uexp) are supported")
+        with open(uasset_path, "rb") as f:
+            uasset_bytes = f.read()
+        with open(uexp_path, "rb") as f:
+            uexp_bytes = f.read()
+        return cls(uasset_bytes, uexp_bytes, engine_version)
+
+    # ---------------- Header ----------------
+
+    def field(self, reader, name, fmt):
+        self.fields[name] = (reader.pos, fmt)
+        return reader.unpack(fmt)
+
+    def get_field(self, name):
+        pos, fmt = self.fields[name]
+        return struct.unpack_from(fmt, self.uasset, pos)[0]
+
+    def parse_summary(self):
+        reader = AssetReader(self.uasset)
+        if reader.uint32() != PACKAGE_FILE_TAG:
+            raise NativeAssetError("Not a UE4 package")
+        legacy = reader.int32()
+        if legacy < -7 or legacy > -2:
+            raise NativeAssetError(f"Unsupported package format {legacy}")
+        if legacy != -4:
+            reader.int32()  # LegacyUE3Version
+        version = reader.int32()
+        reader.int32()      # licensee version
+        custom_count = reader.int32()
+        if legacy == -2:
+            reader.read(custom_count * 8)
+        elif legacy > -6:
+            for _ in range(custom_count):
+                reader.read(20)
+                reader.fstring()
+        else:
+            reader.read(custom_count * 20)
+        if version == 0:
+            # Unversioned cooked package: the engine version decides
+            if self.engine_version not in UE4_OBJECT_VERSIONS:
+                raise NativeAssetError(f"Unsupported engine version {self.engine_version}")
+            version = UE4_OBJECT_VERSIONS[self.engine_version]
+        if not VER_UE4_NAME_HASHES_SERIALIZED <= version < VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID:
+            raise NativeAssetError(f"Unsupported object version {version}")
+        self.version = version
+        self.field(reader, "TotalHeaderSize", "<i")
+        folder_start = reader.pos
+        self.folder_name = reader.fstring()
+        self.folder_span = (folder_start, reader.pos)
+        self.package_flags = reader.uint32()
+        self.field(reader, "NameCount", "<i")
+        self.field(reader, "NameOffset", "<i")
+        if version >= VER_UE4_SERIALIZE_TEXT_IN_PACKAGES:
+            reader.int32()
+            self.field(reader, "GatherableTextDataOffset", "<i")
+        self.field(reader, "ExportCount", "<i")
+        self.field(reader, "ExportOffset", "<i")
+        self.field(reader, "ImportCount", "<i")
+        self.field(reader, "ImportOffset", "<i")
+        self.field(reader, "DependsOffset", "<i")
+        if version >= VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP:
+            reader.int32()
+            self.field(reader, "SoftPackageReferencesOffset", "<i")
+        if version >= VER_UE4_ADDED_SEARCHABLE_NAMES:
+            self.field(reader, "SearchableNamesOffset", "<i")
+        self.field(reader, "ThumbnailTableOffset", "<i")
+        reader.read(16)     # package guid
+        for _ in range(reader.int32()):
+            reader.int32()  # export count
+            self.generation_name_counts.append(reader.pos)
+            reader.int32()
+        for _ in range(2):  # saved-by / compatible-with engine versions
+            reader.read(10)
+            reader.fstring()
+        reader.uint32()     # compression flags
+        if reader.int32() != 0:
+            raise NativeAssetError("Compressed packages are not supported")
+        reader.uint32()     # package source
+        for _ in range(reader.int32()):
+            reader.fstring()
+        if legacy > -7:
+            reader.int32()  # texture allocations
+        self.field(reader, "AssetRegistryDataOffset", "<i")
+        self.field(reader, "BulkDataStartOffset", "<q")
+        self.field(reader, "WorldTileInfoDataOffset", "<i")
+        reader.read(reader.int32() * 4)  # chunk ids
+        if version >= VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+            reader.int32()
+            self.field(reader, "PreloadDependencyOffset", "<i")
+        if self.get_field("TotalHeaderSize") != len(self.uasset):
+            raise NativeAssetError("Header size does not match the .uasset length")
+
+    def parse_name_map(self):
+        reader = AssetReader(self.uasset, self.get_field("NameOffset"))
+        self.names = []
+        self.name_raw = []
+        for _ in range(self.get_field("NameCount")):
+            start = reader.pos
+            self.names.append(reader.fstring() or "")
+            reader.read(4)  # hashes
+            self.name_raw.append(self.uasset[start:reader.pos])
+        self.name_map_end = reader.pos
+        # Everything that is not the summary must live after the NameMap
+        name_offset = self.get_field("NameOffset")
+        for field in self.header_offset_fields():
+            if name_offset < self.get_field(field) < self.name_map_end:
+                raise NativeAssetError(f"{field} points inside the NameMap")
+
+    def header_offset_fields(self):
+        # Offsets into the .uasset that move when the NameMap changes size
+        return [
+            field for field in self.fields
+            if field.endswith("Offset") and field not in ("NameOffset", "BulkDataStartOffset")
+        ]
+
+    def parse_imports(self):
+        reader = AssetReader(self.uasset, self.get_field("ImportOffset"))
+        self.imports = []
+        for _ in range(self.get_field("ImportCount")):
+            class_package = self.read_fname(reader)
+            class_name = self.read_fname(reader)
+            outer_index = reader.int32()
+            object_name = self.read_fname(reader)
+            self.imports.append({
+                "ClassPackage": class_package,
+                "ClassName": class_name,
+                "OuterIndex": outer_index,
+                "ObjectName": object_name
+            })
+
+    def parse_exports(self):
+        reader = AssetReader(self.uasset, self.get_field("ExportOffset"))
+        self.exports = []
+        wide_sizes = self.version >= VER_UE4_64BIT_EXPORTMAP_SERIALSIZES
+        for _ in range(self.get_field("ExportCount")):
+            export = {"ClassIndex": reader.int32(), "SuperIndex": reader.int32()}
+            if self.version >= VER_UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS:
+                reader.int32()
+            export["OuterIndex"] = reader.int32()
+            export["ObjectName"] = self.read_fname(reader)
+            reader.uint32()  # object flags
+            export["SizePos"] = reader.pos
+            export["SerialSize"] = reader.int64() if wide_sizes else reader.int32()
+            export["OffsetPos"] = reader.pos
+            export["SerialOffset"] = reader.int64() if wide_sizes else reader.int32()
+            reader.read(12 + 16 + 4 + 4 + 4)
+            if self.version >= VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+                reader.read(20)
+            start = export["SerialOffset"] - len(self.uasset)
+            if start < 0 or start + export["SerialSize"] > len(self.uexp):
+                raise NativeAssetError("Export data is not inside the .uexp")
+            self.exports.append(export)
+        self.size_format = "<q" if wide_sizes else "<i"
+
+    def class_name(self, export):
+        index = export["ClassIndex"]
+        if index < 0 and -index - 1 < len(self.imports):
+            return self.imports[-index - 1]["ObjectName"]
+        return None
+
+    # ---------------- Names ----------------
+
+    def fname_string(self, index, number):
+        if not 0 <= index < len(self.names):
+            raise NativeAssetError(f"Name index {index} out of range")
+        name = self.names[index]
+        return f"{name}_{number - 1}" if number else name
+
+    def read_fname(self, reader):
+        index, number = reader.unpack("<ii")
+        return self.fname_string(index, number)
+
+    def encode_fname(self, text, lookup):
+        # lookup indexes the NameMap being written; existing entries keep
+        # their index, so raw FNames elsewhere in the file stay valid
+        if text in lookup:
+            return struct.pack("<ii", lookup[text], 0)
+        base, _, number = text.rpartition("_")
+        if base in lookup and number.isdigit() and (number == "0" or not number.startswith("0")):
+            return struct.pack("<ii", lookup[base], int(number) + 1)
+        raise NativeAssetError(f"{text} is not in the NameMap")
+
+    # ---------------- DataTable ----------------
+
+    def read_tag(self, reader):
+        start = reader.pos
+        name = self.read_fname(reader)
+        if name == "None":
+            return None
+        tag = {"Name": name, "Start": start}
+        tag["Type"] = self.read_fname(reader)
+        tag["SizePos"] = reader.pos
+        tag["Size"] = reader.int32()
+        reader.int32()  # array index
+        tag_data_start = reader.pos
+        if tag["Type"] == "StructProperty":
+            tag["StructType"] = self.read_fname(reader)
+            reader.read(16)
+        elif tag["Type"] == "BoolProperty":
+            tag["Bool"] = reader.read(1)[0]
+        elif tag["Type"] in ("ByteProperty", "EnumProperty"):
+            tag["EnumType"] = self.read_fname(reader)
+        elif tag["Type"] in ("ArrayProperty", "SetProperty"):
+            reader.read(8)
+        elif tag["Type"] == "MapProperty":
+            reader.read(16)
+        tag["TagData"] = (tag_data_start, reader.pos)
+        if reader.read(1)[0]:
+            reader.read(16)
+        tag["ValueStart"] = reader.pos
+        reader.read(tag["Size"])
+        tag["End"] = reader.pos
+        return tag
+
+    def parse_data_table(self, export):
+        base = export["SerialOffset"] - len(self.uasset)
+        end = base + export["SerialSize"]
+        reader = AssetReader(self.uexp, base)
+        while self.read_tag(reader) is not None:
+            pass
+        if reader.int32():
+            reader.read(16)  # object guid
+        row_count_pos = reader.pos
+        rows = []
+        for _ in range(reader.int32()):
+            row_start = reader.pos
+            row_name = self.read_fname(reader)
+            properties = []
+            while True:
+                tag = self.read_tag(reader)
+                if tag is None:
+                    break
+                tag["Kind"] = self.property_kind(tag)
+                properties.append(tag)
+            rows.append({
+                "Name": row_name,
+                "Start": row_start,
+                "Properties": properties,
+                "End": reader.pos
+            })
+        if reader.pos > end:
+            raise NativeAssetError("DataTable rows overrun the export")
+        return {
+            "Base": base,
+            "Start": row_count_pos + 4,
+            "RowsEnd": reader.pos,
+            "End": end,
+            "Rows": rows
+        }
+
+    def property_kind(self, tag):
+        kind = tag["Type"]
+        size = tag["Size"]
+        if kind in ("FloatProperty", "IntProperty") and size == 4:
+            return kind
+        if kind == "BoolProperty" and size == 0:
+            return kind
+        if kind == "EnumProperty" and size == 8:
+            return kind
+        if kind == "ByteProperty" and size in (1, 8):
+            return kind
+        if kind == "StructProperty" and tag["StructType"] == "Vector" and size == 12:
+            return "Vector"
+        raise NativeAssetError(f"Unsupported property {tag['Name']} ({kind})")
+
+    def decode_value(self, tag):
+        reader = AssetReader(self.uexp, tag["ValueStart"])
+        kind = tag["Kind"]
+        if kind == "FloatProperty":
+            return reader.unpack("<f")
+        if kind == "IntProperty":
+            return reader.int32()
+        if kind == "BoolProperty":
+            return bool(tag["Bool"])
+        if kind == "EnumProperty":
+            return self.read_fname(reader)
+        if kind == "ByteProperty":
+            return reader.read(1)[0] if tag["Size"] == 1 else self.read_fname(reader)
+        x, y, z = reader.unpack("<fff")
+        return {"X": x, "Y": y, "Z": z}
+
+    def entry_for(self, tag):
+        kind = tag["Kind"]
+        value = self.decode_value(tag)
+        if kind == "Vector":
+            return {
+                "$type": UASSETAPI_TYPES["StructProperty"],
+                "StructType": "Vector",
+                "Name": tag["Name"],
+                "Value": [{
+                    "$type": UASSETAPI_TYPES["Vector"],
+                    "Name": tag["Name"],
+                    "Value": value
+                }]
+            }
+        entry = {"$type": UASSETAPI_TYPES[kind], "Name": tag["Name"], "Value": value}
+        if kind in ("EnumProperty", "ByteProperty"):
+            entry["EnumType"] = tag["EnumType"]
+        return entry
+
+    def to_document(self):
+        exports = []
+        for index, export in enumerate(self.exports):
+            item = {
+                "$type": UASSETAPI_TYPES["RawExport"],
+                "ObjectName": export["ObjectName"],
+                "ClassName": self.class_name(export)
+            }
+            if index in self.tables:
+                item["$type"] = UASSETAPI_TYPES["DataTable"]
+                item["Table"] = {"Data": [{
+                    "$type": UASSETAPI_TYPES["StructProperty"],
+                    "Name": row["Name"],
+                    "Value": [self.entry_for(tag) for tag in row["Properties"]]
+                } for row in self.tables[index]["Rows"]]}
+            exports.append(item)
+        return {
+            "Info": "Read by AC7CA native reader",
+            "EngineVersion": self.engine_version,
+            "FolderName": self.folder_name,
+            "NameMap": list(self.names),
+            "Imports": self.imports,
+            "Exports": exports
+        }
+
+    # ---------------- Writing ----------------
+
+    def encode_value(self, tag, entry, lookup):
+        kind = tag["Kind"]
+        value = entry["Value"]
+        if kind == "FloatProperty":
+            return struct.pack("<f", float(value))
+        if kind == "IntProperty":
+            return struct.pack("<i", int(round(float(value))))
+        if kind == "BoolProperty":
+            return b""
+        if kind == "EnumProperty" or (kind == "ByteProperty" and tag["Size"] == 8):
+            original = AssetReader(self.uexp, tag["ValueStart"])
+            raw = original.read(8)
+            if self.fname_string(*struct.unpack("<ii", raw)) == value:
+                return raw
+            return self.encode_fname(str(value), lookup)
+        if kind == "ByteProperty":
+            return struct.pack("<B", int(value))
+        vec = value[0]["Value"]
+        return struct.pack("<fff", float(vec["X"]), float(vec["Y"]), float(vec["Z"]))
+
+    def encode_tag(self, tag, entry, lookup):
+        if entry.get("Name") != tag["Name"]:
+            raise NativeAssetError(f"Entry {entry.get('Name')} does not match {tag['Name']}")
+        value = self.encode_value(tag, entry, lookup)
+        head = bytearray(self.uexp[tag["Start"]:tag["ValueStart"]])
+        struct.pack_into("<i", head, tag["SizePos"] - tag["Start"], len(value))
+        if tag["Kind"] == "BoolProperty":
+            head[tag["TagData"][0] - tag["Start"]] = 1 if entry["Value"] else 0
+        return bytes(head) + value
+
+    def encode_table(self, index, export_data, lookup):
+        table = self.tables[index]
+        rows = export_data["Table"]["Data"]
+        if len(rows) != len(table["Rows"]):
+            raise NativeAssetError("Rows cannot be added or removed")
+        out = [self.uexp[table["Base"]:table["Start"]]]
+        for row, row_data in zip(table["Rows"], rows):
+            properties = row["Properties"]
+            if len(row_data["Value"]) != len(properties):
+                raise NativeAssetError(f"Properties of row {row['Name']} changed")
+            out.append(self.uexp[row["Start"]:properties[0]["Start"] if properties else row["End"] - 8])
+            for tag, entry in zip(properties, row_data["Value"]):
+                out.append(self.encode_tag(tag, entry, lookup))
+            out.append(self.uexp[row["End"] - 8:row["End"]])  # None
+        out.append(self.uexp[table["RowsEnd"]:table["End"]])
+        return b"".join(out)
+
+    def encode_name_map(self, names):
+        if len(names) < len(self.names):
+            raise NativeAssetError("NameMap entries cannot be removed")
+        out = []
+        for index, name in enumerate(names):
+            if index < len(self.names) and self.names[index] == name:
+                out.append(self.name_raw[index])
+            else:
+                out.append(encode_fstring(name) + struct.pack("<HH", *fname_hashes(name)))
+        return b"".join(out)
+
+    def serialize(self, data):
+        # Returns (uasset_bytes, uexp_bytes) for a document produced by
+        # to_document(), with any value, NameMap or FolderName edits applied.
+        names = data["NameMap"]
+        lookup = {}
+        for index, name in enumerate(names):
+            lookup.setdefault(name, index)
+        name_bytes = self.encode_name_map(names)
+        name_offset = self.get_field("NameOffset")
+        # FolderName sits in the summary, in front of everything that has an offset
+        folder_start, folder_end = self.folder_span
+        folder_bytes = self.uasset[folder_start:folder_end]
+        if data.get("FolderName", self.folder_name) != self.folder_name:
+            folder_bytes = encode_fstring(data["FolderName"])
+        folder_delta = len(folder_bytes) - (folder_end - folder_start)
+        name_delta = len(name_bytes) - (self.name_map_end - name_offset) + folder_delta
+        # ---------------- .uexp ----------------
+        header_size = len(self.uasset)
+        uexp_parts = []
+        cursor = 0
+        export_delta = 0
+        new_offsets = {}
+        for index in sorted(range(len(self.exports)), key=lambda i: self.exports[i]["SerialOffset"]):
+            export = self.exports[index]
+            start = export["SerialOffset"] - header_size
+            uexp_parts.append(self.uexp[cursor:start])
+            if index in self.tables:
+                body = self.encode_table(index, data["Exports"][index], lookup)
+            else:
+                body = self.uexp[start:start + export["SerialSize"]]
+            new_offsets[index] = (export["SerialOffset"] + name_delta + export_delta, len(body))
+            export_delta += len(body) - export["SerialSize"]
+            uexp_parts.append(body)
+            cursor = start + export["SerialSize"]
+        uexp_parts.append(self.uexp[cursor:])
+        # ---------------- .uasset ----------------
+        header = bytearray(self.uasset)
+        for field in self.header_offset_fields():
+            pos, fmt = self.fields[field]
+            value = self.get_field(field)
+            if value >= self.name_map_end:
+                struct.pack_into(fmt, header, pos, value + name_delta)
+        struct.pack_into("<i", header, self.fields["NameOffset"][0], name_offset + folder_delta)
+        struct.pack_into("<i", header, self.fields["TotalHeaderSize"][0], header_size + name_delta)
+        struct.pack_into("<i", header, self.fields["NameCount"][0], len(names))
+        bulk_pos, _ = self.fields["BulkDataStartOffset"]
+        bulk = self.get_field("BulkDataStartOffset")
+        if bulk >= header_size:
+            struct.pack_into("<q", header, bulk_pos, bulk + name_delta + export_delta)
+        for pos in self.generation_name_counts:
+            if struct.unpack_from("<i", header, pos)[0] == len(self.names):
+                struct.pack_into("<i", header, pos, len(names))
+        for index, (offset, size) in new_offsets.items():
+            export = self.exports[index]
+            struct.pack_into(self.size_format, header, export["SizePos"], size)
+            struct.pack_into(self.size_format, header, export["OffsetPos"], offset)
+        uasset_bytes = b"".join((
+            bytes(header[:folder_start]), folder_bytes, bytes(header[folder_end:name_offset]),
+            name_bytes, bytes(header[self.name_map_end:])
+        ))
+        return uasset_bytes, b"".join(uexp_parts)
+
+    def write(self, data, uasset_path):
+        uasset_bytes, uexp_bytes = self.serialize(data)
+        write_file_pair(uasset_path, uasset_bytes, uexp_bytes)
+
+
+def write_file_pair(uasset_path, uasset_bytes, uexp_bytes):
+    # Both halves are written to temp files first and then swapped in, so
+    # a failure never leaves a .uasset that does not match its .uexp.
+    targets = [(uasset_path, uasset_bytes), (uexp_path_for(uasset_path), uexp_bytes)]
+    temps = []
+    try:
+        for path, payload in targets:
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            temps.append((temp_path, path))
+        for temp_path, path in temps:
+            os.replace(temp_path, path)
+    finally:
+        for temp_path, _ in temps:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+def verify_native_round_trip(uasset_path, engine_version=DEFAULT_ENGINE_VERSION):
+    # Parse → document → serialize must reproduce the files byte for byte
+    asset = NativeAsset.from_files(uasset_path, engine_version)
+    uasset_bytes, uexp_bytes = asset.serialize(asset.to_document())
+    return uasset_bytes == asset.uasset and uexp_bytes == asset.uexp
@@ -0,0 +1,301 @@
+# UE4.18 .pak files (pak version 4 and older): file data followed by an
+# index of FPakEntry records and a fixed-size footer. Archives are
+# memory-mapped and members are read straight from the map, so configs
+# inside a mod pack load through NativeAsset without being extracted.
+# Stored and zlib members are supported; encrypted paks are not.
+
+import fnmatch
+import hashlib
+import mmap
+import os
+import posixpath
+import struct
+import zlib
+from collections import OrderedDict
+
+from .documents import DEFAULT_ENGINE_VERSION, PLANE_CONFIG_PREFIX, uexp_path_for
+from .native import AssetReader, NativeAsset, NativeAssetError, encode_fstring
+
+
+PAK_MAGIC = 0x5A6F12E1
+PAK_VERSION = 4                           # PakFile_Version_IndexEncryption (UE 4.16-4.19)
+PAK_VERSION_NO_TIMESTAMPS = 2
+PAK_VERSION_COMPRESSION_ENCRYPTION = 3
+PAK_INFO_SIZE = 45                        # encrypted flag, magic, version, index offset/size, SHA-1
+PAK_COMPRESSION_NONE = 0
+PAK_COMPRESSION_ZLIB = 1
+PAK_COMPRESSION_METHODS = {"none": PAK_COMPRESSION_NONE, "zlib": PAK_COMPRESSION_ZLIB}
+PAK_BLOCK_SIZE = 0x10000                  # UnrealPak's default compression block size
+DEFAULT_PAK_MOUNT_POINT = "../../../"
+
+
+class PakError(NativeAssetError):
+    pass
+
+
+class PakEntry:
+    # One FPakEntry. Up to version 4 the compression block ranges are
+    # absolute file offsets; the copy written in front of the data has
+    # Offset 0, as UnrealPak writes it.
+
+    def __init__(self, offset, size, uncompressed_size, compression=PAK_COMPRESSION_NONE,
+                 sha1=b"\0" * 20, blocks=(), encrypted=False, block_size=0):
+        self.offset = offset
+        self.size = size                   # bytes stored in the pak
+        self.uncompressed_size = uncompressed_size
+        self.compression = compression
+        self.sha1 = sha1
+        self.blocks = list(blocks)         # (start, end) of each compressed block
+        self.encrypted = encrypted
+        self.block_size = block_size
+
+    @classmethod
+    def read(cls, reader, version):
+        offset, size, uncompressed_size, compression = reader.unpack("<qqqi")
+        if version < PAK_VERSION_NO_TIMESTAMPS:
+            reader.read(8)
+        sha1 = reader.read(20)
+        blocks = []
+        encrypted = False
+        block_size = 0
+        if version >= PAK_VERSION_COMPRESSION_ENCRYPTION:
+            if compression != PAK_COMPRESSION_NONE:
+                blocks = [reader.unpack("<qq") for _ in range(reader.int32())]
+            encrypted = reader.unpack("<B") != 0
+            block_size = reader.uint32()
+        return cls(offset, size, uncompressed_size, compression, bytes(sha1), blocks,
+                   encrypted, block_size)
+
+    def encode(self, offset=None, version=PAK_VERSION):
+        out = struct.pack(
+            "<qqqi", self.offset if offset is None else offset, self.size,
+            self.uncompressed_size, self.compression
+        )
+        if version < PAK_VERSION_NO_TIMESTAMPS:
+            out += struct.pack("<q", 0)
+        out += self.sha1
+        if version < PAK_VERSION_COMPRESSION_ENCRYPTION:
+            return out
+        if self.compression != PAK_COMPRESSION_NONE:
+            out += struct.pack("<i", len(self.blocks))
+            out += b"".join(struct.pack("<qq", start, end) for start, end in self.blocks)
+        return out + struct.pack("<BI", self.encrypted, self.block_size)
+
+    def header_size(self, version=PAK_VERSION):
+        size = 56 if version < PAK_VERSION_NO_TIMESTAMPS else 48
+        if version >= PAK_VERSION_COMPRESSION_ENCRYPTION:
+            size += 5
+            if self.compression != PAK_COMPRESSION_NONE:
+                size += 4 + 16 * len(self.blocks)
+        return size
+
+
+class PakArchive:
+    # Read-only view of one .pak file. Member names are relative to the
+    # mount point with forward slashes, as they are stored in the index.
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.file = open(path, "rb")
+        self.map = None
+        try:
+            if os.fstat(self.file.fileno()).st_size < PAK_INFO_SIZE - 1:
+                raise PakError(f"{self.name} is not a pak file")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def read_index(self):
+        # Version 4 footers start with the encrypted-index flag; older ones
+        # are one byte shorter, so the footer is read from its magic on.
+        size = len(self.map)
+        reader = AssetReader(self.map, size - PAK_INFO_SIZE + 1)
+        magic, version, index_offset, index_size = reader.unpack("<Iiqq")
+        index_hash = reader.read(20)
+        if magic != PAK_MAGIC:
+            raise PakError(f"{self.name} is not a pak file")
+        if not 1 <= version <= PAK_VERSION:
+            raise PakError(f"{self.name}: pak version {version} is not supported (UE4.18 writes {PAK_VERSION})")
+        if version >= PAK_VERSION and self.map[size - PAK_INFO_SIZE]:
+            raise PakError(f"{self.name}: the index is encrypted")
+        if index_offset < 0 or index_size < 0 or index_offset + index_size > size:
+            raise PakError(f"{self.name}: index is out of range")
+        index = self.map[index_offset:index_offset + index_size]
+        if hashlib.sha1(index).digest() != index_hash:
+            raise PakError(f"{self.name}: index checksum mismatch")
+        self.version = version
+        reader = AssetReader(index)
+        self.mount_point = reader.fstring() or ""
+        self.entries = OrderedDict()
+        for _ in range(reader.int32()):
+            name = reader.fstring()
+            self.entries[name] = PakEntry.read(reader, version)
+
+    def entry(self, name):
+        entry = self.entries.get(name)
+        if entry is None:
+            raise PakError(f"{name} is not in {self.name}")
+        if entry.encrypted:
+            raise PakError(f"{name} is encrypted")
+        return entry
+
+    def find(self, pattern=PLANE_CONFIG_PREFIX + "*"):
+        # .uasset members whose file stem matches, like find_config_files
+        return sorted(
+            name for name in self.entries
+            if name.lower().endswith(".uasset")
+            and fnmatch.fnmatch(posixpath.splitext(posixpath.basename(name))[0], pattern)
+        )
+
+    def stored(self, name):
+        # (entry, bytes as stored in the pak, their file offset)
+        entry = self.entry(name)
+        start = entry.offset + entry.header_size(self.version)
+        if start + entry.size > len(self.map):
+            raise PakError(f"{name}: data is out of range")
+        return entry, self.map[start:start + entry.size], start
+
+    def read(self, name):
+        entry, stored, start = self.stored(name)
+        if entry.compression == PAK_COMPRESSION_NONE:
+            return stored
+        if entry.compression != PAK_COMPRESSION_ZLIB or not entry.blocks:
+            raise PakError(f"{name}: compression method {entry.compression} is not supported")
+        view = memoryview(stored)
+        try:
+            data = b"".join(zlib.decompress(view[a - start:b - start]) for a, b in entry.blocks)
+        except zlib.error as e:
+            raise PakError(f"{name}: {e}")
+        if len(data) != entry.uncompressed_size:
+            raise PakError(f"{name}: decompressed to {len(data)} bytes, expected {entry.uncompressed_size}")
+        return data
+
+    def verify(self, name):
+        entry, stored, _ = self.stored(name)
+        return hashlib.sha1(stored).digest() == entry.sha1
+
+    def load_asset(self, name, engine_version=DEFAULT_ENGINE_VERSION):
+        uexp_name = uexp_path_for(name)
+        if uexp_name not in self.entries:
+            raise PakError(f"{uexp_name} is not in {self.name}")
+        return NativeAsset(self.read(name), self.read(uexp_name), engine_version)
+
+    def repack(self, path, replacements, compression=None):
+        # Copies every member into a new pak with replacements (name →
+        # bytes) swapped in; names not in this pak are appended. Unchanged
+        # members keep their stored bytes and are not recompressed.
+        # Replacements keep their member's compression unless one is given.
+        with PakWriter(path, self.mount_point) as writer:
+            for name in self.entries:
+                if name in replacements:
+                    method = compression
+                    if method is None:
+                        method = self.entries[name].compression
+                    writer.add(name, replacements[name], method)
+                else:
+                    writer.add_stored(name, *self.stored(name))
+            for name, data in replacements.items():
+                if name not in self.entries:
+                    writer.add(name, data, PAK_COMPRESSION_NONE if compression is None else compression)
+        return len(writer.entries)
+
+
+class PakWriter:
+    # Streams members into a new version 4 pak. The index and footer are
+    # written on close and the temp file is swapped in, like write_file_pair.
+
+    def __init__(self, path, mount_point=DEFAULT_PAK_MOUNT_POINT, block_size=PAK_BLOCK_SIZE):
+        self.path = path
+        self.mount_point = mount_point
+        self.block_size = block_size
+        self.entries = OrderedDict()
+        self.temp_path = f"{path}.{os.getpid()}.tmp"
+        self.file = open(self.temp_path, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def append(self, name, entry, payload):
+        if name in self.entries:
+            raise PakError(f"{name} is added twice")
+        self.file.write(entry.encode(offset=0))
+        self.file.write(payload)
+        self.entries[name] = entry
+
+    def add(self, name, data, compression=PAK_COMPRESSION_NONE):
+        offset = self.file.tell()
+        if compression == PAK_COMPRESSION_ZLIB and data:
+            chunks = [
+                zlib.compress(data[i:i + self.block_size])
+                for i in range(0, len(data), self.block_size)
+            ]
+            entry = PakEntry(offset, 0, len(data), compression, blocks=[(0, 0)] * len(chunks),
+                             block_size=min(self.block_size, len(data)))
+            start = offset + entry.header_size()
+            for i, chunk in enumerate(chunks):
+                entry.blocks[i] = (start, start + len(chunk))
+                start += len(chunk)
+            payload = b"".join(chunks)
+        elif compression in (PAK_COMPRESSION_NONE, PAK_COMPRESSION_ZLIB):
+            entry = PakEntry(offset, 0, len(data))
+            payload = data
+        else:
+            raise PakError(f"{name}: compression method {compression} is not supported")
+        entry.size = len(payload)
+        entry.sha1 = hashlib.sha1(payload).digest()
+        self.append(name, entry, payload)
+
+    def add_stored(self, name, source, stored, source_start):
+        # Copies a member from another archive, moving its block ranges
+        offset = self.file.tell()
+        entry = PakEntry(source.offset, source.size, source.uncompressed_size, source.compression,
+                         source.sha1, source.blocks, source.encrypted, source.block_size)
+        entry.offset = offset
+        shift = offset + entry.header_size() - source_start
+        entry.blocks = [(start + shift, end + shift) for start, end in source.blocks]
+        self.append(name, entry, stored)
+
+    def close(self):
+        index_offset = self.file.tell()
+        index = encode_fstring(self.mount_point) + struct.pack("<i", len(self.entries))
+        index += b"".join(encode_fstring(name) + entry.encode() for name, entry in self.entries.items())
+        self.file.write(index)
+        self.file.write(struct.pack("<BIiqq", 0, PAK_MAGIC, PAK_VERSION, index_offset, len(index)))
+        self.file.write(hashlib.sha1(index).digest())
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self):
+        self.file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+def write_pak(path, files, mount_point=DEFAULT_PAK_MOUNT_POINT, compression=PAK_COMPRESSION_NONE):
+    # files: (name, bytes) pairs, or a dict of them
+    items = files.items() if isinstance(files, dict) else files
+    with PakWriter(path, mount_point) as writer:
+        for name, data in items:
+            writer.add(name, data, compression)
+    return len(writer.entries)
@@ -0,0 +1,111 @@
+# Timed spans for the hot paths. Disabled by default: a profiled call then
+# costs one attribute check. Enable with "profile": true in config.json or
+# AC7CA_PROFILE=1; spans can be dumped as a Chrome trace (chrome://tracing,
+# ui.perfetto.dev).
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class Profiler:
+
+    def __init__(self, enabled=False, max_events=200000, window=256):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=max_events)   # (name, start, end, thread id)
+        self.window = window
+        self.samples = {}   # name → recent durations in ms
+
+    def record(self, name, start, end):
+        # deque.append is atomic, so worker threads can record too
+        self.events.append((name, start, end, threading.get_ident()))
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples.setdefault(name, deque(maxlen=self.window))
+        samples.append((end - start) * 1000.0)
+
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SPAN
+        return ProfileSpan(self, name)
+
+    def latency(self, name):
+        # (last ms, p95 ms) over the recent window, or None
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return samples[-1], ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def rate(self, name, seconds=1.0):
+        # Calls per second of one span over the last `seconds`
+        since = time.perf_counter() - seconds
+        count = 0
+        for event in reversed(self.events):
+            if event[2] < since:
+                break
+            if event[0] == name:
+                count += 1
+        return count / seconds
+
+    def dump_chrome_trace(self, path):
+        threads = {}
+        events = []
+        for name, start, end, thread in list(self.events):
+            tid = threads.setdefault(thread, len(threads) + 1)
+            events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": tid
+            })
+        for thread, tid in threads.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                "args": {"name": "main" if thread == threading.main_thread().ident else f"worker {tid}"}
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+class ProfileSpan:
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+NULL_SPAN = contextlib.nullcontext()
+PROFILER = Profiler(enabled=os.environ.get("AC7CA_PROFILE", "") not in ("", "0"))
+
+
+def profiled(name):
+    # Decorator form of PROFILER.span(name)
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                PROFILER.record(name, start, time.perf_counter())
+        return wrapper
+    return decorate
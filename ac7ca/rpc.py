@@ -0,0 +1,457 @@
+# `serve` keeps parsed configs in memory for scripts: JSON-RPC 2.0, one
+# request or response per line, over localhost TCP or a Unix socket.
+# Open documents live in an LRU; each has its own lock, so any number of
+# clients can share the server while requests on one document run one
+# at a time. Documents with unsaved edits are never evicted.
+#
+# Any local process can connect, so a connection must first call
+# auth(token) with the token printed at startup, and every path a client
+# passes is resolved under the asset root (--root); nothing outside it is
+# read or written.
+
+import contextlib
+import hmac
+import inspect
+import json
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+
+from .conversion import asset_digest, config_stamp, load_document, save_document
+from .curves import CURVE_PREFIXES, CurveModel
+from .documents import (
+    JsonSource, NameIndex, apply_patch, extract_parameters, get_table_values, json_loads, orjson,
+    parameter_matcher, parse_entry, plane_id_from_path, reid_document, reid_target_path,
+    remove_config_files, replace_json, restore_plane_id_refs, save_json
+)
+from .validation import VALIDATION_RULES, Validator
+
+
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_SERVER_DOCUMENTS = 16
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_SERVER_ERROR = -32000
+RPC_UNAUTHORIZED = -32001
+
+
+class RpcError(Exception):
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def rpc_encode(value):
+    # One line of compact JSON
+    if orjson is not None:
+        return orjson.dumps(value) + b"\n"
+    return json.dumps(value, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class OpenDocument:
+    # A config held by the server; only touched with its lock held
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.closed = False   # evicted or closed: holders must look it up again
+        self.dirty = False
+        self.stamp = None
+        self.data = None
+        self.json_path = None
+        self.native_asset = None
+        self.json_source = None
+        self.entry_index = {}
+        self.enum_types = {}
+        self.names = None
+        self.curves = None
+
+    def load(self, options, cache):
+        if self.path.endswith(".json"):
+            self.json_source = JsonSource.read(self.path)
+            data, json_path, native_asset = self.json_source.parse(), self.path, None
+        else:
+            data, json_path, native_asset = load_document(
+                self.path, options["uassetgui_path"], options["engine_version"],
+                cache, options["native"], options["timeout"]
+            )
+            self.json_source = JsonSource.read(json_path) if json_path else None
+        self.discard_temp()
+        self.data, self.json_path, self.native_asset = data, json_path, native_asset
+        self.stamp = config_stamp(self.path)
+        self.index()
+        self.loaded = True
+        self.dirty = False
+
+    def index(self):
+        _, self.enum_types, self.entry_index = extract_parameters(self.data)
+        self.names = NameIndex(self.data.get("NameMap"))
+        self.curves = CurveModel(self.data)
+
+    def discard_temp(self):
+        # The UAssetGUI output of a .uasset opened without the native reader
+        if self.json_path and self.json_path != self.path and os.path.exists(self.json_path):
+            os.remove(self.json_path)
+        self.json_path = None
+
+    def summary(self):
+        return {
+            "path": self.path,
+            "parameters": len(self.entry_index),
+            "curves": dict(zip(CURVE_PREFIXES, self.curves.shape())),
+            "dirty": self.dirty,
+            "stale": config_stamp(self.path) != self.stamp if os.path.exists(self.path) else True
+        }
+
+
+class DocumentStore:
+    # The server's methods; rpc_<name> is callable as <name> with named
+    # (or positional) params
+
+    def __init__(self, options, cache=None, max_documents=DEFAULT_SERVER_DOCUMENTS, root=None):
+        self.options = options
+        self.cache = cache
+        self.max_documents = max_documents
+        self.root = os.path.realpath(root or os.getcwd())
+        self.documents = OrderedDict()   # path → OpenDocument, least recently used first
+        self.lock = threading.Lock()
+
+    def resolve(self, path):
+        # A client path (relative ones are taken from the root) → the real
+        # path, which must lie under the root
+        if not isinstance(path, str) or not path:
+            raise RpcError(RPC_INVALID_PARAMS, "path must be a non-empty string")
+        resolved = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([self.root, resolved]) != self.root:
+            raise RpcError(RPC_INVALID_PARAMS, f"{path} is outside the asset root {self.root}")
+        return resolved
+
+    @contextlib.contextmanager
+    def checkout(self, path, load=True):
+        # Yields the loaded document for path with its lock held
+        path = self.resolve(path)
+        while True:
+            with self.lock:
+                document = self.documents.get(path)
+                if document is None:
+                    if not load:
+                        raise RpcError(RPC_SERVER_ERROR, f"{path} is not open")
+                    document = self.documents[path] = OpenDocument(path)
+                self.documents.move_to_end(path)
+            with document.lock:
+                if document.closed:
+                    continue   # evicted while we waited; look it up again
+                if not document.loaded:
+                    try:
+                        document.load(self.options, self.cache)
+                    except Exception:
+                        self.drop(document)
+                        raise
+                    self.evict()
+                yield document
+                return
+
+    def drop(self, document):
+        # Called with document.lock held
+        document.closed = True
+        document.discard_temp()
+        with self.lock:
+            if self.documents.get(document.path) is document:
+                del self.documents[document.path]
+
+    def evict(self):
+        # Oldest clean documents that nobody is using go first
+        with self.lock:
+            candidates = list(self.documents.values())
+        excess = len(candidates) - self.max_documents
+        for document in candidates:
+            if excess <= 0:
+                break
+            if not document.lock.acquire(blocking=False):
+                continue
+            try:
+                if document.loaded and not document.dirty:
+                    self.drop(document)
+                    excess -= 1
+            finally:
+                document.lock.release()
+
+    def shutdown(self):
+        # Returns the paths whose edits were never saved
+        unsaved = []
+        with self.lock:
+            documents = list(self.documents.values())
+        for document in documents:
+            with document.lock:
+                if document.dirty:
+                    unsaved.append(document.path)
+                self.drop(document)
+        return unsaved
+
+    # ---------------- methods ----------------
+
+    def rpc_open(self, path, reload=False):
+        if not os.path.exists(self.resolve(path)):
+            raise RpcError(RPC_SERVER_ERROR, f"{path} does not exist")
+        with self.checkout(path) as document:
+            warm = not reload
+            summary = document.summary()
+            # An unchanged copy is reloaded when the file changed on disk
+            if reload or (summary["stale"] and not document.dirty):
+                document.load(self.options, self.cache)
+                warm = False
+                summary = document.summary()
+            return {**summary, "warm": warm}
+
+    def rpc_close(self, path, discard=False):
+        with self.checkout(path, load=False) as document:
+            if document.dirty and not discard:
+                raise RpcError(RPC_SERVER_ERROR, f"{path} has unsaved edits (save, or close with discard)")
+            self.drop(document)
+            return True
+
+    def rpc_list(self):
+        with self.lock:
+            documents = list(self.documents.values())
+        return [{"path": d.path, "dirty": d.dirty} for d in documents if d.loaded]
+
+    def rpc_get_parameters(self, path, names=None):
+        # names: parameter names or patch-style patterns; all when omitted
+        with self.checkout(path) as document:
+            values = get_table_values(document.data)
+            selected = document.entry_index
+            if names is not None:
+                matchers = [parameter_matcher(pattern) for pattern in names]
+                selected = [n for n in document.entry_index if any(m.match(n) for m in matchers)]
+            return {name: parse_entry(values[document.entry_index[name]]) for name in selected}
+
+    def rpc_set_parameters(self, path, values=None, scale=None):
+        # values: {name: value}, scale: {name or curve: factor}; the same
+        # rules as a batch patch. Nothing is written if a name is unknown.
+        patch = {"set": values or {}, "scale": scale or {}}
+        with self.checkout(path) as document:
+            unknown = [name for name in patch["set"] if name not in document.entry_index]
+            unknown += [p for p in patch["scale"] if p not in document.entry_index
+                        and not any(map(parameter_matcher(p).match, document.entry_index))]
+            if unknown:
+                raise RpcError(RPC_INVALID_PARAMS, f"Unknown parameter: {', '.join(unknown)}")
+            changed = apply_patch(document.data, patch, document.entry_index, document.names)
+            for name in changed:
+                document.curves.refresh(name)
+            document.dirty = document.dirty or bool(changed)
+            return {"changed": changed}
+
+    def rpc_get_curves(self, path):
+        with self.checkout(path) as document:
+            curves = document.curves
+            return {
+                curve: {"indices": list(curves.indices[curve]), "values": curves.arrays[curve].tolist()}
+                for curve in CURVE_PREFIXES
+            }
+
+    def rpc_validate(self, path, rules=None):
+        validator = Validator(rules if rules is not None else VALIDATION_RULES)
+        with self.checkout(path) as document:
+            return validator.run(document.data, document.curves, document.names)
+
+    def write(self, document, target):
+        # Saves the document to target, a .json or .uasset path
+        if target.endswith(".uasset"):
+            if self.cache is not None and os.path.exists(target):
+                self.cache.discard(asset_digest(target, self.options["engine_version"]))
+            # Only UAssetGUI's temp JSON may be overwritten: a document
+            # opened from .json is converted from a temp copy, so its source
+            # (and json_source, stamp, dirty) are left as they are
+            json_path = document.json_path
+            if document.native_asset is None and json_path in (None, document.path):
+                json_path = f"{target}.{os.getpid()}.tmp.json"
+            try:
+                save_document(document.data, json_path, target, self.options["uassetgui_path"],
+                              document.native_asset, self.options["timeout"])
+            finally:
+                if json_path and json_path != document.json_path and os.path.exists(json_path):
+                    os.remove(json_path)
+        elif target == document.json_path:
+            document.json_source = save_json(document.data, target, document.json_source)
+        else:
+            replace_json(document.data, target)
+
+    def rpc_save(self, path, out=None):
+        # Writes to the opened file, or to out (which stays unopened)
+        with self.checkout(path, load=False) as document:
+            target = self.resolve(out) if out else document.path
+            self.write(document, target)
+            if target == document.path:
+                document.stamp = config_stamp(document.path)
+                document.dirty = False
+            return {"path": target}
+
+    def rpc_reid(self, path, new_id, out_dir=None, force=False, move=False):
+        # Rewrites the PlaneID and saves under the new name; the document
+        # is then open under that name (and the old files are deleted with move)
+        with self.checkout(path) as document:
+            old_id = plane_id_from_path(document.path)
+            if old_id is None:
+                raise RpcError(RPC_SERVER_ERROR, f"No PlaneID in {os.path.basename(document.path)}")
+            if out_dir is not None:
+                out_dir = self.resolve(out_dir)
+            target = self.resolve(reid_target_path(document.path, new_id, out_dir))
+            if os.path.exists(target) and not force:
+                raise RpcError(RPC_SERVER_ERROR, f"{os.path.basename(target)} already exists (use force)")
+            refs, mentions = reid_document(document.data, old_id, new_id)
+            try:
+                self.write(document, target)
+            except Exception:
+                restore_plane_id_refs(refs)
+                raise
+            changes = [(location, old, new) for _, _, old, new, location in refs]
+            # Re-key the document; stale entries for target are dropped
+            with self.lock:
+                replaced = self.documents.pop(target, None)
+                if self.documents.get(document.path) is document:
+                    del self.documents[document.path]
+                self.documents[target] = document
+            if replaced is not None and replaced is not document:
+                replaced.closed = True
+            if move:
+                remove_config_files(document.path)
+            if document.json_path == document.path:
+                document.json_path = target
+                document.json_source = None
+            document.path = target
+            document.stamp = config_stamp(target)
+            document.dirty = False
+            document.index()
+            return {"path": target, "changes": changes, "mentions": mentions}
+
+    def dispatch(self, request):
+        # One JSON-RPC request object → response object (None for notifications)
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return {"jsonrpc": "2.0", "id": None,
+                    "error": {"code": RPC_INVALID_REQUEST, "message": "Invalid request"}}
+        request_id = request.get("id")
+        try:
+            method = getattr(self, f"rpc_{request['method']}", None)
+            if method is None:
+                raise RpcError(RPC_METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            params = request.get("params") or {}
+            try:
+                if isinstance(params, list):
+                    bound = inspect.signature(method).bind(*params)
+                else:
+                    bound = inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise RpcError(RPC_INVALID_PARAMS, str(e))
+            result = method(*bound.args, **bound.kwargs)
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except RpcError as e:
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": e.code, "message": e.message}}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": RPC_SERVER_ERROR, "message": f"{type(e).__name__}: {e}"}}
+        return None if "id" not in request else response
+
+
+class RpcHandler(socketserver.StreamRequestHandler):
+    # One thread per connection; a batch (JSON array) is answered in order.
+    # Until auth(token) succeeds every other request is refused.
+
+    def handle(self):
+        self.authorized = self.server.token is None
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json_loads(line)
+            except ValueError:
+                self.reply({"jsonrpc": "2.0", "id": None,
+                            "error": {"code": RPC_PARSE_ERROR, "message": "Parse error"}})
+                continue
+            if isinstance(request, list):
+                responses = [r for r in map(self.dispatch, request) if r is not None]
+                if responses:
+                    self.reply(responses)
+            else:
+                response = self.dispatch(request)
+                if response is not None:
+                    self.reply(response)
+
+    def dispatch(self, request):
+        if self.authorized:
+            return self.server.store.dispatch(request)
+        if not isinstance(request, dict):
+            request = {"id": None}
+        params = request.get("params")
+        if isinstance(params, list):
+            params = dict(zip(("token",), params))
+        token = params.get("token") if isinstance(params, dict) else None
+        if request.get("method") != "auth":
+            error = "Not authorized: call auth(token) first"
+        elif not isinstance(token, str) or not hmac.compare_digest(token, self.server.token):
+            error = "Wrong token"
+        else:
+            self.authorized = True
+            error = None
+        if "id" not in request:
+            return None
+        if error is None:
+            return {"jsonrpc": "2.0", "id": request["id"], "result": True}
+        return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": RPC_UNAUTHORIZED, "message": error}}
+
+    def reply(self, value):
+        self.wfile.write(rpc_encode(value))
+        self.wfile.flush()
+
+
+class RpcTcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    token = None   # required from every connection when set
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class RpcUnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        token = None
+else:
+    RpcUnixServer = None
+
+
+class RpcClient:
+    # Minimal blocking client for scripts:
+    #   client = RpcClient(port=8765, token="...")   # or RpcClient(socket_path="...", token="...")
+    #   client.call("set_parameters", path=p, values={"SpeedRot3": [40, 30, 90]})
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_SERVER_PORT, socket_path=None, token=None):
+        if socket_path:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(socket_path)
+        else:
+            self.socket = socket.create_connection((host, port))
+        self.file = self.socket.makefile("rwb")
+        self.next_id = 0
+        if token is not None:
+            self.call("auth", token=token)
+
+    def call(self, method, *args, **params):
+        self.next_id += 1
+        self.file.write(rpc_encode({
+            "jsonrpc": "2.0", "id": self.next_id, "method": method, "params": list(args) or params
+        }))
+        self.file.flush()
+        response = json_loads(self.file.readline())
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
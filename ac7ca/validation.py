@@ -0,0 +1,248 @@
+# Declarative checks over a parsed document, shared by the editor (rows
+# are flagged as you type) and the `validate` command. A rule is a dict:
+# {"rule": kind, "severity": "error"|"warning", ...kind options}; the
+# kinds are the check_* methods of Validator. config.json
+# "validation_rules" replaces the default list.
+
+import hashlib
+import math
+import os
+
+import numpy as np
+
+from .curves import CURVE_PREFIXES, CurveModel, VECTOR_CURVES
+from .documents import (
+    NameIndex, VECTOR_AXES, canonical_json, get_table_values, parameter_matcher, read_json,
+    replace_json
+)
+from .profiling import profiled
+
+
+VALIDATION_RULES = (
+    {"rule": "numeric", "severity": "error"},
+    {"rule": "enum", "severity": "error"},
+    {"rule": "monotonic", "severity": "error", "curve": "speed_graph"},
+    {"rule": "complete", "severity": "error", "curve": "diff_nose"},
+    {"rule": "paired", "severity": "error", "curves": ["speed_rot", "rot_grav"]},
+    {"rule": "knots", "severity": "warning", "curves": ["speed_rot", "rot_grav"]},
+    {"rule": "range", "severity": "error", "match": "SpeedGraph", "min": 0},
+    {"rule": "range", "severity": "warning", "match": "DiffNoseVelocityR", "min": 0},
+    {"rule": "range", "severity": "warning", "match": "SpeedRot", "min": 0}
+)
+VALIDATION_SEVERITIES = ("error", "warning")
+SEVERITY_COLORS = {"error": "red", "warning": "dark orange"}
+VALIDATION_DELAY_MS = 250   # the editor re-validates this long after the last edit
+NUMERIC_PROPERTY_TYPES = ("FloatPropertyData", "IntPropertyData", "DoublePropertyData")
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def entry_leaves(entry):
+    # (axis prefix for messages, value) for the numbers in a scalar or
+    # vector entry
+    value = entry["Value"]
+    if isinstance(value, list):
+        vec = value[0].get("Value") if value and isinstance(value[0], dict) else None
+        if not isinstance(vec, dict):
+            return [("", vec)]
+        return [(f"{axis} ", vec.get(axis)) for axis in VECTOR_AXES]
+    return [("", value)]
+
+
+class Validator:
+
+    def __init__(self, rules=VALIDATION_RULES):
+        self.rules = [dict(rule) for rule in rules]
+        for rule in self.rules:
+            if not hasattr(self, f"check_{rule.get('rule')}"):
+                raise ValueError(f"Unknown validation rule: {rule.get('rule')}")
+            rule.setdefault("severity", "error")
+            if rule["severity"] not in VALIDATION_SEVERITIES:
+                raise ValueError(f"Unknown severity: {rule['severity']}")
+        self.digest = hashlib.sha256(canonical_json(self.rules)).hexdigest()
+        self.matches = {}   # pattern → (values list, its length, matching entries)
+        self.values = self.curves = self.names = None
+
+    @profiled("validate")
+    def run(self, data, curves=None, names=None):
+        # [{"rule", "severity", "name", "message"}] in rule order; the
+        # editor passes its own curve model and NameMap index
+        self.values = get_table_values(data)
+        self.curves = curves if curves is not None else CurveModel(data)
+        self.names = names if names is not None else NameIndex(data.get("NameMap"))
+        issues = []
+        try:
+            for rule in self.rules:
+                for name, message in getattr(self, f"check_{rule['rule']}")(rule):
+                    issues.append({
+                        "rule": rule["rule"], "severity": rule["severity"],
+                        "name": name, "message": message
+                    })
+        finally:
+            self.values = self.curves = self.names = None
+        return issues
+
+    def matching(self, rule):
+        # Entries whose name matches rule["match"] the way patch names do
+        # (exact, fnmatch pattern, or prefix + index); all when absent.
+        # Reused while the editor validates the same Table Data list.
+        pattern = rule.get("match")
+        if pattern is None:
+            return self.values
+        cached = self.matches.get(pattern)
+        if cached is not None and cached[0] is self.values and cached[1] == len(self.values):
+            return cached[2]
+        matcher = parameter_matcher(pattern)
+        entries = [entry for entry in self.values if matcher.match(entry["Name"])]
+        self.matches[pattern] = (self.values, len(self.values), entries)
+        return entries
+
+    def curve_prefix(self, curve):
+        if curve not in CURVE_PREFIXES:
+            raise ValueError(f"Unknown curve: {curve}")
+        return CURVE_PREFIXES[curve]
+
+    # ---------------- entry rules ----------------
+
+    def check_numeric(self, rule):
+        # Numeric and vector entries must hold finite numbers; a string
+        # left by a bad edit is caught here
+        for entry in self.matching(rule):
+            value = entry["Value"]
+            if type(value) in (float, int) and math.isfinite(value):
+                continue   # the common case, checked without looking at the type
+            entry_type = entry.get("$type", "")
+            if not (isinstance(value, list)
+                    or any(t in entry_type for t in NUMERIC_PROPERTY_TYPES)):
+                continue
+            for axis, value in entry_leaves(entry):
+                if not is_number(value):
+                    yield entry["Name"], f"{axis}{value!r} is not a number"
+
+    def check_range(self, rule):
+        low, high = rule.get("min"), rule.get("max")
+        axes = rule.get("axes")
+        for entry in self.matching(rule):
+            if isinstance(entry["Value"], bool):
+                continue
+            for axis, value in entry_leaves(entry):
+                if not is_number(value) or (axes and axis.strip() not in axes):
+                    continue
+                if low is not None and value < low:
+                    yield entry["Name"], f"{axis}{value:g} is below {low:g}"
+                elif high is not None and value > high:
+                    yield entry["Name"], f"{axis}{value:g} is above {high:g}"
+
+    def check_enum(self, rule):
+        # The value must belong to the entry's enum type and be in the NameMap
+        for entry in self.matching(rule):
+            if "EnumPropertyData" not in entry.get("$type", ""):
+                continue
+            value = entry["Value"]
+            if not isinstance(value, str) or not value.startswith(f"{entry.get('EnumType')}::"):
+                yield entry["Name"], f"{value!r} is not a {entry.get('EnumType')} value"
+            elif self.names.names is not None and value not in self.names:
+                yield entry["Name"], f"{value} is missing from the NameMap"
+
+    # ---------------- curve rules ----------------
+
+    def check_monotonic(self, rule):
+        curve = rule.get("curve", "speed_graph")
+        self.curve_prefix(curve)
+        if curve in VECTOR_CURVES:
+            raise ValueError(f"monotonic needs a scalar curve, not {curve}")
+        array = self.curves.arrays[curve]
+        strict = rule.get("strict", True)
+        for row in range(1, len(array)):
+            if array[row] < array[row - 1] or (strict and array[row] == array[row - 1]):
+                yield (self.curves.name_for(curve, row),
+                       f"{array[row]:g} does not increase on "
+                       f"{self.curves.name_for(curve, row - 1)} ({array[row - 1]:g})")
+
+    def check_complete(self, rule):
+        # Knots without a point on a curve indexed by the SpeedGraph knots
+        curve = rule.get("curve", "diff_nose")
+        prefix = self.curve_prefix(curve)
+        for row in np.flatnonzero(self.curves.positions[curve] < 0):
+            index = self.curves.indices[curve][row]
+            yield (self.curves.name_for("speed_graph", row),
+                   f"no {prefix}{index} (reads as 0)")
+
+    def check_paired(self, rule):
+        # Every index of one curve has a point on the others
+        curves = rule.get("curves", VECTOR_CURVES)
+        for curve in curves:
+            self.curve_prefix(curve)
+        indices = {curve: set(self.curves.indices[curve]) for curve in curves}
+        for curve in curves:
+            for other in curves:
+                for index in sorted(indices[curve] - indices[other]):
+                    yield (f"{CURVE_PREFIXES[curve]}{index}",
+                           f"no {CURVE_PREFIXES[other]}{index} to pair with")
+
+    def check_knots(self, rule):
+        # Points of vector curves need a SpeedGraph knot to sit on
+        for curve in rule.get("curves", VECTOR_CURVES):
+            self.curve_prefix(curve)
+            for row in np.flatnonzero(self.curves.knot_rows[curve] < 0):
+                index = self.curves.indices[curve][row]
+                yield (self.curves.name_for(curve, row), f"no SpeedGraph{index} knot")
+
+
+def read_validation_rules(config, path=None):
+    # --rules file, then config.json, then the defaults
+    if path:
+        return read_json(path)
+    return config.get("validation_rules", VALIDATION_RULES)
+
+
+def count_severities(issues):
+    counts = dict.fromkeys(VALIDATION_SEVERITIES, 0)
+    for issue in issues:
+        counts[issue["severity"]] += 1
+    return counts
+
+
+class ValidationCache:
+    # Issues per (config digest, rules digest) in one JSON file, plus the
+    # digest last seen for each path and stamp so unchanged files are not
+    # even hashed again. Only the parent process reads and writes it.
+    MAX_RESULTS = 20000
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            stored = read_json(path)
+            self.results = stored["results"]
+            self.stamps = stored["stamps"]
+        except (OSError, ValueError, KeyError):
+            self.results = {}
+            self.stamps = {}
+        self.hits = 0
+
+    def known_digest(self, path, stamp):
+        known = self.stamps.get(os.path.abspath(path))
+        if known is not None and tuple(known[:2]) == tuple(stamp):
+            return known[2]
+        return None
+
+    def get(self, digest, rules_digest):
+        issues = self.results.get(f"{digest}:{rules_digest}")
+        if issues is not None:
+            self.hits += 1
+        return issues
+
+    def put(self, path, stamp, digest, rules_digest, issues):
+        self.stamps[os.path.abspath(path)] = [*stamp, digest]
+        key = f"{digest}:{rules_digest}"
+        self.results.pop(key, None)   # re-insert as the newest
+        self.results[key] = issues
+
+    def save(self):
+        # Oldest results go first once there are too many
+        for key in list(self.results)[:max(0, len(self.results) - self.MAX_RESULTS)]:
+            del self.results[key]
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        replace_json({"results": self.results, "stamps": self.stamps}, self.path)
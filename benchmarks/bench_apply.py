@@ -0,0 +1,126 @@
+# Measures the cost of one inspector keystroke (live_update) against the
+# number of parameters in the config.
+#
+#   python benchmarks/bench_apply.py
+#
+# "dirty" is the incremental path used by the editor, "full" re-applies every
+# widget the way the old apply_changes_to_json did.
+
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from AC7CA import PlaneConfigEditor, UpdateScheduler
+from ac7ca.journal import EditJournal
+from ac7ca.validation import Validator
+from synthetic import make_config
+
+
+class FakeEntry:
+
+    def __init__(self, value):
+        self.value = str(value)
+
+    def get(self):
+        return self.value
+
+    def delete(self, first, last=None):
+        self.value = ""
+
+    def insert(self, index, value):
+        self.value = str(value)
+
+    def set(self, value):
+        self.value = str(value)
+
+
+class FakeRoot:
+    # Stands in for tk.Tk: after() callbacks only run when flushed.
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+
+def make_editor(data):
+    editor = PlaneConfigEditor.__new__(PlaneConfigEditor)
+    editor.data = data
+    editor.line_map = {}
+    editor.graph_lines = {}
+    editor.graph_built_shape = None
+    editor.drag_background = None
+    editor.fig = Figure(figsize=(6, 8))
+    editor.ax1, editor.ax2, editor.ax3 = editor.fig.subplots(3, 1)
+    editor.canvas = FigureCanvasAgg(editor.fig)
+    editor.parameters = editor.extract_all_parameters()
+    editor.param_widgets = {}
+    for name, value in editor.parameters.items():
+        if isinstance(value, dict):
+            editor.param_widgets[name] = {a: FakeEntry(value[a]) for a in "XYZ"}
+        else:
+            editor.param_widgets[name] = FakeEntry(value)
+    editor.dirty_params = set()
+    editor.synced_params = set()
+    editor.journal = EditJournal(32 * 1024 * 1024)
+    editor.drag_changes = {}
+    editor.editing_locked = False
+    editor.capability_mode = FakeEntry("linear")
+    editor.capability_labels = []
+    editor.corner_band = 0.9
+    editor.root = FakeRoot()
+    editor.validator = Validator()
+    editor.issues = {}
+    editor.validation_pending = None
+    editor.update_scheduler = UpdateScheduler(FakeRoot(), editor.process_pending_updates)
+    editor.extract_graph_data()
+    editor.update_graphs()
+    return editor
+
+
+def time_keystrokes(editor, name, full, repeat):
+    widget = editor.param_widgets[name]
+    start = time.perf_counter()
+    for i in range(repeat):
+        widget.insert(0, 1.0 + i * 0.001)
+        if full:
+            editor.apply_changes_to_json(names=list(editor.param_widgets))
+        else:
+            editor.live_update(None, name)
+            editor.update_scheduler.flush()
+    return (time.perf_counter() - start) / repeat * 1000.0
+
+
+def main():
+    print(f"{'params':>8} {'target':>18} {'dirty ms':>10} {'full ms':>10}")
+    for count in (200, 1000, 5000, 20000):
+        editor = make_editor(make_config(count))
+        for target in ("Param0", "DiffNoseVelocityR3"):
+            dirty = time_keystrokes(editor, target, full=False, repeat=20)
+            full = time_keystrokes(editor, target, full=True, repeat=5)
+            print(f"{count:>8} {target:>18} {dirty:>10.3f} {full:>10.3f}")
+    # Typing "1234.5" inside one frame runs a single apply
+    editor = make_editor(make_config(200))
+    widget = editor.param_widgets["DiffNoseVelocityR3"]
+    for text in ("1", "12", "123", "1234", "1234.", "1234.5"):
+        widget.insert(0, text)
+        editor.live_update(None, "DiffNoseVelocityR3")
+    editor.update_scheduler.flush()
+    print("scheduler:", editor.update_scheduler.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Time of one batched capability analysis over a fleet of synthetic planes.
+#
+#   python benchmarks/bench_capabilities.py [--planes 500] [--curve-length 32]
+#
+# Curves are padded with NaN the way the fleet index stores them, with a
+# share of planes having shorter curves.
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ac7ca.curves import INTERPOLATION_MODES, analyze_capabilities
+
+
+def make_fleet(planes, curve_length, seed=0):
+    rng = np.random.default_rng(seed)
+    speed_graph = np.cumsum(rng.uniform(50.0, 150.0, (planes, curve_length)), axis=1)
+    diff_nose = rng.uniform(0.5, 3.0, (planes, curve_length))
+    speed_rot = rng.uniform(5.0, 90.0, (planes, curve_length, 3))
+    rot_grav = rng.uniform(0.0, 1.0, (planes, curve_length, 3))
+    short = curve_length * 2 // 3
+    for array in (speed_graph, diff_nose, speed_rot, rot_grav):
+        array[::5, short:] = np.nan
+    return speed_graph, diff_nose, speed_rot, rot_grav
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the capability analysis")
+    parser.add_argument("--planes", type=int, default=500)
+    parser.add_argument("--curve-length", type=int, default=32)
+    parser.add_argument("--samples", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    fleet = make_fleet(args.planes, args.curve_length)
+    for mode in INTERPOLATION_MODES:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            analyze_capabilities(*fleet, samples=args.samples, mode=mode)
+            times.append((time.perf_counter() - start) * 1000.0)
+        print(f"{mode:<8} {args.planes} planes  {min(times):>8.1f} ms (max {max(times):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Simulates dragging one point on each graph and reports the time per
+# motion event (pick → N motions → release) on the Agg canvas.
+#
+#   python benchmarks/bench_drag.py
+
+import time
+from types import SimpleNamespace
+
+from bench_apply import make_config, make_editor
+
+
+def drag(editor, line_type, axis_index, moves):
+    line = next(
+        line for line, info in editor.line_map.items()
+        if info[0] == line_type and info[1] == axis_index
+    )
+    editor.on_pick(SimpleNamespace(artist=line, ind=[3]))
+    start = time.perf_counter()
+    for i in range(moves):
+        editor.on_drag(SimpleNamespace(ydata=1.0 + i * 0.01, inaxes=line.axes))
+    elapsed = time.perf_counter() - start
+    editor.on_release(None)
+    return elapsed / moves * 1000.0
+
+
+def main():
+    print(f"{'params':>8} {'graph':>12} {'ms/move':>10} {'fps':>8}")
+    for count in (200, 5000):
+        editor = make_editor(make_config(count))
+        for line_type, axis_index in (("diff_nose", None), ("speed_rot", 0), ("rot_grav", 1)):
+            ms = drag(editor, line_type, axis_index, moves=200)
+            print(f"{count:>8} {line_type:>12} {ms:>10.3f} {1000.0 / ms:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
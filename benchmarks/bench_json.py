@@ -0,0 +1,84 @@
+# Load and save cost of large configs for each JSON backend, and a spliced
+# save (one edited entry) against re-encoding the whole document.
+#
+#   python benchmarks/bench_json.py [--params 2000,20000] [--other-exports 9] [--repeat 5]
+#
+# Assets are synthetic configs written with the stdlib at indent=2, the
+# same layout UAssetGUI produces. --other-exports appends copies of the
+# table export so the parameter table is only a slice of the document, as
+# in real cooked assets.
+
+import argparse
+import copy
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ac7ca import documents
+from ac7ca.documents import JsonSource, get_table_values, json_dumps, json_loads, save_json
+from synthetic import make_config
+
+
+def best_of(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return min(times), statistics.median(times)
+
+
+def bench_size(params, other_exports, repeat, temp_dir):
+    path = os.path.join(temp_dir, f"PlayerPlaneConfig_{params}.json")
+    document = make_config(params)
+    for i in range(other_exports):
+        export = copy.deepcopy(document["Exports"][0])
+        export["ObjectName"] = f"Other{i}"
+        document["Exports"].append(export)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    with open(path, "rb") as f:
+        raw = f.read()
+    out_path = path + ".out"
+    source = JsonSource.read(path)
+    data = source.parse()
+    rows = []
+    for backend in ("stdlib", "orjson"):
+        if backend == "orjson" and documents.orjson is None:
+            continue
+        documents.JSON_BACKEND = backend
+        rows.append((f"load [{backend}]", best_of(lambda: json_loads(raw), repeat)))
+        rows.append((f"full save [{backend}]", best_of(lambda: save_json(data, out_path), repeat)))
+    values = get_table_values(data)
+    entry = values[len(values) // 2]
+
+    def edit_and_save():
+        entry["Value"] = round(entry["Value"] + 0.5, 3)
+        save_json(data, out_path, JsonSource(source.text, source.sections))
+
+    source.locate()   # done once per document, on its first save
+    rows.append(("spliced save [1 entry]", best_of(edit_and_save, repeat)))
+    identical = JsonSource(source.text).render(json_loads(raw))[0].encode("utf-8") == raw
+    print(f"params={params}  {len(raw) / 1e6:.1f} MB  unchanged round trip identical: {identical}")
+    for name, (best, median) in rows:
+        print(f"  {name:<26} {median:>9.1f} ms (min {best:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON load and save")
+    parser.add_argument("--params", default="2000,20000", help="comma-separated entry counts")
+    parser.add_argument("--other-exports", type=int, default=9,
+                        help="extra exports the size of the table in each asset")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for params in (int(p) for p in args.params.split(",")):
+            bench_size(params, args.other_exports, args.repeat, temp_dir)
+
+
+if __name__ == "__main__":
+    main()
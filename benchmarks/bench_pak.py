@@ -0,0 +1,130 @@
+# Reading configs straight out of a pak against extracting them to loose
+# files first, and the cost of repacking with one member replaced.
+#
+#   python benchmarks/bench_pak.py [--planes 200] [--params 2000] [--filler 400]
+#   python benchmarks/bench_pak.py --assets <folder of .uasset/.uexp pairs>
+#
+# Without --assets the members are synthetic cooked configs from the test
+# suite's asset builder next to --filler unrelated members, in a stored
+# and a zlib pak. With --assets the pairs of a folder are packed as they
+# are. Either way the configs are also loaded through NativeAsset, and
+# every run checks that what is read back is byte-identical to what was
+# packed.
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+from ac7ca.documents import uexp_path_for
+from ac7ca.native import write_file_pair
+from ac7ca.pak import PAK_COMPRESSION_METHODS, PakArchive, write_pak
+from synthetic_assets import build_asset
+
+CONTENT_DIR = "Ace7Game/Content/Blueprint/Player/"
+
+
+def best_of(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return min(times)
+
+
+def synthetic_members(planes, params, filler):
+    files = {}
+    for i in range(planes):
+        name = f"{CONTENT_DIR}PlayerPlaneConfig_PL{i:03d}.uasset"
+        files[name], files[uexp_path_for(name)] = build_asset(f"PL{i:03d}", floats=params)
+    for i in range(filler):
+        files[f"Ace7Game/Content/Other/Asset{i:04d}.uasset"] = os.urandom(4096)
+    return files
+
+
+def asset_members(directory):
+    files = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".uasset") and os.path.exists(uexp_path_for(os.path.join(directory, name))):
+            for path in (os.path.join(directory, name), uexp_path_for(os.path.join(directory, name))):
+                with open(path, "rb") as f:
+                    files[CONTENT_DIR + os.path.basename(path)] = f.read()
+    return files
+
+
+def bench_pak(path, files, compression, repeat, temp_dir):
+    write_pak(path, files, compression=PAK_COMPRESSION_METHODS[compression])
+    with PakArchive(path) as pak:
+        names = pak.find()
+        identical = all(pak.read(name) == data for name, data in files.items())
+    loose_dir = os.path.join(temp_dir, "loose")
+
+    def open_index():
+        PakArchive(path).close()
+
+    def read_all():
+        with PakArchive(path) as pak:
+            for name in pak.find():
+                pak.read(name)
+                pak.read(uexp_path_for(name))
+
+    def load_all():
+        with PakArchive(path) as pak:
+            for name in pak.find():
+                pak.load_asset(name).to_document()
+
+    def extract_then_read():
+        shutil.rmtree(loose_dir, ignore_errors=True)
+        os.makedirs(loose_dir)
+        with PakArchive(path) as pak:
+            for name in pak.find():
+                target = os.path.join(loose_dir, os.path.basename(name))
+                write_file_pair(target, pak.read(name), pak.read(uexp_path_for(name)))
+        for name in os.listdir(loose_dir):
+            with open(os.path.join(loose_dir, name), "rb") as f:
+                f.read()
+
+    def repack_one():
+        with PakArchive(path) as pak:
+            pak.repack(path + ".out", {names[0]: files[names[0]] + b" "})
+
+    rows = [
+        ("open + index", best_of(open_index, repeat)),
+        ("read configs", best_of(read_all, repeat)),
+        ("load configs (native)", best_of(load_all, repeat)),
+        ("extract, then read", best_of(extract_then_read, repeat)),
+        ("repack [1 replaced]", best_of(repack_one, repeat))
+    ]
+    print(f"{compression:<5} {len(files)} members, {len(names)} configs, "
+          f"{os.path.getsize(path) / 1e6:.1f} MB  read back identical: {identical}")
+    for name, best in rows:
+        print(f"  {name:<24} {best:>9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pak reading and repacking")
+    parser.add_argument("--planes", type=int, default=200)
+    parser.add_argument("--params", type=int, default=2000)
+    parser.add_argument("--filler", type=int, default=400,
+                        help="unrelated members packed alongside the configs")
+    parser.add_argument("--assets", help="pack the .uasset/.uexp pairs of this folder instead")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if args.assets:
+        files = asset_members(args.assets)
+    else:
+        files = synthetic_members(args.planes, args.params, args.filler)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for compression in PAK_COMPRESSION_METHODS:
+            path = os.path.join(temp_dir, f"{compression}.pak")
+            bench_pak(path, files, compression, args.repeat, temp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Cost of a scripted edit through the script server against one `batch`
+# run per edit (a fresh interpreter that loads, patches and saves).
+#
+#   python benchmarks/bench_rpc.py [--params 2000] [--edits 200] [--clients 4]
+#
+# The server runs in-process on a free localhost port, with the temporary
+# folder as its asset root; --clients threads edit the same document
+# concurrently.
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ac7ca.documents import write_json
+from ac7ca.rpc import DocumentStore, RpcClient, RpcHandler, RpcTcpServer
+from synthetic import make_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+TOKEN = "bench"
+
+
+def start_server(root):
+    options = {"uassetgui_path": None, "engine_version": "VER_UE4_18", "native": True, "timeout": None}
+    server = RpcTcpServer(("127.0.0.1", 0), RpcHandler)
+    server.store = DocumentStore(options, root=root)
+    server.token = TOKEN
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the script server")
+    parser.add_argument("--params", type=int, default=2000)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--batch-runs", type=int, default=3)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "PlayerPlaneConfig_PL001.json")
+        write_json(make_config(args.params), path)
+        server = start_server(temp_dir)
+        port = server.server_address[1]
+        client = RpcClient(port=port, token=TOKEN)
+        start = time.perf_counter()
+        client.call("open", path=path)
+        print(f"open (cold)              {(time.perf_counter() - start) * 1000.0:>9.2f} ms")
+        start = time.perf_counter()
+        client.call("open", path=path)
+        print(f"open (warm)              {(time.perf_counter() - start) * 1000.0:>9.2f} ms")
+        start = time.perf_counter()
+        for i in range(args.edits):
+            client.call("set_parameters", path=path, values={"Param0": 1.0 + i})
+        per_edit = (time.perf_counter() - start) * 1000.0 / args.edits
+        print(f"set_parameters           {per_edit:>9.3f} ms per call")
+
+        def edit_loop():
+            own = RpcClient(port=port, token=TOKEN)
+            for i in range(args.edits):
+                own.call("set_parameters", path=path, scale={"SpeedRot0": 1.0})
+            own.close()
+
+        threads = [threading.Thread(target=edit_loop) for _ in range(args.clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{args.clients} clients              {elapsed * 1000.0 / (args.edits * args.clients):>9.3f} ms per call")
+        start = time.perf_counter()
+        client.call("save", path=path)
+        print(f"save                     {(time.perf_counter() - start) * 1000.0:>9.2f} ms")
+        client.close()
+        server.shutdown()
+        times = []
+        for i in range(args.batch_runs):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, os.path.join(ROOT, "AC7CA.py"), "batch", temp_dir,
+                 "--set", f"Param0={i}", "--workers", "1"],
+                check=True, capture_output=True
+            )
+            times.append((time.perf_counter() - start) * 1000.0)
+        print(f"batch run per edit       {min(times):>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
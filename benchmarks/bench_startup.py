@@ -0,0 +1,72 @@
+# Cold-start cost of the editor, each sample in a fresh interpreter.
+#
+#   python benchmarks/bench_startup.py [--runs 5]
+#
+# "lazy" is what the GUI pays before its window appears now; "eager" adds
+# the matplotlib import and the 3-subplot figure that create_ui used to
+# build up front. With a display, the time until the window has been drawn
+# is measured as well.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPETS = {
+    "lazy import": """
+import time
+start = time.perf_counter()
+import AC7CA
+print((time.perf_counter() - start) * 1000.0)
+""",
+    "eager import + figure": """
+import time
+start = time.perf_counter()
+import AC7CA
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+fig, axes = plt.subplots(3, 1, figsize=(6, 8))
+fig.tight_layout(pad=3)
+print((time.perf_counter() - start) * 1000.0)
+""",
+    "window shown": """
+import time
+start = time.perf_counter()
+import tkinter as tk
+import AC7CA
+root = tk.Tk()
+app = AC7CA.PlaneConfigEditor(root)
+root.update()
+print((time.perf_counter() - start) * 1000.0)
+root.destroy()
+"""
+}
+
+
+def sample(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure editor cold-start time")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    for name, code in SNIPPETS.items():
+        times = [sample(code) for _ in range(args.runs)]
+        if None in times:
+            print(f"{name:<24} skipped (no display?)")
+            continue
+        print(f"{name:<24} {statistics.median(times):>8.1f} ms (min {min(times):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# Times the editor's hot paths on synthetic configs and optionally compares
+# the medians against a stored baseline.
+#
+#   python benchmarks/suite.py --out results.json
+#   python benchmarks/suite.py --baseline baseline.json --save-baseline
+#   python benchmarks/suite.py --baseline baseline.json      # exit 1 on regression
+#
+# Graphs run on the Agg backend and the inspector on stand-in Tk widgets,
+# so no display is needed.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+from bench_apply import FakeRoot, make_editor
+import AC7CA
+from AC7CA import InspectorCategory
+from ac7ca.documents import (
+    JsonSource, get_table_values, json_dumps, reid_document, replace_json, restore_plane_id_refs,
+    save_json, write_json
+)
+from synthetic import make_config
+
+DEFAULT_SIZES = (200, 2000, 20000)
+NOISE_FLOOR_MS = 0.05   # differences below this are never regressions
+
+
+class FakeWidget:
+    # Accepts any Tk call; only the geometry the inspector reads is modelled
+    ROW_HEIGHT = 12   # per gridded child, so a label + value frame is 24px
+
+    def __init__(self, parent=None, *args, **kwargs):
+        self.children = []
+        self.gridded = False
+        self.value = ""
+        if parent is not None:
+            parent.children.append(self)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def grid(self, *args, **kwargs):
+        self.gridded = True
+
+    def grid_remove(self):
+        self.gridded = False
+
+    def winfo_y(self):
+        return 0
+
+    def winfo_height(self):
+        return self.ROW_HEIGHT * sum(1 for child in self.children if child.gridded)
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def insert(self, index, value):
+        self.value = str(value)
+
+
+class FakeCanvas(FakeWidget):
+
+    def winfo_height(self):
+        return 800
+
+    def canvasy(self, y):
+        return y
+
+
+class FakeVar:
+
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class IdleRoot(FakeRoot):
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def run_pending(self):
+        while self.pending:
+            self.pending.pop(next(iter(self.pending)))()
+
+
+def use_fake_tk():
+    AC7CA.tk = type("tk", (), {
+        "Label": FakeWidget, "Frame": FakeWidget, "Entry": FakeWidget, "END": "end", "TclError": tk.TclError
+    })
+    AC7CA.ttk = type("ttk", (), {"Combobox": FakeWidget})
+
+
+def add_fake_inspector(editor):
+    editor.root = IdleRoot()
+    editor.filter_var = FakeVar()
+    editor.inspector_canvas = FakeCanvas()
+    editor.scrollable_frame = FakeWidget()
+    editor.fill_pending = None
+    editor.problems_label = FakeWidget()
+    editor.categories = {
+        title: InspectorCategory(editor.scrollable_frame, title, editor.schedule_fill)
+        for title in ("Speed", "Rotation", "Drift", "Other")
+    }
+
+
+def measure(function, repeat, setup=None):
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "repeat": repeat}
+
+
+def bench_size(params, curve_length, repeat, temp_dir):
+    data = make_config(params, curve_length)
+    editor = make_editor(data)
+    add_fake_inspector(editor)
+    json_path = os.path.join(temp_dir, "PlayerPlaneConfig_PL001.json")
+    reid_path = os.path.join(temp_dir, "PlayerPlaneConfig_PL901.json")
+
+    def edit(name, value):
+        widget = editor.param_widgets[name]
+        if isinstance(widget, dict):
+            widget["X"].insert(0, value)
+        else:
+            widget.insert(0, value)
+
+    def inspector():
+        editor.build_parameter_inspector()
+        editor.root.run_pending()
+
+    source = [JsonSource(json_dumps(editor.data))]
+    entry = get_table_values(editor.data)[-1]
+
+    def splice():
+        source[0] = save_json(editor.data, json_path, source[0])
+
+    def edit_entry():
+        entry["Value"] = round(entry["Value"] + 0.5, 3)
+
+    def reid():
+        refs, _ = reid_document(editor.data, "PL001", "PL901")
+        replace_json(editor.data, reid_path)
+        restore_plane_id_refs(refs)
+
+    cases = {
+        "extract_all_parameters": (editor.extract_all_parameters, None),
+        "extract_graph_data": (editor.extract_graph_data, None),
+        "apply_changes_to_json[one]": (
+            lambda: editor.apply_changes_to_json(names=["Param0"], redraw=False),
+            lambda: edit("Param0", 1.5)
+        ),
+        "apply_changes_to_json[curve]": (
+            lambda: editor.apply_changes_to_json(names=["SpeedRot3"]),
+            lambda: edit("SpeedRot3", 42.0)
+        ),
+        "apply_changes_to_json[all]": (
+            lambda: editor.apply_changes_to_json(names=list(editor.parameters), redraw=False),
+            None
+        ),
+        "update_graphs": (editor.update_graphs, None),
+        "build_parameter_inspector": (inspector, None),
+        "save_json": (lambda: write_json(editor.data, json_path), None),
+        "save_json[splice]": (splice, edit_entry),
+        "replace_plane_id": (reid, None)
+    }
+    results = {}
+    for name, (function, setup) in cases.items():
+        results[f"{name}[params={params}]"] = measure(function, repeat, setup)
+    return results
+
+
+def compare(results, baseline, threshold):
+    # Returns the keys whose best time got slower than baseline * (1 + threshold);
+    # the minimum is much less sensitive to a busy machine than the median
+    regressions = []
+    print(f"{'benchmark (min)':<48} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<48} {'-':>10} {result['min_ms']:>10.3f} {'new':>7}")
+            continue
+        now, before = result["min_ms"], base["min_ms"]
+        ratio = now / before if before else float("inf")
+        flag = ""
+        if ratio > 1.0 + threshold and now - before > NOISE_FLOOR_MS:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<48} {before:>10.3f} {now:>10.3f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the editor's hot paths")
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a result is flagged (0.25 = 25%%)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated entry counts")
+    parser.add_argument("--curve-length", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    use_fake_tk()
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in (int(s) for s in args.sizes.split(",")):
+            results.update(bench_size(size, args.curve_length, args.repeat, temp_dir))
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "platform": platform.platform(),
+            "curve_length": args.curve_length,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": results
+    }
+    if args.out:
+        write_json(report, args.out)
+    if args.baseline and args.save_baseline:
+        write_json(report, args.baseline)
+        print(f"baseline saved to {args.baseline}")
+    if args.baseline and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        print(f"{len(regressions)} regression(s)")
+        return 1 if regressions else 0
+    for key, result in results.items():
+        print(f"{key:<48} {result['median_ms']:>10.3f} ms (min {result['min_ms']:.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# Generates synthetic PlayerPlaneConfig documents in UAssetGUI's JSON layout
+# with a tunable curve length and property count.
+#
+#   python benchmarks/synthetic.py out_dir --count 40 --params 2000 --curve-length 32
+#
+# Values come from a seeded RNG, so the same arguments give the same files.
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ac7ca.documents import PLANE_CONFIG_PREFIX, write_json
+from ac7ca.native import UASSETAPI_TYPES
+
+ENUM_TYPE = "EDriftPostStallManeuverability"
+ENUM_VALUES = ("Kulbit", "Cobra", "None")
+
+
+def float_entry(name, value):
+    return {"$type": UASSETAPI_TYPES["FloatProperty"], "Name": name, "Value": value}
+
+
+def vector_entry(name, x, y, z):
+    return {
+        "$type": UASSETAPI_TYPES["StructProperty"],
+        "StructType": "Vector",
+        "Name": name,
+        "Value": [{
+            "$type": UASSETAPI_TYPES["Vector"],
+            "Name": name,
+            "Value": {"X": x, "Y": y, "Z": z}
+        }]
+    }
+
+
+def make_config(param_count, curve_length=16, plane_id="PL001", seed=0):
+    # param_count is the total number of Table Data entries (at least the
+    # four curves plus the enum and bool entries)
+    rng = random.Random(seed)
+    values = []
+    speed = 0.0
+    for i in range(curve_length):
+        speed += rng.uniform(50.0, 150.0)
+        values.append(float_entry(f"SpeedGraph{i}", round(speed, 3)))
+        values.append(float_entry(f"DiffNoseVelocityR{i}", round(rng.uniform(0.5, 3.0), 3)))
+    for i in range(curve_length):
+        values.append(vector_entry(
+            f"SpeedRot{i}",
+            round(rng.uniform(20.0, 90.0), 3),
+            round(rng.uniform(5.0, 40.0), 3),
+            round(rng.uniform(60.0, 240.0), 3)
+        ))
+    for i in range(curve_length):
+        values.append(vector_entry(
+            f"RotGravR{i}",
+            round(rng.uniform(0.0, 1.0), 3),
+            round(rng.uniform(0.0, 1.0), 3),
+            0.0
+        ))
+    enum_value = f"{ENUM_TYPE}::{rng.choice(ENUM_VALUES)}"
+    values.append({
+        "$type": UASSETAPI_TYPES["EnumProperty"],
+        "EnumType": ENUM_TYPE,
+        "Name": "DriftPostStallManeuverability",
+        "Value": enum_value
+    })
+    values.append({
+        "$type": UASSETAPI_TYPES["BoolProperty"],
+        "Name": "bCanDrift",
+        "Value": rng.random() < 0.5
+    })
+    for i in range(max(param_count - len(values), 0)):
+        values.append(float_entry(f"Param{i}", round(rng.uniform(-1000.0, 1000.0), 3)))
+    object_name = PLANE_CONFIG_PREFIX + plane_id
+    name_map = [
+        "/Script/CoreUObject", "/Script/Engine", "Class", "DataTable", "Package",
+        f"/Game/Blueprint/Player/{object_name}", object_name, "PlaneConfigRow",
+        "FloatProperty", "StructProperty", "Vector", "EnumProperty", "BoolProperty",
+        ENUM_TYPE, enum_value, "None"
+    ] + [entry["Name"] for entry in values]
+    return {
+        "Info": "Synthetic PlayerPlaneConfig",
+        "EngineVersion": "VER_UE4_18",
+        "FolderName": "None",
+        "NameMap": name_map,
+        "Imports": [{
+            "$type": "UAssetAPI.Import, UAssetAPI",
+            "ObjectName": "/Script/Engine",
+            "ClassPackage": "/Script/CoreUObject",
+            "ClassName": "Package"
+        }, {
+            "$type": "UAssetAPI.Import, UAssetAPI",
+            "ObjectName": "DataTable",
+            "ClassPackage": "/Script/CoreUObject",
+            "ClassName": "Class"
+        }],
+        "Exports": [{
+            "$type": UASSETAPI_TYPES["DataTable"],
+            "ObjectName": object_name,
+            "ClassName": "DataTable",
+            "Table": {"Data": [{
+                "$type": UASSETAPI_TYPES["StructProperty"],
+                "Name": "PlaneConfigRow",
+                "Value": values
+            }]}
+        }]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic PlayerPlaneConfig JSON files")
+    parser.add_argument("out_dir")
+    parser.add_argument("--count", type=int, default=1, help="number of planes")
+    parser.add_argument("--params", type=int, default=500, help="entries per config")
+    parser.add_argument("--curve-length", type=int, default=16)
+    parser.add_argument("--first-id", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.out_dir, exist_ok=True)
+    for i in range(args.count):
+        plane_id = f"PL{args.first_id + i:03d}"
+        data = make_config(args.params, args.curve_length, plane_id, args.seed + i)
+        write_json(data, os.path.join(args.out_dir, f"{PLANE_CONFIG_PREFIX}{plane_id}.json"))
+    print(f"{args.count} configs written to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Builds small cooked PlayerPlaneConfig DataTables (.uasset + .uexp) in
+# the layout the native reader expects: a package summary, NameMap,
+# imports, exports, depends and asset registry tables in the .uasset, the
+# DataTable row in the .uexp followed by the package tag. build_pak packs
+# members into any pak version from 1 to 4, which PakWriter (version 4
+# only) cannot. build_document gives the parsed document, for tests of the
+# JSON-level features.
+#
+#   uasset_bytes, uexp_bytes = build_asset("PL001", floats=20)
+#   data = build_document("PL001")
+#   write_asset("PlayerPlaneConfig_PL001.uasset", plane_id="PL001")
+#   build_pak("mod.pak", {"Ace7Game/Content/.../x.uasset": uasset_bytes}, version=2)
+
+import hashlib
+import os
+import struct
+import zlib
+
+from ac7ca.native import PACKAGE_FILE_TAG, NativeAsset, encode_fstring, fname_hashes
+from ac7ca.pak import (
+    DEFAULT_PAK_MOUNT_POINT, PAK_COMPRESSION_NONE, PAK_COMPRESSION_ZLIB, PAK_MAGIC, PAK_VERSION,
+    PakEntry
+)
+
+FAKE_UASSETGUI = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools", "fake_uassetgui.py"
+)
+ENUM_TYPE = "EDriftPostStallManeuverability"
+ENUM_VALUES = (f"{ENUM_TYPE}::Cobra", f"{ENUM_TYPE}::Kulbit")
+EXPORT_ENTRY_SIZE = 104     # one export map entry at VER_UE4_18 with 64-bit sizes
+
+
+def asset_properties(floats, curve_length):
+    # (name, kind, value) in row order; kind is f/v/e/b/i
+    properties = []
+    for i in range(curve_length):
+        properties.append((f"SpeedGraph{i}", "f", 100.0 * i + 0.5))
+        properties.append((f"DiffNoseVelocityR{i}", "f", 1.5))
+    for i in range(curve_length):
+        properties.append((f"SpeedRot{i}", "v", (1.0, 2.0 + i, 3.25)))
+        properties.append((f"RotGravR{i}", "v", (0.5, 0.25, 0.0)))
+    for i in range(floats):
+        properties.append((f"Param{i}", "f", i / 4))
+    properties.append(("DriftPostStallManeuverability", "e", ENUM_VALUES[0]))
+    properties.append(("bSomething", "b", True))
+    properties.append(("IntThing", "i", 42))
+    return properties
+
+
+def build_asset(plane_id="PL001", floats=20, curve_length=8, unversioned=True, legacy=-7,
+                extra_export=False, folder_name="None"):
+    # unversioned=False stores object version 514 in the summary; legacy
+    # -6 adds the texture allocations field; extra_export appends a raw
+    # export after the table so its offset has to move with the table.
+    object_name = f"PlayerPlaneConfig_{plane_id}"
+    names = [
+        "None", "/Script/CoreUObject", "/Script/Engine", "Class", "DataTable", "Default__DataTable",
+        "Package", "RowStruct", "ObjectProperty", "FloatProperty", "StructProperty", "Vector",
+        "EnumProperty", "BoolProperty", "IntProperty", ENUM_TYPE, *ENUM_VALUES,
+        f"/Game/Blueprint/Player/{object_name}", object_name, "PlaneConfigRow", "Row", "Plane_Ref"
+    ]
+    properties = asset_properties(floats, curve_length)
+    for name, _, _ in properties:
+        if name not in names:
+            names.append(name)
+    index = {name: i for i, name in enumerate(names)}
+
+    def fname(name):
+        return struct.pack("<ii", index[name], 0)
+
+    def tag(name, kind, size, extra, value):
+        return fname(name) + fname(kind) + struct.pack("<ii", size, 0) + extra + b"\0" + value
+
+    # ---------------- .uexp ----------------
+    body = tag("RowStruct", "ObjectProperty", 4, b"", struct.pack("<i", -2)) + fname("None")
+    body += struct.pack("<ii", 0, 1)   # no object guid, one row
+    body += fname("Row")
+    for name, kind, value in properties:
+        if kind == "f":
+            body += tag(name, "FloatProperty", 4, b"", struct.pack("<f", value))
+        elif kind == "v":
+            body += tag(name, "StructProperty", 12, fname("Vector") + b"\0" * 16, struct.pack("<fff", *value))
+        elif kind == "e":
+            body += tag(name, "EnumProperty", 8, fname(ENUM_TYPE), fname(value))
+        elif kind == "b":
+            body += fname(name) + fname("BoolProperty") + struct.pack("<ii", 0, 0) + bytes([value, 0])
+        else:
+            body += tag(name, "IntProperty", 4, b"", struct.pack("<i", value))
+    body += fname("None") + struct.pack("<i", 0)
+    raw_export = b"RAWEXPORTDATA123" if extra_export else b""
+    uexp = body + raw_export + struct.pack("<I", PACKAGE_FILE_TAG)
+    # ---------------- .uasset ----------------
+    imports = (
+        fname("/Script/CoreUObject") + fname("Package") + struct.pack("<i", 0) + fname("/Script/Engine")
+        + fname("/Script/CoreUObject") + fname("Class") + struct.pack("<i", -1) + fname("DataTable")
+    )
+    export_count = 2 if extra_export else 1
+    name_bytes = b"".join(encode_fstring(name) + struct.pack("<HH", *fname_hashes(name)) for name in names)
+
+    def summary(header_size=0, name_offset=0, import_offset=0, export_offset=0, depends_offset=0,
+                registry_offset=0, bulk_offset=0, preload_offset=0):
+        out = struct.pack("<Ii", PACKAGE_FILE_TAG, legacy)
+        if legacy != -4:
+            out += struct.pack("<i", 864)
+        out += struct.pack("<iii", 0 if unversioned else 514, 0, 0)
+        out += struct.pack("<i", header_size) + encode_fstring(folder_name) + struct.pack("<I", 0x80000000)
+        out += struct.pack("<ii", len(names), name_offset)
+        out += struct.pack("<ii", 0, 0)   # gatherable text
+        out += struct.pack("<iiii", export_count, export_offset, 2, import_offset)
+        out += struct.pack("<i", depends_offset)
+        out += struct.pack("<iii", 0, 0, 0)   # soft package references, searchable names
+        out += struct.pack("<i", 0)   # thumbnails
+        out += b"G" * 16
+        out += struct.pack("<iii", 1, export_count, len(names))   # one generation
+        for changelist in (1234, 0):
+            out += struct.pack("<HHHI", 4, 18, 0, changelist) + encode_fstring("++UE4+Release-4.18")
+        out += struct.pack("<Iii", 0, 0, 0x1234)   # compression flags, chunks, package source
+        out += struct.pack("<i", 0)   # additional packages to cook
+        if legacy > -7:
+            out += struct.pack("<i", 0)
+        out += struct.pack("<iqi", registry_offset, bulk_offset, 0)
+        out += struct.pack("<i", 0)   # chunk ids
+        out += struct.pack("<ii", 0, preload_offset)
+        return out
+
+    name_offset = len(summary())
+    import_offset = name_offset + len(name_bytes)
+    export_offset = import_offset + len(imports)
+    depends_offset = export_offset + EXPORT_ENTRY_SIZE * export_count
+    registry_offset = depends_offset + 4 * export_count
+    header_size = registry_offset + 4
+
+    def export(class_index, offset, size, name):
+        out = struct.pack("<iiii", class_index, 0, 0, 0) + fname(name) + struct.pack("<I", 8)
+        out += struct.pack("<qq", size, offset) + struct.pack("<iii", 0, 0, 0) + b"\0" * 16
+        out += struct.pack("<Iii", 0, 0, 1) + struct.pack("<iiiii", -1, 0, 0, 0, 0)
+        return out
+
+    exports = export(-2, header_size, len(body), object_name)
+    if extra_export:
+        exports += export(-1, header_size + len(body), len(raw_export), "Plane_Ref")
+    uasset = summary(
+        header_size, name_offset, import_offset, export_offset, depends_offset,
+        registry_offset, header_size + len(uexp) - 4, header_size
+    )
+    uasset += name_bytes + imports + exports + struct.pack("<i", 0) * export_count + struct.pack("<i", 0)
+    assert len(uasset) == header_size
+    return uasset, uexp
+
+
+def build_document(plane_id="PL001", **kwargs):
+    # The asset as UAssetGUI-style JSON
+    return NativeAsset(*build_asset(plane_id, **kwargs)).to_document()
+
+
+def write_asset(uasset_path, **kwargs):
+    uasset, uexp = build_asset(**kwargs)
+    with open(uasset_path, "wb") as f:
+        f.write(uasset)
+    with open(os.path.splitext(uasset_path)[0] + ".uexp", "wb") as f:
+        f.write(uexp)
+    return uasset_path
+
+
+def build_pak(path, files, version=PAK_VERSION, compression=PAK_COMPRESSION_NONE, block_size=256,
+              encrypted_index=False, encrypted=()):
+    # files: name → bytes. zlib members are split into block_size blocks
+    # (only versions 3 and 4 store block ranges). encrypted_index sets the
+    # version 4 footer flag; members named in encrypted get the entry flag.
+    # Neither encrypts anything.
+    out = bytearray()
+    entries = []
+    for name, data in files.items():
+        offset = len(out)
+        entry = PakEntry(offset, 0, len(data), compression, encrypted=name in encrypted)
+        if compression == PAK_COMPRESSION_ZLIB:
+            chunks = [zlib.compress(data[i:i + block_size]) for i in range(0, len(data), block_size)]
+            entry.blocks = [(0, 0)] * len(chunks)
+            entry.block_size = min(block_size, len(data))
+            start = offset + entry.header_size(version)
+            for i, chunk in enumerate(chunks):
+                entry.blocks[i] = (start, start + len(chunk))
+                start += len(chunk)
+            payload = b"".join(chunks)
+        else:
+            payload = data
+        entry.size = len(payload)
+        entry.sha1 = hashlib.sha1(payload).digest()
+        out += entry.encode(0, version) + payload
+        entries.append((name, entry))
+    index_offset = len(out)
+    index = encode_fstring(DEFAULT_PAK_MOUNT_POINT) + struct.pack("<i", len(entries))
+    index += b"".join(encode_fstring(name) + entry.encode(version=version) for name, entry in entries)
+    out += index
+    if version >= 4:
+        out += struct.pack("<B", encrypted_index)
+    out += struct.pack("<Iiqq", PAK_MAGIC, version, index_offset, len(index)) + hashlib.sha1(index).digest()
+    with open(path, "wb") as f:
+        f.write(out)
+    return path
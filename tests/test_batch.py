@@ -0,0 +1,33 @@
+import pytest
+
+from ac7ca.cli import main
+from ac7ca.documents import extract_parameters, read_json, set_entry_value, write_json
+from synthetic_assets import build_document
+from test_merge import entry
+
+
+def test_vector_values():
+    data = build_document()
+    vector = entry(data, "SpeedRot0")
+    set_entry_value(data, vector, ["4", 5, 6.5])
+    set_entry_value(data, vector, {"Y": "7"})
+    assert vector["Value"][0]["Value"] == {"X": 4.0, "Y": 7.0, "Z": 6.5}
+    for value in (5.0, "5", [1, 2], {"W": 1.0}):
+        with pytest.raises(ValueError, match="SpeedRot0 is a vector"):
+            set_entry_value(data, vector, value)
+    assert vector["Value"][0]["Value"] == {"X": 4.0, "Y": 7.0, "Z": 6.5}
+
+
+def test_batch_command_reports_bad_values_per_file(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "PlayerPlaneConfig_PL001.json"
+    write_json(build_document(), str(path))
+    original = path.read_bytes()
+    assert main(["batch", str(tmp_path), "--set", "Param3=2", "--set", "SpeedRot0=5", "--workers", "1"]) == 1
+    assert "SpeedRot0 is a vector" in capsys.readouterr().out
+    assert path.read_bytes() == original
+    assert main(["batch", str(tmp_path), "--set", "SpeedRot0=1,2,3", "--set", "SpeedRot1.Z=9",
+                 "--workers", "1"]) == 0
+    parameters = extract_parameters(read_json(str(path)))[0]
+    assert parameters["SpeedRot0"] == {"X": 1.0, "Y": 2.0, "Z": 3.0}
+    assert parameters["SpeedRot1"] == {"X": 1.0, "Y": 3.0, "Z": 9.0}
@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+import pytest
+
+from ac7ca.curves import CAPABILITY_METRICS, CurveModel, analyze_capabilities, curve_model_capabilities
+from synthetic_assets import build_document
+
+NAN = math.nan
+
+
+def vectors(pitch, yaw, roll):
+    return np.stack([pitch, yaw, roll], axis=-1)
+
+
+def fleet():
+    # PL-A: four knots; PL-B: two unsorted knots, NaN-padded; PL-C: no curves
+    speed_graph = np.array([[100.0, 200.0, 300.0, 400.0], [300.0, 100.0, NAN, NAN], [NAN] * 4])
+    diff_nose = np.array([[1.0, 2.0, 3.0, 2.0], [4.0, 2.0, NAN, NAN], [NAN] * 4])
+    speed_rot = vectors(
+        [[10.0, 40.0, 30.0, 20.0], [5.0, 15.0, NAN, NAN], [NAN] * 4],
+        [[1.0, 1.0, 1.0, 1.0], [2.0, 2.0, NAN, NAN], [NAN] * 4],
+        [[5.0, 6.0, 7.0, 8.0], [9.0, 3.0, NAN, NAN], [NAN] * 4],
+    )
+    rot_grav = vectors(
+        [[1.0, 1.0, 1.0, 1.0], [2.0, 2.0, NAN, NAN], [NAN] * 4],
+        [[0.0, 0.0, 0.0, 0.0], [1.0, 3.0, NAN, NAN], [NAN] * 4],
+        [[0.0] * 4, [0.0, 0.0, NAN, NAN], [NAN] * 4],
+    )
+    return speed_graph, diff_nose, speed_rot, rot_grav
+
+
+def test_capabilities_of_a_padded_fleet():
+    results = analyze_capabilities(*fleet())
+    assert set(results) == set(CAPABILITY_METRICS)
+    assert list(results["min_speed"][:2]) == [100.0, 100.0]
+    assert list(results["max_speed"][:2]) == [400.0, 300.0]
+    # Linear peaks sit on a knot, which is always on the grid
+    assert list(results["peak_pitch_rate"][:2]) == [40.0, 15.0]
+    assert list(results["peak_pitch_speed"][:2]) == [200.0, 100.0]
+    assert list(results["peak_roll_speed"][:2]) == [400.0, 300.0]
+    assert list(results["peak_diff_nose"][:2]) == [3.0, 4.0]
+    # Pitch ≥ 36 between 186.7 and 240 (90% of the peak)
+    assert results["corner_low"][0] == pytest.approx(186.67, abs=1.2)
+    assert results["corner_high"][0] == pytest.approx(240.0, abs=1.2)
+    assert list(results["grav_inverted"][:2]) == pytest.approx([300.0, 400.0])
+    assert results["grav_side"][1] == pytest.approx(400.0)   # 1 → 3 over 200
+    assert all(math.isnan(values[2]) for values in results.values())
+
+
+def test_capability_options():
+    linear = analyze_capabilities(*fleet(), samples=16)
+    cubic = analyze_capabilities(*fleet(), samples=16, mode="cubic")
+    assert list(cubic["max_speed"][:2]) == list(linear["max_speed"][:2])
+    assert cubic["peak_pitch_rate"][0] >= linear["peak_pitch_rate"][0]
+    wide = analyze_capabilities(*fleet(), band=0.5)
+    assert wide["corner_low"][0] < linear["corner_low"][0]
+    with pytest.raises(ValueError):
+        analyze_capabilities(*fleet(), mode="quadratic")
+
+
+def test_one_plane_matches_the_batch():
+    model = CurveModel(build_document(curve_length=6))
+    single = curve_model_capabilities(model)
+    batch = analyze_capabilities(
+        np.stack([model.speed_graph, np.full(6, NAN)]), np.stack([model.diff_nose, np.full(6, NAN)]),
+        np.stack([model.speed_rot, np.full((6, 3), NAN)]), np.stack([model.rot_grav, np.full((6, 3), NAN)])
+    )
+    assert single == pytest.approx({name: values[0] for name, values in batch.items()})
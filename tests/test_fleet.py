@@ -0,0 +1,77 @@
+import math
+import os
+
+import pytest
+
+from ac7ca.documents import PLANE_CONFIG_PREFIX, write_json
+from ac7ca.fleet import FleetIndex
+from synthetic_assets import build_document
+from test_merge import edited
+
+OPTIONS = {"uassetgui_path": None, "engine_version": "VER_UE4_18", "native": True, "timeout": None,
+           "cache_dir": None, "cache_max_bytes": 0}
+
+
+def write_config(directory, plane_id, params=None, **kwargs):
+    data = edited(build_document(plane_id, **kwargs), **(params or {}))
+    path = str(directory / f"PlayerPlaneConfig_{plane_id}.json")
+    write_json(data, path)
+    return path
+
+
+def build_index(directory):
+    index = FleetIndex.open(str(directory / ".ac7ca_index"))
+    stats = index.update(str(directory), PLANE_CONFIG_PREFIX + "*", OPTIONS, workers=1)
+    index.save()
+    return index, stats
+
+
+def test_query_filters_sorts_and_reduces_curves(tmp_path):
+    write_config(tmp_path, "PL001", {"Param1": "2.5"}, curve_length=8)
+    write_config(tmp_path, "PL002", {"Param1": "0.5"}, curve_length=4)
+    write_config(tmp_path, "PL003", {"Param1": "7.5"}, curve_length=12)
+    index, stats = build_index(tmp_path)
+    assert (stats["added"], stats["failed"]) == (3, [])
+    index = FleetIndex.open(str(tmp_path / ".ac7ca_index"))   # memory-mapped columns
+    rows = index.query("Param1 > 1", show=["max(SpeedRot.yaw)"], sort="Param1", descending=True)
+    assert [row["plane_id"] for row in rows] == ["PL003", "PL001"]
+    assert rows[0] == {"plane_id": "PL003", "file": "PlayerPlaneConfig_PL003.json",
+                       "max(SpeedRot.yaw)": 13.0, "Param1": 7.5}
+    rows = index.query("len(SpeedGraph) >= 8 and max(SpeedGraph) < 1000", sort="len(SpeedGraph)")
+    assert [(row["plane_id"], row["max(SpeedGraph)"]) for row in rows] == [("PL001", 700.5)]
+    assert list(index.metric("IntThing")) == [42.0, 42.0, 42.0]
+    assert "SpeedRot0.Y" not in index.columns   # curve points are only in the curves
+    with pytest.raises(KeyError):
+        index.metric("max(SpeedRot)")   # needs an axis
+    with pytest.raises(KeyError):
+        index.metric("Missing")
+    with pytest.raises(ValueError):
+        index.where("Param1 ~ 2")
+
+
+def test_update_refreshes_changed_rows_and_columns(tmp_path):
+    write_config(tmp_path, "PL001")
+    second = write_config(tmp_path, "PL002")
+    third = write_config(tmp_path, "PL003", floats=30)
+    index, _ = build_index(tmp_path)
+    assert "Param29" in index.columns
+    # A rewrite with the same content is recognised by its hash
+    with open(second, "rb") as f:
+        content = f.read()
+    with open(second, "wb") as f:
+        f.write(content)
+    os.utime(second, ns=(1, 1))
+    index, stats = build_index(tmp_path)
+    assert (stats["unchanged"], stats["updated"]) == (3, 0)
+    assert index.planes[1]["mtime_ns"] == 1
+    # New parameters add a column; the other planes have no value there
+    write_config(tmp_path, "PL002", {"Param1": "9.0"}, floats=25)
+    os.remove(third)
+    index, stats = build_index(tmp_path)
+    assert (stats["unchanged"], stats["updated"], stats["removed"]) == (1, 1, 1)
+    assert [plane["plane_id"] for plane in index.planes] == ["PL001", "PL002"]
+    assert "Param24" in index.columns and "Param29" not in index.columns
+    values = index.metric("Param24")
+    assert math.isnan(values[0]) and values[1] == 6.0
+    assert [row["plane_id"] for row in index.query("Param1 == 9")] == ["PL002"]
+    assert index.row(1)["scalars"]["Param1"] == 9.0
@@ -0,0 +1,106 @@
+import copy
+
+from ac7ca.documents import get_table_values, set_entry_value
+from ac7ca.journal import EditJournal
+from synthetic_assets import build_document
+
+
+def position(data, name):
+    return next(i for i, e in enumerate(get_table_values(data)) if e["Name"] == name)
+
+
+def edit(journal, data, values, label="edit", merge_key=None):
+    # Sets name → value the way the editor does and journals the deltas
+    changes = {}
+    for name, value in values.items():
+        key = position(data, name)
+        entry = get_table_values(data)[key]
+        before = copy.deepcopy(entry["Value"])
+        set_entry_value(data, entry, value)
+        EditJournal.note(changes, key, before, copy.deepcopy(entry["Value"]))
+    return journal.commit(changes, label, merge_key)
+
+
+def restore(data, step):
+    label, values = step
+    for key, value in values.items():
+        get_table_values(data)[key]["Value"] = copy.deepcopy(value)
+    return label
+
+
+def test_undo_and_redo_walk_the_document_states():
+    journal = EditJournal(1 << 20)
+    data = build_document()
+    states = [copy.deepcopy(data)]
+    assert edit(journal, data, {"Param3": "1.5"}, "first")
+    states.append(copy.deepcopy(data))
+    assert edit(journal, data, {"Param3": "2.5", "SpeedRot0": {"X": 9.0, "Y": 8.0, "Z": 7.0}}, "second")
+    states.append(copy.deepcopy(data))
+    assert not edit(journal, data, {"Param3": "2.5"})   # no change, no step
+    assert restore(data, journal.undo()) == "second"
+    assert data == states[1]
+    assert restore(data, journal.undo()) == "first"
+    assert data == states[0]
+    assert journal.undo() is None
+    assert restore(data, journal.redo()) == "first"
+    assert data == states[1]
+    assert journal.stats()["undo"] == 1 and journal.stats()["redo"] == 1
+    edit(journal, data, {"Param4": "4.0"})
+    assert journal.redo() is None   # a new edit drops the redo steps
+
+
+def test_keystrokes_in_one_field_merge_into_one_step():
+    journal = EditJournal(1 << 20)
+    data = build_document()
+    original = copy.deepcopy(data)
+    for value in ("1", "12", "12.5"):
+        edit(journal, data, {"Param3": value}, "Param3", merge_key=("edit", "Param3"))
+    edit(journal, data, {"Param4": "3"}, "Param4", merge_key=("edit", "Param4"))
+    assert journal.stats()["undo"] == 2
+    restore(data, journal.undo())
+    restore(data, journal.undo())
+    assert data == original
+    journal.MERGE_WINDOW_S = 0
+    edit(journal, data, {"Param3": "1"}, merge_key=("edit", "Param3"))
+    edit(journal, data, {"Param3": "2"}, merge_key=("edit", "Param3"))
+    assert journal.stats()["undo"] == 2
+
+
+def test_revert_restores_the_baseline_as_one_undoable_step():
+    journal = EditJournal(1 << 20)
+    data = build_document()
+    original = copy.deepcopy(data)
+    edit(journal, data, {"Param3": "7"})
+    edit(journal, data, {"Param3": "8", "SpeedGraph2": "99"})
+    edited = copy.deepcopy(data)
+    values = get_table_values(data)
+    assert restore(data, journal.revert(lambda key: values[key]["Value"])) == "Revert"
+    assert data == original
+    assert journal.revert(lambda key: values[key]["Value"]) is None   # nothing left to revert
+    restore(data, journal.undo())
+    assert data == edited
+
+
+def test_memory_cap_drops_the_oldest_steps_only():
+    data = build_document()
+    journal = EditJournal(1)
+    original = copy.deepcopy(data)
+    for i in range(5):
+        edit(journal, data, {f"Param{i}": "100"})
+    assert journal.stats()["undo"] == 1 and journal.stats()["dropped"] == 4
+    values = get_table_values(data)
+    restore(data, journal.revert(lambda key: values[key]["Value"]))
+    assert data == original   # the baseline outlives the dropped steps
+
+
+def test_disk_values_follow_saves():
+    journal = EditJournal(1 << 20)
+    data = build_document()
+    param3, param4 = position(data, "Param3"), position(data, "Param4")
+    loaded = copy.deepcopy(get_table_values(data))
+    edit(journal, data, {"Param3": "5"})
+    assert journal.disk_value(param3, None) == loaded[param3]["Value"]
+    journal.mark_saved({param3: 5.0})
+    edit(journal, data, {"Param4": "6"})   # edited after the save started
+    assert journal.disk_value(param3, None) == 5.0
+    assert journal.disk_value(param4, None) == loaded[param4]["Value"]
@@ -0,0 +1,117 @@
+import json
+import math
+import os
+import sys
+
+import pytest
+
+from ac7ca import documents
+from ac7ca.documents import (
+    JsonSource, get_table_values, json_dumps, json_loads, save_json, set_entry_value, write_json
+)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from synthetic import make_config
+from synthetic_assets import ENUM_TYPE, build_document
+
+needs_orjson = pytest.mark.skipif(documents.orjson is None, reason="orjson is not installed")
+
+SPECIAL_VALUES = {
+    "null": None,
+    "nan": math.nan,
+    "infinity": -math.inf,
+    "small exponent": 1.5e-05,
+    "large exponent": 2.5e+17,
+    "smallest": 5e-324,
+    "zero": -0.0,
+    "non-ASCII": "Flügel 翼",
+    "DEL": "a\x7fb",
+    "control": "tab\tnul\x00",
+    "huge int": 2 ** 70,
+    "tuple": (1.0, 1e-07)
+}
+
+
+@pytest.fixture
+def backend():
+    saved = documents.JSON_BACKEND
+    yield lambda name: setattr(documents, "JSON_BACKEND", name)
+    documents.JSON_BACKEND = saved
+
+
+def encode(backend, name, value):
+    backend(name)
+    return json_dumps(value)
+
+
+@needs_orjson
+def test_backends_write_identical_configs(backend):
+    data = make_config(500)
+    data["FolderName"] = None   # UAssetGUI writes null for unset fields
+    assert encode(backend, "orjson", data) == encode(backend, "stdlib", data) == json.dumps(data, indent=2)
+
+
+@needs_orjson
+@pytest.mark.parametrize("value", SPECIAL_VALUES.values(), ids=list(SPECIAL_VALUES))
+def test_backends_write_identical_special_values(backend, value):
+    data = make_config(50)
+    get_table_values(data)[-1]["Value"] = value
+    assert encode(backend, "orjson", data) == encode(backend, "stdlib", data)
+
+
+@needs_orjson
+def test_files_do_not_depend_on_the_backend(backend, tmp_path):
+    data = make_config(200)
+    get_table_values(data)[0]["Value"] = math.nan
+    outputs = []
+    for name in ("orjson", "stdlib"):
+        backend(name)
+        path = tmp_path / f"{name}.json"
+        write_json(data, path)
+        save_json(data, tmp_path / f"{name}.spliced.json", JsonSource(json_dumps(data)))
+        outputs.append((path.read_bytes(), (tmp_path / f"{name}.spliced.json").read_bytes()))
+    assert outputs[0] == outputs[1]
+    assert math.isnan(get_table_values(json_loads(outputs[0][0]))[0]["Value"])
+
+
+def entry(data, name):
+    return next(e for e in get_table_values(data) if e["Name"] == name)
+
+
+def assert_spliced(source, data):
+    text, sections = source.render(data)
+    assert sections is not None   # spliced, not re-encoded
+    assert text == json_dumps(data).replace("\n", source.newline)
+    assert json_loads(text) == data
+    return JsonSource(text, sections)
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"), ids=("LF", "CRLF"))
+def test_splice_of_edited_entries_matches_a_full_encode(newline):
+    data = build_document(curve_length=12)
+    source = JsonSource(json_dumps(data).replace("\n", newline))
+    names = list(data["NameMap"])
+    set_entry_value(data, entry(data, "Param3"), "1234.5")
+    set_entry_value(data, entry(data, "SpeedRot3"), {"X": 40.0, "Y": -2.5, "Z": 0.125})
+    for i in range(12):
+        set_entry_value(data, entry(data, f"SpeedGraph{i}"), str(250.0 * i))
+    set_entry_value(data, entry(data, "DriftPostStallManeuverability"), "Immelmann")
+    assert data["NameMap"] == names + [f"{ENUM_TYPE}::Immelmann"]
+    source = assert_spliced(source, data)
+    # The next save splices into the previous output
+    set_entry_value(data, entry(data, "DiffNoseVelocityR0"), "3.75")
+    set_entry_value(data, entry(data, "DriftPostStallManeuverability"), "Pugachev")
+    source = assert_spliced(source, data)
+    assert assert_spliced(source, data).text == source.text
+
+
+def test_spliced_save_writes_the_rendered_text(tmp_path):
+    data = build_document()
+    path = tmp_path / "PlayerPlaneConfig_PL001.json"
+    write_json(data, path)
+    source = JsonSource.read(path)
+    data = source.parse()
+    set_entry_value(data, entry(data, "SpeedRot0"), {"X": 1.0, "Y": 2.0, "Z": 3.0})
+    save_json(data, path, source)
+    assert path.read_text(encoding="utf-8") == json_dumps(data)
+    assert json_loads(path.read_bytes()) == data
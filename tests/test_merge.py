@@ -0,0 +1,106 @@
+import copy
+import os
+
+from ac7ca.cli import main
+from ac7ca.documents import (
+    extract_parameters, get_table_values, read_json, set_entry_value, write_json
+)
+from ac7ca.merge import diff_documents, merge_documents
+from synthetic_assets import FAKE_UASSETGUI, build_document
+
+
+def entry(data, name):
+    return next(e for e in get_table_values(data) if e["Name"] == name)
+
+
+def edited(data, **values):
+    data = copy.deepcopy(data)
+    for name, value in values.items():
+        set_entry_value(data, entry(data, name), value)
+    return data
+
+
+def write_sides(tmp_path, base, ours, theirs):
+    paths = []
+    for side, data in (("base", base), ("ours", ours), ("theirs", theirs)):
+        paths.append(str(tmp_path / f"{side}.json"))
+        write_json(data, paths[-1])
+    return paths
+
+
+def test_merge_into_a_uasset_leaves_ours_unchanged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base = build_document()
+    paths = write_sides(tmp_path, base, edited(base, Param3="7.5"), edited(base, Param5="2.5"))
+    with open(paths[1], "rb") as f:
+        ours = f.read()
+    out = str(tmp_path / "merged.uasset")
+    assert main(["merge", *paths, "--out", out, "--uassetgui", FAKE_UASSETGUI]) == 0
+    with open(paths[1], "rb") as f:
+        assert f.read() == ours
+    merged = extract_parameters(read_json(out))[0]   # the fake UAssetGUI writes JSON
+    assert (merged["Param3"], merged["Param5"]) == (7.5, 2.5)
+    assert sorted(os.listdir(tmp_path)) == ["base.json", "merged.uasset", "merged.uexp", "ours.json",
+                                            "theirs.json"]
+
+
+def test_diff_lists_added_removed_and_changed_entries():
+    old = build_document()
+    new = edited(old, Param3="7.5", SpeedRot0={"X": 1.0, "Y": 4.0, "Z": 3.25})
+    values = get_table_values(new)
+    values.remove(entry(new, "Param5"))
+    values.append(dict(copy.deepcopy(entry(new, "Param6")), Name="Param99"))
+    assert diff_documents(old, old) == []
+    changes = {change["name"]: change for change in diff_documents(old, new)}
+    assert changes["Param3"] == {"name": "Param3", "change": "changed", "old": 0.75, "new": 7.5,
+                                 "delta": 6.75}
+    assert changes["SpeedRot0"]["delta"] == {"X": 0.0, "Y": 2.0, "Z": 0.0}
+    assert changes["Param5"]["change"] == "removed" and changes["Param99"]["change"] == "added"
+    assert list(changes)[-1] == "Param5"   # removed entries come last
+
+
+def test_merge_takes_changes_from_both_sides():
+    base = build_document()
+    ours = edited(base, Param3="7.5", SpeedRot0={"X": 9.0, "Y": 2.0, "Z": 3.25})
+    theirs = edited(base, Param5="2.5", SpeedRot0={"X": 1.0, "Y": 8.0, "Z": 3.25})
+    get_table_values(theirs).remove(entry(theirs, "Param6"))
+    get_table_values(theirs).append(dict(copy.deepcopy(entry(theirs, "Param7")), Name="Param99"))
+    merged, taken, conflicts = merge_documents(base, ours, theirs)
+    assert conflicts == []
+    assert sorted(taken) == ["Param5", "Param6", "Param99", "SpeedRot0"]
+    parameters = extract_parameters(merged)[0]
+    assert (parameters["Param3"], parameters["Param5"], parameters["Param99"]) == (7.5, 2.5, 1.75)
+    assert parameters["SpeedRot0"] == {"X": 9.0, "Y": 8.0, "Z": 3.25}
+    assert "Param6" not in parameters and "Param99" in merged["NameMap"]
+    assert extract_parameters(ours)[0]["Param5"] == 1.25   # inputs are not modified
+
+
+def test_conflicts_keep_the_preferred_side():
+    base = build_document()
+    ours = edited(base, Param3="7.5", SpeedRot0={"X": 9.0, "Y": 2.0, "Z": 3.25})
+    theirs = edited(base, Param3="9.0", SpeedRot0={"X": 4.0, "Y": 2.0, "Z": 3.25})
+    for prefer, kept in (("ours", ours), ("theirs", theirs)):
+        merged, taken, conflicts = merge_documents(base, ours, theirs, prefer)
+        assert taken == []
+        assert [conflict["name"] for conflict in conflicts] == ["SpeedRot0", "Param3"]
+        assert conflicts[1] == {"name": "Param3", "base": 0.75, "ours": 7.5, "theirs": 9.0}
+        assert get_table_values(merged) == get_table_values(kept)
+
+
+def test_merge_and_diff_commands(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    base = build_document()
+    paths = write_sides(tmp_path, base, edited(base, Param3="7.5", Param4="1.5"),
+                        edited(base, Param3="9.0", Param5="2.5"))
+    out = str(tmp_path / "merged.json")
+    report = str(tmp_path / "report.json")
+    assert main(["merge", *paths, "--out", out, "--prefer", "theirs", "--report", report]) == 1
+    assert "1 change(s) merged" in capsys.readouterr().out
+    merged = extract_parameters(read_json(out))[0]
+    assert (merged["Param3"], merged["Param4"], merged["Param5"]) == (9.0, 1.5, 2.5)
+    assert read_json(report)["conflicts"] == [
+        {"name": "Param3", "base": 0.75, "ours": 7.5, "theirs": 9.0}
+    ]
+    assert main(["diff", paths[2], out]) == 1
+    assert "Param4" in capsys.readouterr().out
+    assert main(["diff", paths[0], paths[0]]) == 0
@@ -0,0 +1,117 @@
+import struct
+
+import pytest
+
+from ac7ca.conversion import load_document
+from ac7ca.documents import extract_parameters, get_table_values, reid_document, set_entry_value
+from ac7ca.native import NativeAsset, NativeAssetError
+from synthetic_assets import ENUM_TYPE, ENUM_VALUES, build_asset, write_asset
+
+VARIANTS = {
+    "unversioned": {},
+    "versioned": {"unversioned": False, "legacy": -6},
+    "extra export": {"extra_export": True},
+    "large": {"floats": 400, "curve_length": 24},
+    "folder name": {"folder_name": "/Game/Blueprint/Player/PlayerPlaneConfig_PL001"}
+}
+
+
+def entry(data, name):
+    return next(e for e in get_table_values(data) if e["Name"] == name)
+
+
+def reparse(asset, data):
+    return NativeAsset(*asset.serialize(data))
+
+
+@pytest.mark.parametrize("options", VARIANTS.values(), ids=list(VARIANTS))
+def test_unchanged_document_round_trips_byte_for_byte(options):
+    uasset, uexp = build_asset(**options)
+    asset = NativeAsset(uasset, uexp)
+    assert asset.serialize(asset.to_document()) == (uasset, uexp)
+
+
+def test_edited_float_changes_only_its_value():
+    asset = NativeAsset(*build_asset())
+    data = asset.to_document()
+    set_entry_value(data, entry(data, "Param3"), "1234.5")
+    uasset, uexp = asset.serialize(data)
+    assert uasset == asset.uasset
+    assert len(uexp) == len(asset.uexp)
+    assert sum(a != b for a, b in zip(uexp, asset.uexp)) <= 4
+    assert extract_parameters(NativeAsset(uasset, uexp).to_document())[0]["Param3"] == 1234.5
+
+
+@pytest.mark.parametrize("extra_export", (False, True))
+def test_added_name_shifts_header_and_export_offsets(extra_export):
+    asset = NativeAsset(*build_asset(extra_export=extra_export))
+    data = asset.to_document()
+    set_entry_value(data, entry(data, "DriftPostStallManeuverability"), "Immelmann")
+    assert data["NameMap"][-1] == f"{ENUM_TYPE}::Immelmann"
+    new = reparse(asset, data)
+    delta = len(new.uasset) - len(asset.uasset)
+    assert delta == 4 + len(f"{ENUM_TYPE}::Immelmann") + 1 + 4
+    assert new.names == data["NameMap"]
+    assert new.get_field("NameCount") == asset.get_field("NameCount") + 1
+    for field in ("ImportOffset", "ExportOffset", "DependsOffset", "AssetRegistryDataOffset"):
+        assert new.get_field(field) == asset.get_field(field) + delta
+    assert new.get_field("BulkDataStartOffset") == asset.get_field("BulkDataStartOffset") + delta
+    for old_export, new_export in zip(asset.exports, new.exports):
+        assert new_export["SerialOffset"] == old_export["SerialOffset"] + delta
+        assert new_export["SerialSize"] == old_export["SerialSize"]
+    assert len(new.uexp) == len(asset.uexp)
+    assert entry(new.to_document(), "DriftPostStallManeuverability")["Value"] == f"{ENUM_TYPE}::Immelmann"
+    assert extract_parameters(new.to_document())[0]["Param5"] == extract_parameters(data)[0]["Param5"]
+    if extra_export:
+        start = new.exports[1]["SerialOffset"] - len(new.uasset)
+        assert new.uexp[start:start + 16] == b"RAWEXPORTDATA123"
+
+
+def test_enum_change_to_an_existing_name_keeps_the_layout():
+    asset = NativeAsset(*build_asset())
+    data = asset.to_document()
+    names = list(data["NameMap"])
+    set_entry_value(data, entry(data, "DriftPostStallManeuverability"), ENUM_VALUES[1])
+    uasset, uexp = asset.serialize(data)
+    assert data["NameMap"] == names
+    assert uasset == asset.uasset
+    assert uexp != asset.uexp and len(uexp) == len(asset.uexp)
+    new = NativeAsset(uasset, uexp)
+    assert entry(new.to_document(), "DriftPostStallManeuverability")["Value"] == ENUM_VALUES[1]
+
+
+def test_folder_name_is_written_back():
+    folder = "/Game/Blueprint/Player/PlayerPlaneConfig_PL001"
+    asset = NativeAsset(*build_asset(folder_name=folder))
+    data = asset.to_document()
+    assert data["FolderName"] == folder
+    reid_document(data, "PL001", "PL0123")
+    new = reparse(asset, data)
+    assert new.folder_name == folder.replace("PL001", "PL0123")
+    assert new.names == data["NameMap"]
+    assert "/Game/Blueprint/Player/PlayerPlaneConfig_PL0123" in new.names
+    assert new.exports[0]["ObjectName"] == "PlayerPlaneConfig_PL0123"
+    assert extract_parameters(new.to_document())[0] == extract_parameters(asset.to_document())[0]
+    # Same-length IDs keep every offset
+    data = asset.to_document()
+    reid_document(data, "PL001", "PL777")
+    uasset, _ = asset.serialize(data)
+    assert len(uasset) == len(asset.uasset)
+    assert struct.unpack_from("<i", uasset, asset.fields["NameOffset"][0]) == (asset.get_field("NameOffset"),)
+
+
+def test_removed_name_is_rejected():
+    asset = NativeAsset(*build_asset())
+    data = asset.to_document()
+    data["NameMap"].pop()
+    with pytest.raises(NativeAssetError):
+        asset.serialize(data)
+
+
+def test_load_document_reads_natively_only_when_asked(tmp_path):
+    path = write_asset(str(tmp_path / "PlayerPlaneConfig_PL001.uasset"))
+    data, json_path, asset = load_document(path, native=True)
+    assert json_path is None and asset is not None
+    assert extract_parameters(data)[0]["IntThing"] == 42
+    with pytest.raises(RuntimeError, match="UAssetGUI"):
+        load_document(path)
@@ -0,0 +1,156 @@
+import pytest
+
+from ac7ca.cli import main
+from ac7ca.documents import extract_parameters, get_table_values, set_entry_value, uexp_path_for
+from ac7ca.native import NativeAsset
+from ac7ca.pak import (
+    PAK_COMPRESSION_NONE, PAK_COMPRESSION_ZLIB, PAK_VERSION, PakArchive, PakError, PakWriter
+)
+from synthetic_assets import ENUM_TYPE, build_asset, build_pak
+
+CONTENT_DIR = "Ace7Game/Content/Blueprint/Player/"
+
+
+def config_members(plane_ids=("PL001", "PL002", "PL003"), **options):
+    files = {}
+    for plane_id in plane_ids:
+        name = f"{CONTENT_DIR}PlayerPlaneConfig_{plane_id}.uasset"
+        files[name], files[uexp_path_for(name)] = build_asset(plane_id, **options)
+    files["Ace7Game/Content/Other/Texture.uasset"] = bytes(range(256)) * 8
+    return files
+
+
+def entry(data, name):
+    return next(e for e in get_table_values(data) if e["Name"] == name)
+
+
+@pytest.mark.parametrize("version, compression", [
+    (1, PAK_COMPRESSION_NONE), (2, PAK_COMPRESSION_NONE), (3, PAK_COMPRESSION_NONE),
+    (3, PAK_COMPRESSION_ZLIB), (4, PAK_COMPRESSION_NONE), (4, PAK_COMPRESSION_ZLIB)
+])
+def test_members_and_assets_read_back(tmp_path, version, compression):
+    files = config_members()
+    path = build_pak(str(tmp_path / "mod.pak"), files, version, compression)
+    with PakArchive(path) as pak:
+        assert pak.version == version
+        assert list(pak.entries) == list(files)
+        assert pak.find() == sorted(
+            name for name in files if "PlayerPlaneConfig" in name and name.endswith(".uasset")
+        )
+        for name, data in files.items():
+            assert pak.read(name) == data
+            assert pak.verify(name)
+        name = pak.find("*PL002")[0]
+        asset = pak.load_asset(name)
+    expected = NativeAsset(*build_asset("PL002"))
+    assert asset.serialize(asset.to_document()) == (files[name], files[uexp_path_for(name)])
+    assert extract_parameters(asset.to_document()) == extract_parameters(expected.to_document())
+
+
+def test_writer_output_matches_the_version_4_layout(tmp_path):
+    files = config_members()
+    for compression in (PAK_COMPRESSION_NONE, PAK_COMPRESSION_ZLIB):
+        written = tmp_path / f"written{compression}.pak"
+        with PakWriter(str(written), block_size=256) as writer:
+            for name, data in files.items():
+                writer.add(name, data, compression)
+        built = build_pak(str(tmp_path / f"built{compression}.pak"), files, PAK_VERSION, compression)
+        assert written.read_bytes() == open(built, "rb").read()
+
+
+@pytest.mark.parametrize("version, compression", [
+    (1, PAK_COMPRESSION_NONE), (3, PAK_COMPRESSION_ZLIB), (4, PAK_COMPRESSION_ZLIB)
+])
+def test_repack_shifts_the_members_after_a_replacement(tmp_path, version, compression):
+    files = config_members(curve_length=24)
+    path = build_pak(str(tmp_path / "mod.pak"), files, version, compression)
+    first = f"{CONTENT_DIR}PlayerPlaneConfig_PL001.uasset"
+    with PakArchive(path) as pak:
+        asset = pak.load_asset(first)
+        data = asset.to_document()
+        set_entry_value(data, entry(data, "DriftPostStallManeuverability"), "Immelmann")
+        set_entry_value(data, entry(data, "Param3"), "1234.5")
+        uasset, uexp = asset.serialize(data)
+        assert len(uasset) > len(files[first])
+        replacements = {first: uasset, uexp_path_for(first): uexp}
+        old_entries = pak.entries
+        starts = {name: pak.stored(name)[2] for name in files}
+        pak.repack(str(tmp_path / "out.pak"), replacements)
+    with PakArchive(str(tmp_path / "out.pak")) as new:
+        assert new.version == PAK_VERSION
+        assert list(new.entries) == list(files)
+        for name in files:
+            assert new.read(name) == replacements.get(name, files[name])
+            assert new.verify(name)
+            old, moved = old_entries[name], new.entries[name]
+            assert moved.compression == old.compression
+            if name in replacements:
+                continue
+            shift = new.stored(name)[2] - starts[name]
+            assert shift != 0
+            assert moved.blocks == [(start + shift, end + shift) for start, end in old.blocks]
+            if compression == PAK_COMPRESSION_ZLIB:
+                assert len(moved.blocks) > 1
+        edited = new.load_asset(first).to_document()
+    assert entry(edited, "DriftPostStallManeuverability")["Value"] == f"{ENUM_TYPE}::Immelmann"
+    assert extract_parameters(edited)[0]["Param3"] == 1234.5
+
+
+def test_repack_compresses_replacements_when_asked(tmp_path):
+    files = config_members()
+    path = build_pak(str(tmp_path / "mod.pak"), files)
+    name = f"{CONTENT_DIR}PlayerPlaneConfig_PL003.uexp"
+    with PakArchive(path) as pak:
+        pak.repack(str(tmp_path / "out.pak"), {name: files[name]}, PAK_COMPRESSION_ZLIB)
+    with PakArchive(str(tmp_path / "out.pak")) as new:
+        assert new.entries[name].compression == PAK_COMPRESSION_ZLIB
+        assert new.entries[name].blocks[0][0] == new.stored(name)[2]
+        assert all(new.read(n) == data for n, data in files.items())
+
+
+def test_encrypted_index_is_refused(tmp_path):
+    path = build_pak(str(tmp_path / "mod.pak"), config_members(), encrypted_index=True)
+    with pytest.raises(PakError, match="index is encrypted"):
+        PakArchive(path)
+
+
+def test_encrypted_members_are_refused(tmp_path):
+    files = config_members()
+    name = f"{CONTENT_DIR}PlayerPlaneConfig_PL002.uexp"
+    path = build_pak(str(tmp_path / "mod.pak"), files, encrypted=(name,))
+    with PakArchive(path) as pak:
+        assert name in pak.entries
+        with pytest.raises(PakError, match="encrypted"):
+            pak.read(name)
+        with pytest.raises(PakError, match="encrypted"):
+            pak.load_asset(name.replace(".uexp", ".uasset"))
+        assert pak.read(f"{CONTENT_DIR}PlayerPlaneConfig_PL001.uexp") == files[uexp_path_for(
+            f"{CONTENT_DIR}PlayerPlaneConfig_PL001.uasset")]
+
+
+def test_damaged_paks_are_refused(tmp_path):
+    path = tmp_path / "mod.pak"
+    build_pak(str(path), config_members())
+    raw = bytearray(path.read_bytes())
+    raw[-30] ^= 0xFF   # inside the index offset
+    damaged = tmp_path / "damaged.pak"
+    damaged.write_bytes(bytes(raw))
+    with pytest.raises(PakError):
+        PakArchive(str(damaged))
+    future = tmp_path / "future.pak"
+    build_pak(str(future), config_members(), version=PAK_VERSION + 4)
+    with pytest.raises(PakError, match="not supported"):
+        PakArchive(str(future))
+
+
+def test_pak_patch_writes_a_new_pak(tmp_path, capsys):
+    files = config_members()
+    path = build_pak(str(tmp_path / "mod.pak"), files, compression=PAK_COMPRESSION_ZLIB)
+    out = str(tmp_path / "patched.pak")
+    assert main(["pak", "patch", path, "--set", "Param3=7", "--out", out, "--workers", "1"]) == 0
+    assert "3/3 configs patched" in capsys.readouterr().out
+    with PakArchive(out) as pak:
+        for name in pak.find():
+            assert extract_parameters(pak.load_asset(name).to_document())[0]["Param3"] == 7
+        other = "Ace7Game/Content/Other/Texture.uasset"
+        assert pak.read(other) == files[other]
@@ -0,0 +1,86 @@
+import copy
+import os
+
+from ac7ca.cli import expand_id_range, main
+from ac7ca.documents import (
+    extract_parameters, read_json, reid_document, reid_target_path, restore_plane_id_refs, write_json
+)
+from synthetic_assets import build_document
+
+PACKAGE = "/Game/Blueprint/Player/PlayerPlaneConfig_"
+
+
+def test_reid_renames_the_asset_names():
+    data = build_document("PL001", folder_name=PACKAGE + "PL001")
+    parameters = extract_parameters(data)[0]
+    refs, mentions = reid_document(data, "PL001", "PL123")
+    assert data["FolderName"] == PACKAGE + "PL123"
+    assert data["Exports"][0]["ObjectName"] == "PlayerPlaneConfig_PL123"
+    assert PACKAGE + "PL123" in data["NameMap"] and "PlayerPlaneConfig_PL123" in data["NameMap"]
+    assert not any("PL001" in name for name in data["NameMap"])
+    assert {location for _, _, _, _, location in refs} >= {"FolderName", "Exports[0].ObjectName"}
+    assert extract_parameters(data)[0] == parameters
+    assert mentions == []
+
+
+def test_plane_id_is_matched_as_a_whole_token():
+    data = build_document("PL001")
+    data["NameMap"] += ["PL0010_Decal", "XPL001", "Cockpit_PL001", "PL001"]
+    reid_document(data, "PL001", "PL7")
+    assert data["NameMap"][-4:] == ["PL0010_Decal", "XPL001", "Cockpit_PL7", "PL7"]
+
+
+def test_only_names_carrying_the_id_are_rewritten():
+    data = build_document("PL001")
+    data["Imports"].append({
+        "ClassPackage": "/Script/CoreUObject", "ClassName": "Package", "OuterIndex": 0,
+        "ObjectName": PACKAGE + "PL001"
+    })
+    row = data["Exports"][0]["Table"]["Data"][0]["Value"]
+    row.append({"Name": "Plane_Ref", "Value": "PlayerPlaneConfig_PL001_2"})
+    row.append({"Name": "Comment", "Value": "tuned like PL001"})
+    refs, mentions = reid_document(data, "PL001", "PL123")
+    assert data["Imports"][-1]["ObjectName"] == PACKAGE + "PL123"
+    assert row[-2]["Value"] == "PlayerPlaneConfig_PL123_2"
+    assert row[-1]["Value"] == "tuned like PL001"
+    assert mentions == [(f"Exports[0].Table.Data[0].Value[{len(row) - 1}].Value", "tuned like PL001")]
+
+
+def test_restore_undoes_the_rewrite():
+    data = build_document("PL001", folder_name=PACKAGE + "PL001")
+    original = copy.deepcopy(data)
+    restore_plane_id_refs(reid_document(data, "PL001", "PL0042")[0])
+    assert data == original
+
+
+def test_id_ranges_and_target_paths():
+    assert expand_id_range("PL008-PL011=PL101") == {
+        "PL008": "PL101", "PL009": "PL102", "PL010": "PL103", "PL011": "PL104"
+    }
+    assert reid_target_path(os.path.join("mods", "PlayerPlaneConfig_PL001.uasset"), "PL9", "out") == \
+        os.path.join("out", "PlayerPlaneConfig_PL9.uasset")
+
+
+def test_reid_command_copies_configs_to_new_ids(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    mods = tmp_path / "mods"
+    mods.mkdir()
+    for plane_id in ("PL001", "PL002", "PL003"):
+        write_json(build_document(plane_id), str(mods / f"PlayerPlaneConfig_{plane_id}.json"))
+    before = sorted(os.listdir(mods))
+    assert main(["reid", str(mods), "--range", "PL001-PL002=PL101", "--dry-run", "--workers", "1"]) == 0
+    assert "Exports[0].ObjectName: PlayerPlaneConfig_PL001 → PlayerPlaneConfig_PL101" in capsys.readouterr().out
+    assert sorted(os.listdir(mods)) == before
+    data = read_json(str(mods / "PlayerPlaneConfig_PL003.json"))
+    data["Info"] = "Copied from PL003"
+    write_json(data, str(mods / "PlayerPlaneConfig_PL003.json"))
+    assert main(["reid", str(mods), "--map", "PL003=PL200", "--dry-run", "--workers", "1"]) == 0
+    assert "kept Info: Copied from PL003" in capsys.readouterr().out
+    assert main(["reid", str(mods), "--range", "PL001-PL002=PL101", "--workers", "1"]) == 0
+    assert "2/2 configs re-IDed" in capsys.readouterr().out
+    data = read_json(str(mods / "PlayerPlaneConfig_PL102.json"))
+    assert data["Exports"][0]["ObjectName"] == "PlayerPlaneConfig_PL102"
+    assert (mods / "PlayerPlaneConfig_PL002.json").exists()   # copied, not moved
+    # Existing targets are kept unless forced
+    assert main(["reid", str(mods), "--map", "PL003=PL101", "--workers", "1"]) == 1
+    assert "already exists" in capsys.readouterr().out
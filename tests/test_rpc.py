@@ -0,0 +1,93 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from ac7ca.documents import extract_parameters, json_loads, read_json, write_json
+from ac7ca.rpc import (
+    RPC_INVALID_PARAMS, RPC_UNAUTHORIZED, DocumentStore, RpcClient, RpcError, RpcHandler, RpcTcpServer,
+    rpc_encode
+)
+from synthetic_assets import FAKE_UASSETGUI, build_document
+
+
+def make_store(root):
+    options = {"uassetgui_path": FAKE_UASSETGUI, "engine_version": "VER_UE4_18", "native": True,
+               "timeout": None}
+    return DocumentStore(options, root=str(root))
+
+
+def test_save_to_a_uasset_leaves_the_opened_json_alone(tmp_path):
+    path = tmp_path / "PlayerPlaneConfig_PL001.json"
+    write_json(build_document(), str(path))
+    original = path.read_bytes()
+    store = make_store(tmp_path)
+    store.rpc_open(path.name)
+    store.rpc_set_parameters(path.name, values={"Param3": 7.5})
+    out = store.rpc_save(path.name, out="out.uasset")["path"]
+    assert out == os.path.join(store.root, "out.uasset")
+    assert extract_parameters(read_json(out))[0]["Param3"] == 7.5   # the fake UAssetGUI writes JSON
+    assert path.read_bytes() == original
+    summary = store.rpc_open(path.name)
+    assert summary["dirty"] and not summary["stale"] and summary["warm"]
+    store.rpc_save(path.name)
+    assert extract_parameters(read_json(str(path)))[0]["Param3"] == 7.5
+    assert sorted(os.listdir(tmp_path)) == ["PlayerPlaneConfig_PL001.json", "out.uasset", "out.uexp"]
+
+
+def test_paths_outside_the_root_are_refused(tmp_path):
+    root = tmp_path / "root"
+    (root / "mods").mkdir(parents=True)
+    outside = tmp_path / "PlayerPlaneConfig_PL001.json"
+    write_json(build_document(), str(outside))
+    (root / "mods" / "link.json").symlink_to(outside)
+    (root / "escape").symlink_to(tmp_path)
+    store = make_store(root)
+    assert store.resolve("mods/../mods/a.json") == os.path.join(store.root, "mods", "a.json")
+    for path in ("../PlayerPlaneConfig_PL001.json", "mods/../../PlayerPlaneConfig_PL001.json",
+                 str(outside), "mods/link.json", "escape/PlayerPlaneConfig_PL001.json", ""):
+        with pytest.raises(RpcError) as error:
+            store.rpc_open(path)
+        assert error.value.code == RPC_INVALID_PARAMS
+    write_json(build_document(), str(root / "PlayerPlaneConfig_PL001.json"))
+    store.rpc_open("PlayerPlaneConfig_PL001.json")
+    for params in ({"out": "../copy.json"}, {"out": "escape/copy.json"}):
+        with pytest.raises(RpcError):
+            store.rpc_save("PlayerPlaneConfig_PL001.json", **params)
+    with pytest.raises(RpcError):
+        store.rpc_reid("PlayerPlaneConfig_PL001.json", "PL002", out_dir="..")
+    assert sorted(os.listdir(tmp_path)) == ["PlayerPlaneConfig_PL001.json", "root"]
+
+
+def test_connections_must_send_the_token(tmp_path):
+    write_json(build_document(), str(tmp_path / "PlayerPlaneConfig_PL001.json"))
+    server = RpcTcpServer(("127.0.0.1", 0), RpcHandler)
+    server.store = make_store(tmp_path)
+    server.token = "secret"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        with socket.create_connection(("127.0.0.1", port)) as raw:
+            lines = raw.makefile("rwb")
+            for request in ({"method": "list", "id": 1}, {"method": "auth", "params": ["wrong"], "id": 2},
+                            {"method": "auth", "params": {"token": 7}, "id": 3},
+                            {"method": "open", "params": {"path": "PlayerPlaneConfig_PL001.json"}, "id": 4}):
+                lines.write(rpc_encode(dict(request, jsonrpc="2.0")))
+                lines.flush()
+                assert json_loads(lines.readline())["error"]["code"] == RPC_UNAUTHORIZED
+            assert not server.store.documents   # nothing reached the store
+            lines.write(rpc_encode({"jsonrpc": "2.0", "method": "list"}))   # notification: no reply
+            lines.write(rpc_encode({"jsonrpc": "2.0", "method": "auth", "params": ["secret"], "id": 5}))
+            lines.flush()
+            assert json_loads(lines.readline()) == {"jsonrpc": "2.0", "id": 5, "result": True}
+            lines.close()
+        with pytest.raises(RpcError) as error:
+            RpcClient(port=port, token="wrong")
+        assert error.value.message == "Wrong token"
+        client = RpcClient(port=port, token="secret")
+        assert client.call("open", path="PlayerPlaneConfig_PL001.json")["dirty"] is False
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from ac7ca.cli import main
+from ac7ca.documents import get_table_values, write_json
+from ac7ca.validation import ValidationCache, Validator
+from synthetic_assets import build_document
+from test_merge import entry
+
+
+def issues_of(data, rules=None):
+    validator = Validator() if rules is None else Validator(rules)
+    return [(issue["rule"], issue["severity"], issue["name"], issue["message"])
+            for issue in validator.run(data)]
+
+
+def without(data, *names):
+    values = get_table_values(data)
+    values[:] = [e for e in values if e["Name"] not in names]
+    return data
+
+
+def test_default_rules_pass_a_clean_config():
+    assert issues_of(build_document()) == []
+
+
+def test_entry_rules():
+    data = build_document()
+    entry(data, "Param3")["Value"] = "abc"
+    entry(data, "SpeedGraph0")["Value"] = -5.0
+    entry(data, "SpeedRot1")["Value"][0]["Value"]["Y"] = float("nan")
+    entry(data, "DriftPostStallManeuverability")["Value"] = "Cobra"
+    assert issues_of(data) == [
+        ("numeric", "error", "SpeedRot1", "Y nan is not a number"),
+        ("numeric", "error", "Param3", "'abc' is not a number"),
+        ("enum", "error", "DriftPostStallManeuverability",
+         "'Cobra' is not a EDriftPostStallManeuverability value"),
+        ("range", "error", "SpeedGraph0", "-5 is below 0"),
+    ]
+    data = build_document()
+    entry(data, "DriftPostStallManeuverability")["Value"] = "EDriftPostStallManeuverability::Hover"
+    assert issues_of(data, [{"rule": "enum"}]) == [
+        ("enum", "error", "DriftPostStallManeuverability",
+         "EDriftPostStallManeuverability::Hover is missing from the NameMap")
+    ]
+
+
+def test_range_rules_with_patterns_and_axes():
+    rules = [{"rule": "range", "severity": "warning", "match": "RotGravR", "axes": ["X"], "max": 0.25},
+             {"rule": "range", "match": "Param1?", "min": 3, "max": 4}]
+    assert issues_of(build_document(floats=20, curve_length=2), rules) == [
+        ("range", "warning", "RotGravR0", "X 0.5 is above 0.25"),
+        ("range", "warning", "RotGravR1", "X 0.5 is above 0.25"),
+        ("range", "error", "Param10", "2.5 is below 3"),
+        ("range", "error", "Param11", "2.75 is below 3"),
+        ("range", "error", "Param17", "4.25 is above 4"),
+        ("range", "error", "Param18", "4.5 is above 4"),
+        ("range", "error", "Param19", "4.75 is above 4"),
+    ]
+
+
+def test_curve_rules():
+    data = without(build_document(curve_length=4), "DiffNoseVelocityR2", "RotGravR3")
+    entry(data, "SpeedGraph2")["Value"] = entry(data, "SpeedGraph1")["Value"]
+    assert issues_of(data) == [
+        ("monotonic", "error", "SpeedGraph2", "100.5 does not increase on SpeedGraph1 (100.5)"),
+        ("complete", "error", "SpeedGraph2", "no DiffNoseVelocityR2 (reads as 0)"),
+        ("paired", "error", "SpeedRot3", "no RotGravR3 to pair with"),
+    ]
+    assert issues_of(data, [{"rule": "monotonic", "strict": False}]) == []
+    data = without(build_document(curve_length=4), "SpeedGraph3", "DiffNoseVelocityR3")
+    assert issues_of(data) == [
+        ("knots", "warning", "SpeedRot3", "no SpeedGraph3 knot"),
+        ("knots", "warning", "RotGravR3", "no SpeedGraph3 knot"),
+    ]
+
+
+def test_bad_rules_are_refused():
+    with pytest.raises(ValueError):
+        Validator([{"rule": "shiny"}])
+    with pytest.raises(ValueError):
+        Validator([{"rule": "numeric", "severity": "fatal"}])
+    with pytest.raises(ValueError):
+        Validator([{"rule": "monotonic", "curve": "speed_rot"}]).run(build_document())
+    assert Validator().digest != Validator([{"rule": "numeric"}]).digest
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache" / "validation.json")
+    cache = ValidationCache(path)
+    issues = [{"rule": "numeric", "severity": "error", "name": "Param3", "message": "'abc' is not a number"}]
+    cache.put("a.json", (10, 20), "digest-a", "rules", issues)
+    cache.save()
+    cache = ValidationCache(path)
+    assert cache.known_digest("a.json", (10, 20)) == "digest-a"
+    assert cache.known_digest("a.json", (11, 20)) is None
+    assert cache.get("digest-a", "rules") == issues and cache.hits == 1
+    assert cache.get("digest-a", "other rules") is None
+    cache.MAX_RESULTS = 2
+    cache.put("b.json", (1, 1), "digest-b", "rules", [])
+    cache.put("c.json", (1, 1), "digest-c", "rules", [])
+    cache.save()
+    assert list(ValidationCache(path).results) == ["digest-b:rules", "digest-c:rules"]
+
+
+def test_validate_command_caches_results(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    good = build_document("PL001")
+    bad = build_document("PL002")
+    entry(bad, "SpeedGraph0")["Value"] = -5.0
+    write_json(good, str(tmp_path / "PlayerPlaneConfig_PL001.json"))
+    write_json(bad, str(tmp_path / "PlayerPlaneConfig_PL002.json"))
+    assert main(["validate", str(tmp_path), "--workers", "1"]) == 1
+    out = capsys.readouterr().out
+    assert "error    SpeedGraph0: -5 is below 0" in out
+    assert "2 file(s) validated" in out and "(0 cached): 1 error(s)" in out
+    assert os.path.exists(tmp_path / ".ac7ca_cache" / "validation.json")
+    assert main(["validate", str(tmp_path), "--workers", "1"]) == 1
+    assert "(2 cached): 1 error(s)" in capsys.readouterr().out
+    # A touched file and a copy are found by their content hash
+    os.utime(tmp_path / "PlayerPlaneConfig_PL002.json", ns=(1, 1))
+    write_json(bad, str(tmp_path / "PlayerPlaneConfig_PL003.json"))
+    assert main(["validate", str(tmp_path), "--workers", "1"]) == 1
+    assert "(3 cached): 2 error(s)" in capsys.readouterr().out
+    assert main(["validate", str(tmp_path / "PlayerPlaneConfig_PL001.json"), "--no-cache"]) == 0
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Stand-in for UAssetGUI.exe so the .uasset code paths can run on Linux.
+#
+# The ".uasset" files it handles are plain UAssetAPI-style JSON documents:
+#
+#   fake_uassetgui.py tojson   <in.uasset> <out.json> <engine version>
+#   fake_uassetgui.py fromjson <in.json> <out.uasset>
+#
+# fromjson also writes a small .uexp next to the output so rename/copy
+# logic sees the usual file pair. Set FAKE_UASSETGUI_DELAY (seconds) to
+# simulate a slow or hung conversion. Point the editor or the batch CLI at it
+# with --uassetgui tools/fake_uassetgui.py (or "uassetgui_path" in
+# config.json).
+
+import json
+import os
+import sys
+import time
+
+
+def usage():
+    print(
+        "usage: fake_uassetgui.py tojson <in.uasset> <out.json> <version>\n"
+        "       fake_uassetgui.py fromjson <in.json> <out.uasset>",
+        file=sys.stderr
+    )
+    return 2
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if "Exports" not in data:
+        raise ValueError(f"{path} is not an asset document")
+    return data
+
+
+def dump(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv):
+    if len(argv) < 3:
+        return usage()
+    command = argv[0]
+    time.sleep(float(os.environ.get("FAKE_UASSETGUI_DELAY", "0")))
+    try:
+        if command == "tojson" and len(argv) == 4:
+            dump(load(argv[1]), argv[2])
+        elif command == "fromjson" and len(argv) == 3:
+            dump(load(argv[1]), argv[2])
+            with open(os.path.splitext(argv[2])[0] + ".uexp", "wb") as f:
+                f.write(b"\xc1\x83\x2a\x9e")
+        else:
+            return usage()
+    except (OSError, ValueError) as e:
+        print(f"fake_uassetgui: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))